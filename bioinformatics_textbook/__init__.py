@@ -1,2 +1,30 @@
-import bioinformatics_textbook.ch01
-import bioinformatics_textbook.ch02
+import importlib
+
+# submodules are imported on first access, e.g. bioinformatics_textbook.ch02, so that importing the package, as the
+# CLI does before parsing its arguments, does not import every chapter and its dependencies such as NumPy
+SUBMODULES = (
+    "batch",
+    "ch01",
+    "ch02",
+    "checkpoint",
+    "cli",
+    "commands",
+    "compression",
+    "dna",
+    "dna_collection",
+    "inout",
+    "kmer_trie",
+    "server",
+    "two_bit",
+)
+
+
+def __getattr__(name):
+    if name in SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(SUBMODULES))
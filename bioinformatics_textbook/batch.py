@@ -0,0 +1,180 @@
+"""batch.py
+
+A module for running many CLI jobs from a manifest in a pool of warm worker processes through the BatchRunner class
+"""
+
+import json
+import logging
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Iterable, Iterator, NamedTuple, TextIO
+
+from bioinformatics_textbook.cli import cli
+
+
+class BatchJob(NamedTuple):
+    """A CLI command to run on an input file, writing its solution to an output file"""
+
+    command: str
+    input: str
+    output: str
+    args: tuple = ()
+
+
+class BatchResult(NamedTuple):
+    """Outcome of a batch job. Status is 'ok' or 'failed', and message explains failures."""
+
+    job: BatchJob
+    status: str
+    seconds: float
+    message: str = ""
+
+
+def read_manifest(manifest_file: TextIO) -> list:
+    """Read the jobs of a manifest. Each line is either a JSON object with "command", "input", "output", and
+    optionally "args" (a list of extra command line arguments), or tab separated command, input, output, and extra
+    arguments. Blank lines and lines starting with # are skipped.
+
+    :param manifest_file: The manifest file
+    :type manifest_file: TextIO
+    :raises ValueError: If a line is not a valid job
+    :return: Jobs in order of the manifest
+    :rtype: list
+    """
+    jobs = []
+    for line_number, line in enumerate(manifest_file, start=1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+
+        try:
+            if line.startswith("{"):
+                fields = json.loads(line)
+                job = BatchJob(
+                    command=fields["command"],
+                    input=fields["input"],
+                    output=fields["output"],
+                    args=tuple(str(arg) for arg in fields.get("args", ())),
+                )
+            else:
+                command, input_path, output_path, *args = line.split("\t")
+                job = BatchJob(command=command, input=input_path, output=output_path, args=tuple(args))
+        except (KeyError, TypeError, ValueError) as error:
+            raise ValueError(f"Invalid job on line {line_number} of the manifest: {error}") from error
+
+        jobs.append(job)
+
+    return jobs
+
+
+class BatchRunner:
+    """Run batch jobs, optionally in a process pool.
+
+    Every worker process runs its jobs in-process through the CLI, and each command is imported the first time a
+    worker runs it, so later jobs only pay for parsing their arguments and solving, and not for starting Python and
+    importing the package. Each job is isolated, so a failing job is reported and the remaining jobs still run. If a
+    worker process dies, e.g. killed for running out of memory, the pool is recreated and the jobs it had not finished
+    are run again.
+    """
+
+    def __init__(self, num_workers: int = 1, logger: logging.Logger = logging.getLogger(__name__)) -> None:
+        self.num_workers = num_workers
+        self.logger = logger
+
+    def run(self, jobs: Iterable[BatchJob]) -> Iterator[BatchResult]:
+        """Run jobs
+
+        :param jobs: The jobs
+        :type jobs: Iterable[BatchJob]
+        :yield: Result of each job in order of the jobs, as soon as it and the jobs before it have finished
+        :rtype: Iterator[BatchResult]
+        """
+        if self.num_workers == 1:
+            for job in jobs:
+                yield self._log_result(run_job(job))
+            return
+
+        jobs = list(jobs)
+        executor = ProcessPoolExecutor(max_workers=self.num_workers)
+        try:
+            futures = [executor.submit(run_job, job) for job in jobs]
+            for i, job in enumerate(jobs):
+                try:
+                    result = futures[i].result()
+                except BrokenProcessPool:
+                    # any job that was running may have killed the worker, so the first of them is run again on its
+                    # own and fails if it breaks its pool again, while the others are run again in a new pool
+                    self.logger.warning("A worker process died. Restart the pool of worker processes.")
+                    executor.shutdown(cancel_futures=True)
+                    result = self._run_alone(job)
+                    executor = ProcessPoolExecutor(max_workers=self.num_workers)
+                    for j in range(i + 1, len(jobs)):
+                        if not futures[j].done() or futures[j].cancelled() or futures[j].exception() is not None:
+                            futures[j] = executor.submit(run_job, jobs[j])
+                yield self._log_result(result)
+        finally:
+            executor.shutdown()
+
+    def _run_alone(self, job: BatchJob) -> BatchResult:
+        """Run a job in a new worker process of its own
+
+        :param job: The job
+        :type job: BatchJob
+        :return: Result of the job, which failed if the worker process died
+        :rtype: BatchResult
+        """
+        start = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            try:
+                return executor.submit(run_job, job).result()
+            except BrokenProcessPool:
+                return BatchResult(
+                    job=job,
+                    status="failed",
+                    seconds=time.perf_counter() - start,
+                    message="worker process died while running the job",
+                )
+
+    def _log_result(self, result: BatchResult) -> BatchResult:
+        """Log the result of a job
+
+        :param result: Result of the job
+        :type result: BatchResult
+        :return: The same result
+        :rtype: BatchResult
+        """
+        if result.status == "ok":
+            self.logger.info("Job %s %s finished in %.3f s.", result.job.command, result.job.input, result.seconds)
+        else:
+            self.logger.warning("Job %s %s failed: %s", result.job.command, result.job.input, result.message)
+
+        return result
+
+
+def run_job(job: BatchJob) -> BatchResult:
+    """Run a job with the CLI in the current process
+
+    :param job: The job
+    :type job: BatchJob
+    :return: Result of the job
+    :rtype: BatchResult
+    """
+    start = time.perf_counter()
+    status, message = "ok", ""
+    try:
+        exit_code = cli.main(
+            args=["--output", job.output, job.command, *job.args, job.input],
+            prog_name="bioinformatics-textbook",
+            standalone_mode=False,
+        )
+        if isinstance(exit_code, int) and exit_code != 0:
+            status, message = "failed", f"exit code {exit_code}"
+    except SystemExit as error:
+        if error.code:
+            status, message = "failed", f"exit code {error.code}"
+    except Exception as error:
+        status = "failed"
+        message = error.format_message() if hasattr(error, "format_message") else f"{type(error).__name__}: {error}"
+
+    return BatchResult(job=job, status=status, seconds=time.perf_counter() - start, message=message)
@@ -1,12 +1,48 @@
-from bioinformatics_textbook.inout import RosalindSolution
+import importlib
+import logging
+from typing import Optional
+
+import bioinformatics_textbook
+from bioinformatics_textbook.inout import RosalindDataset, RosalindSolution
 from bioinformatics_textbook.dna import DNA
-from bioinformatics_textbook.ch01.pattern_occurrences import PatternOccurrences
-from bioinformatics_textbook.ch01.frequent_words import FrequentWords
-from bioinformatics_textbook.ch01.reverse_complement import Pattern
+
+# submodules are imported on first access, e.g. bioinformatics_textbook.ch01.frequent_words, so that a command only
+# imports the solvers of its own problem, and not e.g. the parallel and external k-mer counters for BA1C
+SUBMODULES = (
+    "ch01",
+    "external_counting",
+    "frequent_words",
+    "partitioned_counting",
+    "pattern_occurrences",
+    "reverse_complement",
+    "suffix_array",
+)
+
+
+def __getattr__(name):
+    if name in SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(SUBMODULES))
+
+
+def _frequent_words() -> "bioinformatics_textbook.ch01.frequent_words.FrequentWords":
+    """Create a FrequentWords object, importing its module on first use"""
+    return bioinformatics_textbook.ch01.frequent_words.FrequentWords()
+
+
+def _pattern_occurrences() -> "bioinformatics_textbook.ch01.pattern_occurrences.PatternOccurrences":
+    """Create a PatternOccurrences object, importing its module on first use"""
+    return bioinformatics_textbook.ch01.pattern_occurrences.PatternOccurrences()
+
 
 class BA1A(RosalindSolution):
     def _solve_problem(self) -> str:
-        kmer_count = PatternOccurrences().count_pattern(
+        kmer_count = _pattern_occurrences().count_pattern(
             text=self.dataset.text,
             pattern=self.dataset.pattern
         )
@@ -15,15 +51,68 @@ class BA1A(RosalindSolution):
 
 
 class BA1B(RosalindSolution):
+    def __init__(
+        self,
+        dataset: RosalindDataset,
+        num_workers: int = 1,
+        max_kmer_length: Optional[int] = None,
+        logger: logging.Logger = logging.getLogger(__name__),
+    ) -> None:
+        self.num_workers = num_workers
+        self.max_kmer_length = max_kmer_length
+        super().__init__(dataset=dataset, logger=logger)
+
     def _solve_problem(self) -> str:
-        most_freq_words = FrequentWords().find_most_freq_words(
+        if self.max_kmer_length is not None:
+            if self.max_kmer_length < self.dataset.kmer_length:
+                raise ValueError(
+                    f"Largest k-mer length {self.max_kmer_length} is smaller than the k-mer length "
+                    f"{self.dataset.kmer_length}."
+                )
+            most_freq_words = _frequent_words().find_most_freq_words_for_kmer_lengths(
+                text=self.dataset.text,
+                min_kmer_length=self.dataset.kmer_length,
+                max_kmer_length=self.max_kmer_length,
+            )
+
+            return "\n".join(
+                f"{kmer_length}: {self._format_rosalind_answer(kmers)}"
+                for kmer_length, kmers in most_freq_words.items()
+            )
+
+        if _can_count_two_bit(self.dataset):
+            if self.num_workers > 1:
+                self.logger.info("Count the k-mers of the 2-bit records with NumPy in one process.")
+            most_freq_words = _frequent_words().find_most_freq_words_in_two_bit(
+                two_bit=self.dataset.two_bit, kmer_length=self.dataset.kmer_length
+            )
+
+            return self._format_rosalind_answer(most_freq_words)
+
+        most_freq_words = _frequent_words().find_most_freq_words(
             text=self.dataset.text,
             kmer_length=self.dataset.kmer_length,
+            num_workers=self.num_workers,
         )
 
         return self._format_rosalind_answer(most_freq_words)
 
 
+class KmerSpectrum(RosalindSolution):
+    def _solve_problem(self) -> str:
+        if _can_count_two_bit(self.dataset):
+            spectrum = _frequent_words().compute_kmer_spectrum_of_two_bit(
+                two_bit=self.dataset.two_bit, kmer_length=self.dataset.kmer_length
+            )
+        else:
+            spectrum = _frequent_words().compute_kmer_spectrum(
+                text=self.dataset.text_bytes,
+                kmer_length=self.dataset.kmer_length,
+            )
+
+        return "\n".join(f"{count}\t{num_kmers}" for count, num_kmers in spectrum.items())
+
+
 class BA1C(RosalindSolution):
     def _solve_problem(self) -> str:
         rev_comp = DNA(self.dataset.pattern).reverse_complement()
@@ -33,15 +122,16 @@ class BA1C(RosalindSolution):
 
 class BA1D(RosalindSolution):
     def _solve_problem(self) -> str:
-        starting_positions = PatternOccurrences().find_starting_positions(pattern=self.dataset.pattern, genome=self.dataset.genome)
-        starting_positions = self._convert_iterable_to_list_of_str(starting_positions)
-        
+        starting_positions = _pattern_occurrences().generate_starting_positions(
+            pattern=self.dataset.pattern, genome=self.dataset.genome
+        )
+
         return self._format_rosalind_answer(starting_positions)
 
 
 class BA1I(RosalindSolution):
     def _solve_problem(self) -> str:
-        most_freq_words = FrequentWords().find_most_freq_words_with_mismatches(
+        most_freq_words = _frequent_words().find_most_freq_words_with_mismatches(
             text=self.dataset.text,
             kmer_length=self.dataset.kmer_length,
             num_allowed_mismatches=self.dataset.hamming_dist,
@@ -51,11 +141,21 @@ class BA1I(RosalindSolution):
 
 
 class BA1J(RosalindSolution):
+    def __init__(
+        self,
+        dataset: RosalindDataset,
+        max_table_size: Optional[int] = None,
+        logger: logging.Logger = logging.getLogger(__name__),
+    ) -> None:
+        self.max_table_size = max_table_size
+        super().__init__(dataset=dataset, logger=logger)
+
     def _solve_problem(self) -> str:
-        most_freq_words = FrequentWords().find_most_freq_words_with_mismatches_and_rc(
+        most_freq_words = _frequent_words().find_most_freq_words_with_mismatches_and_rc(
             text=self.dataset.text,
             kmer_length=self.dataset.kmer_length,
             num_allowed_mismatches=self.dataset.hamming_dist,
+            max_table_size=self.max_table_size,
         )
 
         return self._format_rosalind_answer(most_freq_words)
@@ -68,3 +168,11 @@ class BA1N(RosalindSolution):
         )
 
         return self._format_rosalind_answer(neighborhood, sep='\n')
+
+
+def _can_count_two_bit(dataset: RosalindDataset) -> bool:
+    """Can the k-mers of a dataset be counted from the 2-bit codes of its sequence file without decoding it to ASCII?"""
+    return (
+        getattr(dataset, "two_bit", None) is not None
+        and 1 <= dataset.kmer_length <= bioinformatics_textbook.two_bit.MAX_KMER_LENGTH
+    )
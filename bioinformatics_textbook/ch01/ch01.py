@@ -185,19 +185,15 @@ def construct_kmer_freq_table(text: str, k: int) -> dict:
     return freq_table
 
 
-def format_list_for_rosalind(list_to_format: list) -> str:
-    """Format a list as a string with elements separated by spaces as is commonly expected for solutions to problems for Rosalind.
+def format_list_for_rosalind(list_to_format: list) -> bioinformatics_textbook.inout.RosalindAnswer:
+    """Format a list with elements separated by spaces as is commonly expected for solutions to problems for Rosalind.
 
     :param list_to_format: List to format. If elements are not strings they will be converted.
     :type list_to_format: list
-    :return: String of list formatted for Rosalind.
-    :rtype: str
+    :return: List formatted for Rosalind as it is written.
+    :rtype: bioinformatics_textbook.inout.RosalindAnswer
     """
-    if not isinstance(list_to_format[0], str):
-        list_to_format = convert_iterable_to_list_of_str(list_to_format)
-    formatted_list = " ".join(list_to_format)
-
-    return formatted_list
+    return bioinformatics_textbook.inout.RosalindAnswer(list_to_format)
 
 
 def convert_iterable_to_list_of_str(iterable) -> list:
@@ -0,0 +1,159 @@
+import heapq
+import logging
+import tempfile
+from array import array
+from typing import BinaryIO, Iterator, Optional
+
+
+class ExternalKmerCounter:
+    """Count integer coded k-mers within a memory budget.
+
+    Counts are kept in an in-memory table until it holds more than `max_table_size` k-mers. The table is then spilled
+    to a temporary file as a run of (code, count) pairs sorted by code, and counting continues in an empty table.
+    Runs are combined at the end with a k-way merge.
+
+    Every run holds an open temporary file, so runs are merged as they are spilled: whenever `max_merge_fan_in` runs
+    of the same level exist, they are merged into a single run of the next level. The number of open runs thus grows
+    with the logarithm of the number of spills, and every count is rewritten once per level.
+    """
+
+    # number of (code, count) pairs read from a run at a time during the merge
+    _read_size = 1 << 16
+    # maximum number of runs merged into one intermediate run
+    max_merge_fan_in = 64
+
+    def __init__(
+        self,
+        max_table_size: int,
+        temp_dir: Optional[str] = None,
+        logger: logging.Logger = logging.getLogger(__name__),
+    ) -> None:
+        self.max_table_size = max_table_size
+        self.temp_dir = temp_dir
+        self.logger = logger
+
+        self.freq_table = {}
+        self._runs = []
+
+
+    def __enter__(self) -> "ExternalKmerCounter":
+        return self
+
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+    def add(self, number: int, count: int = 1) -> None:
+        """Add to the count of a k-mer
+
+        :param number: Integer code of the k-mer
+        :type number: int
+        :param count: Count to add, defaults to 1
+        :type count: int
+        """
+        self.freq_table[number] = self.freq_table.get(number, 0) + count
+        if len(self.freq_table) > self.max_table_size:
+            self._spill()
+
+
+    def merge_counts(self) -> Iterator[tuple]:
+        """Merge the spilled runs and the in-memory table into the total count of each k-mer
+
+        :yield: (code, count) pairs in increasing order of code
+        :rtype: Iterator[tuple]
+        """
+        runs = [self._read_run(run) for _, run in self._runs]
+        runs.append(iter(sorted(self.freq_table.items())))
+
+        yield from self._sum_counts(heapq.merge(*runs))
+
+
+    def close(self) -> None:
+        """Delete the temporary files of spilled runs"""
+        for _, run in self._runs:
+            run.close()
+        self._runs = []
+
+
+    def _spill(self) -> None:
+        """Write the in-memory table to a temporary file as a run sorted by code and empty the table"""
+        self.logger.info("Spill run %s of %s k-mer counts to disk.", len(self._runs) + 1, len(self.freq_table))
+
+        pairs = array("Q")
+        for number, count in sorted(self.freq_table.items()):
+            pairs.append(number)
+            pairs.append(count)
+
+        run = tempfile.TemporaryFile(dir=self.temp_dir)
+        pairs.tofile(run)
+        self._runs.append((0, run))
+
+        self.freq_table = {}
+
+        # runs are appended in decreasing order of level, so a full level is always at the end
+        while (
+            len(self._runs) >= self.max_merge_fan_in
+            and len({level for level, _ in self._runs[-self.max_merge_fan_in:]}) == 1
+        ):
+            self._merge_last_runs()
+
+
+    def _merge_last_runs(self) -> None:
+        """Merge the last `max_merge_fan_in` runs, which have the same level, into a run of the next level"""
+        level = self._runs[-1][0]
+        runs = [run for _, run in self._runs[-self.max_merge_fan_in:]]
+        del self._runs[-self.max_merge_fan_in:]
+        self.logger.info("Merge %s runs of level %s into one run.", len(runs), level)
+
+        merged_run = tempfile.TemporaryFile(dir=self.temp_dir)
+        pairs = array("Q")
+        for number, count in self._sum_counts(heapq.merge(*(self._read_run(run) for run in runs))):
+            pairs.append(number)
+            pairs.append(count)
+            if len(pairs) >= 2 * self._read_size:
+                pairs.tofile(merged_run)
+                pairs = array("Q")
+        pairs.tofile(merged_run)
+
+        for run in runs:
+            run.close()
+        self._runs.append((level + 1, merged_run))
+
+
+    def _sum_counts(self, pairs: Iterator[tuple]) -> Iterator[tuple]:
+        """Sum the counts of consecutive pairs of the same k-mer
+
+        :param pairs: (code, count) pairs in increasing order of code
+        :type pairs: Iterator[tuple]
+        :yield: (code, total count) pairs in increasing order of code
+        :rtype: Iterator[tuple]
+        """
+        current_number, current_count = None, 0
+        for number, count in pairs:
+            if number == current_number:
+                current_count += count
+                continue
+            if current_number is not None:
+                yield current_number, current_count
+            current_number, current_count = number, count
+
+        if current_number is not None:
+            yield current_number, current_count
+
+
+    def _read_run(self, run: BinaryIO) -> Iterator[tuple]:
+        """Read back a spilled run in blocks
+
+        :param run: Temporary file of a run
+        :type run: BinaryIO
+        :yield: (code, count) pairs in increasing order of code
+        :rtype: Iterator[tuple]
+        """
+        run.seek(0)
+        while True:
+            block = run.read(self._read_size * 2 * array("Q").itemsize)
+            if not block:
+                return
+            pairs = array("Q", block)
+            yield from zip(pairs[::2], pairs[1::2])
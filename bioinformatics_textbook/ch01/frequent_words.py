@@ -1,9 +1,20 @@
 import logging
+from array import array
+from collections import Counter
+from functools import cached_property
+from typing import TYPE_CHECKING, Optional, Union
 
 import click
 
-from bioinformatics_textbook.inout import RosalindDataset
+from bioinformatics_textbook.inout import RECORD_SEPARATOR, RosalindDataset
 from bioinformatics_textbook.dna import DNA
+from bioinformatics_textbook.kmer_trie import KmerTrie
+from bioinformatics_textbook.ch01.external_counting import ExternalKmerCounter
+from bioinformatics_textbook.ch01.partitioned_counting import PartitionedKmerCounter
+from bioinformatics_textbook.ch01.suffix_array import SuffixArray
+
+if TYPE_CHECKING:
+    from bioinformatics_textbook.two_bit import TwoBitFile
 
 
 class FrequentWords:
@@ -12,16 +23,25 @@ class FrequentWords:
         self.logger = logger
 
 
-    def find_most_freq_words(self, text: str, kmer_length: int) -> list:
+    def find_most_freq_words(self, text: str, kmer_length: int, num_workers: int = 1) -> list:
         """Find the most frequent k-mers in a string of text
 
         :param text: A string of text (typically a DNA string)
         :type text: str
         :param kmer_length: k-mer length
         :type kmer_length: int
+        :param num_workers: Number of worker processes to count k-mers with. Only DNA strings are counted in parallel, defaults to 1
+        :type num_workers: int
         :return: The most frequent k-mers in the text
         :rtype: list
         """
+        if num_workers > 1:
+            if self._is_dna(text):
+                return PartitionedKmerCounter(num_workers=num_workers, logger=self.logger).find_most_freq_words(
+                    text=text, kmer_length=kmer_length
+                )
+            self.logger.warning("Text is not a DNA string, so its k-mers are counted in one process.")
+
         freq_table = self._construct_kmer_freq_table(text=text, kmer_length=kmer_length)
         max_freq = self._find_max_val_of_dict(d=freq_table)
 
@@ -32,6 +52,103 @@ class FrequentWords:
         
         return most_freq_words
 
+
+    def compute_kmer_spectrum(self, text: Union[str, bytes, memoryview], kmer_length: int) -> dict:
+        """Compute the k-mer abundance spectrum of a text, i.e. how many distinct k-mers occur once, twice, three times, ...
+
+        k-mers of DNA strings are counted in one streaming pass over their integer codes. When there are at least as
+        many windows as possible k-mers, the counts are kept in a fixed size array indexed by code instead of a table.
+
+        :param text: A string of text (typically a DNA string) or ASCII bytes
+        :type text: Union[str, bytes, memoryview]
+        :param kmer_length: k-mer length
+        :type kmer_length: int
+        :return: Counts mapped to the number of distinct k-mers with that count, in increasing order of count
+        :rtype: dict
+        """
+        self.logger.info("Compute k-mer abundance spectrum.")
+
+        if not self._is_dna(text):
+            if not isinstance(text, str):
+                text = bytes(text)
+            freq_table = self._construct_kmer_freq_table(text=text, kmer_length=kmer_length)
+            return dict(sorted(Counter(freq_table.values()).items()))
+
+        kmer_numbers = DNA.generate_kmer_numbers(seq=text, kmer_length=kmer_length)
+        if 4 ** kmer_length <= self._compute_number_sliding_windows(text=text, kmer_length=kmer_length):
+            counts = array("L", bytes(array("L").itemsize * 4 ** kmer_length))
+            for number in kmer_numbers:
+                counts[number] += 1
+            spectrum = Counter(counts)
+            spectrum.pop(0, None)
+        else:
+            spectrum = Counter(Counter(kmer_numbers).values())
+
+        return dict(sorted(spectrum.items()))
+
+
+    def find_most_freq_words_in_two_bit(
+        self, two_bit: "TwoBitFile", kmer_length: int
+    ) -> list:
+        """Find the most frequent k-mers in the records of a 2-bit file, counted by their integer codes without decoding
+        the records to ASCII
+
+        :param two_bit: The 2-bit file
+        :type two_bit: TwoBitFile
+        :param kmer_length: k-mer length, at most MAX_KMER_LENGTH of the 2-bit module
+        :type kmer_length: int
+        :return: The most frequent k-mers in lexicographic order
+        :rtype: list
+        """
+        numbers, counts = two_bit.count_kmers(kmer_length)
+        if not len(counts):
+            return []
+
+        return [DNA.number_to_pattern(number, kmer_length) for number in numbers[counts == counts.max()].tolist()]
+
+    def compute_kmer_spectrum_of_two_bit(
+        self, two_bit: "TwoBitFile", kmer_length: int
+    ) -> dict:
+        """Compute the k-mer abundance spectrum of the records of a 2-bit file, counted by their integer codes without
+        decoding the records to ASCII
+
+        :param two_bit: The 2-bit file
+        :type two_bit: TwoBitFile
+        :param kmer_length: k-mer length, at most MAX_KMER_LENGTH of the 2-bit module
+        :type kmer_length: int
+        :return: Counts mapped to the number of distinct k-mers with that count, in increasing order of count
+        :rtype: dict
+        """
+        self.logger.info("Compute k-mer abundance spectrum of a 2-bit file.")
+
+        _, counts = two_bit.count_kmers(kmer_length)
+
+        return dict(sorted(Counter(counts.tolist()).items()))
+
+    def find_most_freq_words_for_kmer_lengths(
+        self, text: str, min_kmer_length: int, max_kmer_length: int, histogram: bool = False
+    ) -> dict:
+        """Find the most frequent k-mers for a range of k-mer lengths from a single suffix array of the text
+
+        :param text: A string of text (typically a DNA string)
+        :type text: str
+        :param min_kmer_length: Smallest k-mer length
+        :type min_kmer_length: int
+        :param max_kmer_length: Largest k-mer length
+        :type max_kmer_length: int
+        :param histogram: Also report how many distinct k-mers occur each number of times, defaults to False
+        :type histogram: bool
+        :return: k-mer lengths mapped to their most frequent k-mers in lexicographic order (and count histograms if requested)
+        :rtype: dict
+        """
+        self.logger.info("Find most frequent words for k-mer lengths %s to %s.", min_kmer_length, max_kmer_length)
+
+        return SuffixArray(text=text, separator=RECORD_SEPARATOR, logger=self.logger).find_most_freq_words(
+            min_kmer_length=min_kmer_length,
+            max_kmer_length=max_kmer_length,
+            histogram=histogram,
+        )
+
     
     def find_most_freq_words_with_mismatches(self, text: str, kmer_length: int, num_allowed_mismatches: int) -> list:
         """Find the most frequent k-mers with up to a number of allowed mismatches in a string of text
@@ -47,65 +164,122 @@ class FrequentWords:
         """
         self.logger.info("Find most frequent words with mismatches.")
 
-        # construct frequency table of k-mers with mismatches
-        freq_table = {}
-        for i in range(self._compute_number_sliding_windows(text=text, kmer_length=kmer_length)):
-            kmer = DNA(text[i: i+kmer_length])
-            neighborhood = kmer.generate_d_neighborhood(num_allowed_mismatches=num_allowed_mismatches)
-            for neighbor in neighborhood:
-                # if a k-mer is not present in frequency table, add it and assign a value of 1,
-                # otherwise, increment the count
-                freq_table[neighbor] = freq_table.get(neighbor, 0) + 1
-        
-        # select most frequent words
-        most_freq_words = []
-        max_freq = self._find_max_val_of_dict(d=freq_table)
-        for kmer in freq_table.keys():
-            if freq_table[kmer] == max_freq:
-                most_freq_words.append(kmer)
+        # the neighborhoods of all windows come from one walk over a trie of the distinct windows
+        trie = KmerTrie.from_sequences([text], kmer_length=kmer_length, logger=self.logger)
 
-        return most_freq_words
+        return self._find_most_freq_neighbors(
+            trie=trie, kmer_length=kmer_length, num_allowed_mismatches=num_allowed_mismatches
+        )
     
 
-    def find_most_freq_words_with_mismatches_and_rc(self, text: str, kmer_length: int, num_allowed_mismatches: int) -> list:
+    def find_most_freq_words_with_mismatches_and_rc(
+        self, text: str, kmer_length: int, num_allowed_mismatches: int, max_table_size: Optional[int] = None
+    ) -> list:
+        """Find the most frequent k-mers with up to a number of allowed mismatches and their reverse complements in a string of text
+
+        :param text: A string of text (typically a DNA string)
+        :type text: str
+        :param kmer_length: k-mer length
+        :type kmer_length: int
+        :param num_allowed_mismatches: The maximum Hamming distance (the number of allowed mismatches)
+        :type num_allowed_mismatches: int
+        :param max_table_size: Maximum number of k-mers to hold in memory. If given, counts beyond it are spilled to
+            temporary files and merged at the end, and k-mers are returned in lexicographic order, defaults to None
+        :type max_table_size: Optional[int]
+        :return: The most frequent k-mers in the text with at most the allowed number of mismatches
+        :rtype: list
+        """
         self.logger.info("Find most frequent words with mismatches and reverse complements.")
 
-        # construct frequency table of k-mers with mismatches and reverse complements
-        freq_table = {}
-        for i in range(self._compute_number_sliding_windows(text=text, kmer_length=kmer_length)):
-            kmer = DNA(text[i: i+kmer_length])
-            neighborhood = kmer.generate_d_neighborhood(num_allowed_mismatches=num_allowed_mismatches)
-            for neighbor in neighborhood:
-                freq_table[neighbor] = freq_table.get(neighbor, 0) + 1
-                rc = DNA(neighbor).reverse_complement()
-                freq_table[rc] = freq_table.get(rc, 0) + 1
-
-        # compute most frequent k-mers with reverse compliments
-        most_freq_words = []
-        max_freq = self._find_max_val_of_dict(d=freq_table)
-        for kmer in freq_table.keys():
-            if freq_table[kmer] == max_freq:
-                most_freq_words.append(kmer)
+        if max_table_size is not None:
+            return self._find_most_freq_words_with_mismatches_and_rc_external(
+                text=text,
+                kmer_length=kmer_length,
+                num_allowed_mismatches=num_allowed_mismatches,
+                max_table_size=max_table_size,
+            )
 
-        return most_freq_words
+        # a neighbor of a window's reverse complement is the reverse complement of a neighbor of the window, so
+        # inserting the windows of the reverse complement of the text counts both at once
+        trie = KmerTrie.from_sequences(
+            [text, DNA(text).reverse_complement()], kmer_length=kmer_length, logger=self.logger
+        )
 
-    def _construct_kmer_freq_table(self, text: str, kmer_length: int) -> dict:
-        """Construct a frequency table of how many times all k-mers appear in a text
+        return self._find_most_freq_neighbors(
+            trie=trie, kmer_length=kmer_length, num_allowed_mismatches=num_allowed_mismatches
+        )
 
-        :param text: A string of text (typically a DNA string)
-        :type text: str
+
+    def _find_most_freq_words_with_mismatches_and_rc_external(
+        self, text: str, kmer_length: int, num_allowed_mismatches: int, max_table_size: int
+    ) -> list:
+        """Find the most frequent k-mers with mismatches and reverse complements, counting integer coded k-mers with
+        at most `max_table_size` of them held in memory
+
+        :return: The most frequent k-mers in lexicographic order
+        :rtype: list
+        """
+        trie = KmerTrie.from_sequences([text], kmer_length=kmer_length, logger=self.logger)
+        with ExternalKmerCounter(max_table_size=max_table_size, logger=self.logger) as counter:
+            for number, count in trie.generate_neighborhood_counts(num_allowed_mismatches=num_allowed_mismatches):
+                counter.add(number, count)
+                counter.add(DNA.reverse_complement_number(number, kmer_length), count)
+
+            max_freq = 0
+            most_freq_numbers = []
+            for number, count in counter.merge_counts():
+                if count > max_freq:
+                    max_freq = count
+                    most_freq_numbers = [number]
+                elif count == max_freq:
+                    most_freq_numbers.append(number)
+
+        return [DNA.number_to_pattern(number, kmer_length) for number in most_freq_numbers]
+
+    def _find_most_freq_neighbors(self, trie: KmerTrie, kmer_length: int, num_allowed_mismatches: int) -> list:
+        """Find the k-mers within the allowed number of mismatches of the most windows of a trie
+
+        :param trie: Trie of the windows of a text
+        :type trie: KmerTrie
+        :param kmer_length: k-mer length
+        :type kmer_length: int
+        :param num_allowed_mismatches: The maximum Hamming distance (the number of allowed mismatches)
+        :type num_allowed_mismatches: int
+        :return: The most frequent k-mers in lexicographic order
+        :rtype: list
+        """
+        max_freq = 0
+        most_freq_numbers = []
+        for number, count in trie.generate_neighborhood_counts(num_allowed_mismatches=num_allowed_mismatches):
+            if count > max_freq:
+                max_freq = count
+                most_freq_numbers = [number]
+            elif count == max_freq:
+                most_freq_numbers.append(number)
+
+        return [DNA.number_to_pattern(number, kmer_length) for number in most_freq_numbers]
+
+    def _construct_kmer_freq_table(self, text: Union[str, bytes], kmer_length: int) -> dict:
+        """Construct a frequency table of how many times all k-mers appear in a text. Windows that contain the
+        RECORD_SEPARATOR between the records of a sequence file are not counted.
+
+        :param text: A string of text (typically a DNA string) or ASCII bytes
+        :type text: Union[str, bytes]
         :param k: k-mer length
         :type k: int
         :return: Frequency table of k-mers and their counts
         :rtype: dict
         """
+        separator = RECORD_SEPARATOR if isinstance(text, str) else RECORD_SEPARATOR.encode()
+
         freq_table = {}
-        # slide windows of length k down the text string
-        for i in range(self._compute_number_sliding_windows(text, kmer_length)):
-            pattern = text[i: i + kmer_length]
-            # if a k-mer is not present in frequency table, add it and assign a value of 1,
-            # otherwise, increment the count
-            freq_table[pattern] = freq_table.get(pattern, 0) + 1
+        for record in text.split(separator):
+            # slide windows of length k down the text string
+            for i in range(self._compute_number_sliding_windows(record, kmer_length)):
+                pattern = record[i: i + kmer_length]
+                # if a k-mer is not present in frequency table, add it and assign a value of 1,
+                # otherwise, increment the count
+                freq_table[pattern] = freq_table.get(pattern, 0) + 1
 
         return freq_table
 
@@ -145,6 +319,22 @@ class FrequentWords:
         return max_val
     
 
+    def _is_dna(self, text: Union[str, bytes, memoryview]) -> bool:
+        """Check whether a string of text only contains the nucleotides A, C, G, and T, and the RECORD_SEPARATOR
+        between the records of a sequence file, whose windows the integer code counters skip. Texts of datasets never
+        contain the separator.
+
+        :param text: A string of text or ASCII bytes
+        :type text: Union[str, bytes, memoryview]
+        :return: Whether the text is a DNA string
+        :rtype: bool
+        """
+        if not isinstance(text, str):
+            return not bytes(text).translate(None, b"ACGT" + RECORD_SEPARATOR.encode())
+
+        return not set(text).difference("ACGT" + RECORD_SEPARATOR)
+
+
     def _compute_number_sliding_windows(self, text: str, kmer_length: int) -> int:
         """Convenience method to compute the number of sliding windows down a string of text. The return value will most commonly be the input of a range constructor.
 
@@ -158,6 +348,66 @@ class FrequentWords:
         return len(text) - kmer_length + 1
 
 
+class FrequentWordsTracker:
+    """Track the most frequent k-mers of a sequence that grows by appended chunks.
+
+    Counts are kept up to date on every append, along with the k-mers of each count, so the current most frequent
+    k-mers are available at any time without recounting the sequence.
+    """
+
+    def __init__(self, kmer_length: int, logger: logging.Logger = logging.getLogger(__name__)) -> None:
+        self.kmer_length = kmer_length
+        self.logger = logger
+
+        self.freq_table = {}
+        self.max_freq = 0
+        # k-mers grouped by count; dicts are used as insertion ordered sets
+        self._kmers_by_freq = {}
+        # the last k - 1 characters of the sequence, which start k-mers completed by the next chunk
+        self._boundary = ""
+
+
+    def append(self, chunk: str) -> None:
+        """Append a chunk of sequence and count the k-mers it completes
+
+        :param chunk: The next chunk of the sequence
+        :type chunk: str
+        """
+        text = self._boundary + chunk
+        for i in range(len(text) - self.kmer_length + 1):
+            self._increment(text[i: i + self.kmer_length])
+
+        self._boundary = text[max(len(text) - self.kmer_length + 1, 0):] if self.kmer_length > 1 else ""
+
+
+    def find_most_freq_words(self) -> list:
+        """Find the most frequent k-mers of the sequence appended so far
+
+        :return: The most frequent k-mers in the order in which they reached the maximum count
+        :rtype: list
+        """
+        return list(self._kmers_by_freq.get(self.max_freq, {}))
+
+
+    def _increment(self, kmer: str) -> None:
+        """Increment the count of a k-mer and move it to the group of its new count
+
+        :param kmer: k-mer
+        :type kmer: str
+        """
+        freq = self.freq_table.get(kmer, 0)
+        if freq:
+            del self._kmers_by_freq[freq][kmer]
+            if not self._kmers_by_freq[freq]:
+                del self._kmers_by_freq[freq]
+
+        freq += 1
+        self.freq_table[kmer] = freq
+        self._kmers_by_freq.setdefault(freq, {})[kmer] = None
+        if freq > self.max_freq:
+            self.max_freq = freq
+
+
 class PatternHammingDist(RosalindDataset):
 
     def __init__(self, input_file: click.File, logger: logging.Logger = logging.getLogger(__name__)) -> None:
@@ -165,17 +415,21 @@ class PatternHammingDist(RosalindDataset):
 
         self.logger.info("Initialize object with pattern and max allowed Hamming distance")
 
-        self.pattern = self._read_first_line()
-        self.hamming_dist = int(self._read_last_line())
+    @cached_property
+    def pattern(self) -> str:
+        """Pattern (k-mer)"""
+        pattern = self._read_first_line()
+        self.logger.info("Pattern: %s", pattern)
 
-        self._log_init()
+        return pattern
 
+    @cached_property
+    def hamming_dist(self) -> int:
+        """Max allowed Hamming distance"""
+        hamming_dist = int(self._read_last_line())
+        self.logger.info("Max allowed Hamming distance: %s", hamming_dist)
 
-    def _log_init(self) -> None:
-        """Log attributes created during initializtion
-        """
-        self.logger.info("Pattern: %s", self.pattern)
-        self.logger.info("Max allowed Hamming distance: %s", self.hamming_dist)
+        return hamming_dist
 
 
 class TextKmerLengthHammingDist(RosalindDataset):
@@ -185,37 +439,85 @@ class TextKmerLengthHammingDist(RosalindDataset):
 
         self.logger.info("Initialize object with a DNA string, k-mer length, and max allowed Hamming distance.")
 
-        self.text = self._read_first_line()
-        k_hamming = self._read_last_line()
-        self.kmer_length = int(k_hamming.split(" ")[0])
-        self.hamming_dist = int(k_hamming.split(" ")[1])
+    @cached_property
+    def text(self) -> str:
+        """DNA string"""
+        text = self._decode_bytes(self.text_bytes)
+        self.logger.info("Text: %s+...", text[:10])
 
-        self._log_init()
+        return text
 
+    @cached_property
+    def text_bytes(self) -> memoryview:
+        """DNA string as ASCII bytes"""
+        return self._read_first_line_bytes()
 
-    def _log_init(self) -> None:
-        """Log attributes created during initializtion
-        """
-        self.logger.info("Text: %s+...", self.text[:10])
-        self.logger.info("k-mer length: %s", self.kmer_length)
-        self.logger.info("Max allowed Hamming distance: %s", self.hamming_dist)
+    @cached_property
+    def kmer_length(self) -> int:
+        """k-mer length"""
+        kmer_length = int(self._read_last_line().split(" ")[0])
+        self.logger.info("k-mer length: %s", kmer_length)
+
+        return kmer_length
+
+    @cached_property
+    def hamming_dist(self) -> int:
+        """Max allowed Hamming distance"""
+        hamming_dist = int(self._read_last_line().split(" ")[1])
+        self.logger.info("Max allowed Hamming distance: %s", hamming_dist)
+
+        return hamming_dist
 
 
 class TextKmerLength(RosalindDataset):
+    """Read and represent a Rosalind dataset that contains a DNA string and a k-mer length on the last line. If a
+    FASTA, FASTQ, or 2-bit sequence file is given, the dataset only contains the k-mer length and the DNA string is the
+    records of the sequence file joined by RECORD_SEPARATOR.
+    """
     
-    def __init__(self, input_file: click.File, logger: logging.Logger = logging.getLogger(__name__)):
+    def __init__(
+        self,
+        input_file: click.File,
+        sequence_file: Optional[click.File] = None,
+        logger: logging.Logger = logging.getLogger(__name__),
+    ):
         super().__init__(input_file=input_file, logger=logger)
 
         self.logger.info("Initialize object with a DNA string and k-mer length.")
 
-        self.text = self._read_not_last_line()
-        self.kmer_length = int(self._read_last_line())
+        self.sequence_file = sequence_file
 
-        self._log_init()
-    
+    @cached_property
+    def text(self) -> str:
+        """DNA string"""
+        text = self._decode_bytes(self.text_bytes)
+        self.logger.info("Text: %s+...", text[:10])
 
-    def _log_init(self) -> None:
-        """Log attributes created during initializtion
-        """
-        self.logger.info("Text: %s+...", self.text[:10])
-        self.logger.info("k-mer length: %s", self.kmer_length)
+        return text
+
+    @cached_property
+    def text_bytes(self) -> Union[bytes, memoryview]:
+        """DNA string as ASCII bytes"""
+        if self.sequence_file is None:
+            return self._read_not_last_line_bytes()
+
+        return RECORD_SEPARATOR.encode().join(self._read_sequence_file_bytes(self.sequence_file))
+
+    @cached_property
+    def two_bit(self) -> Optional["TwoBitFile"]:
+        """Records of the sequence file if it is a 2-bit file, else None"""
+        if self.sequence_file is None:
+            return None
+
+        return self._read_two_bit_file(self.sequence_file)
+
+    @cached_property
+    def kmer_length(self) -> int:
+        """k-mer length"""
+        if self.sequence_file is None:
+            kmer_length = int(self._read_last_line())
+        else:
+            kmer_length = int(self._read_first_line())
+        self.logger.info("k-mer length: %s", kmer_length)
+
+        return kmer_length
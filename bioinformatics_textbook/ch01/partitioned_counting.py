@@ -0,0 +1,225 @@
+import logging
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Callable
+
+from bioinformatics_textbook.dna import DNA
+
+# largest k-mer length whose integer codes fit in the unsigned 64-bit arrays sent between processes
+MAX_ARRAY_KMER_LENGTH = 32
+
+
+class PartitionedKmerCounter:
+    """Count k-mers across worker processes.
+
+    The text is held once in shared memory and split into one slice per worker. A slice holds the windows starting in
+    an equal share of the positions of the text plus the k - 1 bases after them, so every window is in exactly one
+    slice, and each worker encodes only its own slice. Each worker then splits the counts of its slice into disjoint
+    partitions by k-mer prefix, and the partitions of all slices are summed in parallel, one partition per worker.
+    """
+
+    def __init__(self, num_workers: int, logger: logging.Logger = logging.getLogger(__name__)) -> None:
+        self.num_workers = num_workers
+        self.logger = logger
+
+
+    def find_most_freq_words(self, text: str, kmer_length: int) -> list:
+        """Find the most frequent k-mers in a string of text
+
+        :param text: A DNA string
+        :type text: str
+        :param kmer_length: k-mer length
+        :type kmer_length: int
+        :return: The most frequent k-mers in order of first appearance in the text
+        :rtype: list
+        """
+        self.logger.info("Find most frequent words with %s worker processes.", self.num_workers)
+
+        partition_maxima = self._map_workers(
+            text=text, kmer_length=kmer_length, reduce_partition=_find_partition_maxima
+        )
+
+        # reduce over the per-partition maxima
+        max_freq = max((max_count for max_count, _ in partition_maxima), default=0)
+        most_freq_kmers = sorted(
+            kmer
+            for max_count, kmers in partition_maxima
+            if max_count == max_freq
+            for kmer in kmers
+        )
+
+        return [str(DNA.number_to_pattern(number, kmer_length)) for _, number in most_freq_kmers]
+
+
+    def count_kmers(self, text: str, kmer_length: int) -> dict:
+        """Construct a frequency table of how many times all k-mers appear in a text
+
+        :param text: A DNA string
+        :type text: str
+        :param kmer_length: k-mer length
+        :type kmer_length: int
+        :return: Frequency table of k-mers and their counts in order of first appearance in the text
+        :rtype: dict
+        """
+        self.logger.info("Count k-mers with %s worker processes.", self.num_workers)
+
+        # partitions are disjoint, so their tables are combined without summing any counts
+        freq_table = {}
+        for partition_table in self._map_workers(text=text, kmer_length=kmer_length, reduce_partition=_merge_partition):
+            freq_table.update(partition_table)
+
+        first_appearances = sorted((first_position, number) for number, (_, first_position) in freq_table.items())
+
+        return {
+            str(DNA.number_to_pattern(number, kmer_length)): freq_table[number][0]
+            for _, number in first_appearances
+        }
+
+
+    def _map_workers(self, text: str, kmer_length: int, reduce_partition: Callable) -> list:
+        """Count the k-mers of each slice of the text in a worker process over a shared memory copy of the text, then
+        reduce each partition of the counts of all slices in a worker process
+
+        :param text: A DNA string
+        :type text: str
+        :param kmer_length: k-mer length
+        :type kmer_length: int
+        :param reduce_partition: Module level function that reduces the counts of a partition in every slice
+        :type reduce_partition: Callable
+        :return: The result of each partition
+        :rtype: list
+        """
+        encoded_text = text.encode()
+        prefix_length = self._compute_prefix_length(kmer_length=kmer_length)
+        num_windows = max(len(encoded_text) - kmer_length + 1, 0)
+        window_starts = [worker * num_windows // self.num_workers for worker in range(self.num_workers + 1)]
+
+        shared_text = shared_memory.SharedMemory(create=True, size=max(len(encoded_text), 1))
+        try:
+            shared_text.buf[:len(encoded_text)] = encoded_text
+            with ProcessPoolExecutor(max_workers=self.num_workers) as executor:
+                # consecutive slices overlap by k - 1 bases, the tail of the last window of the earlier slice
+                futures = [
+                    executor.submit(
+                        _count_slice,
+                        shared_text.name,
+                        start,
+                        stop + kmer_length - 1,
+                        kmer_length,
+                        prefix_length,
+                        self.num_workers,
+                    )
+                    for start, stop in zip(window_starts, window_starts[1:])
+                    if start < stop
+                ]
+                slice_partitions = [future.result() for future in futures]
+
+                futures = [
+                    executor.submit(reduce_partition, [partitions[partition] for partitions in slice_partitions])
+                    for partition in range(self.num_workers)
+                ]
+                results = [future.result() for future in futures]
+        finally:
+            shared_text.close()
+            shared_text.unlink()
+
+        return results
+
+
+    def _compute_prefix_length(self, kmer_length: int) -> int:
+        """Compute the length of the k-mer prefix used to assign k-mers to partitions. Enough prefixes are used to
+        spread them evenly across workers.
+
+        :param kmer_length: k-mer length
+        :type kmer_length: int
+        :return: Prefix length
+        :rtype: int
+        """
+        prefix_length = 1
+        while 4 ** prefix_length < 16 * self.num_workers and prefix_length < kmer_length:
+            prefix_length += 1
+
+        return min(prefix_length, kmer_length)
+
+
+def _count_slice(
+    shared_text_name: str, start: int, stop: int, kmer_length: int, prefix_length: int, num_partitions: int
+) -> list:
+    """Count the k-mers of a slice of a text and split the counts into partitions by k-mer prefix
+
+    :param shared_text_name: Name of the shared memory block holding the text as ASCII bytes
+    :type shared_text_name: str
+    :param start: Start of the slice in the text
+    :type start: int
+    :param stop: End of the slice in the text
+    :type stop: int
+    :param kmer_length: k-mer length
+    :type kmer_length: int
+    :param prefix_length: Length of the k-mer prefix that determines its partition
+    :type prefix_length: int
+    :param num_partitions: Number of partitions
+    :type num_partitions: int
+    :return: (integer codes, counts, first positions in the text) of the k-mers of each partition
+    :rtype: list
+    """
+    freq_table = {}
+    shared_text = shared_memory.SharedMemory(name=shared_text_name)
+    text = shared_text.buf[start:stop]
+    try:
+        for position, number in enumerate(DNA.generate_kmer_numbers(text, kmer_length), start=start):
+            entry = freq_table.get(number)
+            if entry is None:
+                freq_table[number] = [1, position]
+            else:
+                entry[0] += 1
+    finally:
+        text.release()
+        shared_text.close()
+
+    # arrays are sent to other processes much faster than tables, but only hold codes of up to 64 bits
+    new_numbers = (lambda: array("Q")) if kmer_length <= MAX_ARRAY_KMER_LENGTH else list
+    partitions = [(new_numbers(), array("Q"), array("Q")) for _ in range(num_partitions)]
+    shift = 2 * (kmer_length - prefix_length)
+    for number, (count, first_position) in freq_table.items():
+        numbers, counts, first_positions = partitions[(number >> shift) % num_partitions]
+        numbers.append(number)
+        counts.append(count)
+        first_positions.append(first_position)
+
+    return partitions
+
+
+def _merge_partition(slice_partitions: list) -> dict:
+    """Sum the counts of a partition of k-mers over the slices of a text
+
+    :param slice_partitions: (integer codes, counts, first positions) of the partition in each slice in order of the text
+    :type slice_partitions: list
+    :return: Integer codes of k-mers mapped to their count and first position in the text
+    :rtype: dict
+    """
+    freq_table = {}
+    for numbers, counts, first_positions in slice_partitions:
+        for number, count, first_position in zip(numbers, counts, first_positions):
+            entry = freq_table.get(number)
+            if entry is None:
+                # slices are in order of the text, so the first slice with a k-mer has its first position
+                freq_table[number] = [count, first_position]
+            else:
+                entry[0] += count
+
+    return freq_table
+
+
+def _find_partition_maxima(slice_partitions: list) -> tuple:
+    """Find the most frequent k-mers of a partition of k-mers over the slices of a text
+
+    :return: Maximum count of the partition and the (first position, integer code) of k-mers with that count
+    :rtype: tuple
+    """
+    freq_table = _merge_partition(slice_partitions)
+    max_count = max((count for count, _ in freq_table.values()), default=0)
+
+    return max_count, [
+        (first_position, number) for number, (count, first_position) in freq_table.items() if count == max_count
+    ]
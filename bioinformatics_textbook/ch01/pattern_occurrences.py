@@ -1,8 +1,10 @@
 import logging
+from functools import cached_property
+from typing import Iterator, Optional, Union
 
 import click
 
-from bioinformatics_textbook.inout import RosalindDataset
+from bioinformatics_textbook.inout import RECORD_SEPARATOR, RosalindDataset
 
 
 class PatternOccurrences:
@@ -42,51 +44,134 @@ class PatternOccurrences:
         :return: Starting positions of each occurrence of pattern in genome
         :rtype: list
         """
-        k = len(pattern)
-        genome_length = len(genome)
+        return list(self.generate_starting_positions(pattern=pattern, genome=genome))
 
-        starting_positions = []
-        for i in range(genome_length - k + 1):
-            window = genome[i: i + k]
-            if window == pattern:
-                starting_positions.append(i)
+    def generate_starting_positions(self, pattern: str, genome: str) -> Iterator[int]:
+        """Generate the starting positions of all occurrences of a pattern (k-mer) in a string (genome), including
+        overlapping occurrences
 
-        return starting_positions
+        :param pattern: A k-mer sequence
+        :type pattern: str
+        :param genome: A DNA string (genome)
+        :type genome: str
+        :yield: Starting positions of each occurrence of pattern in genome in increasing order
+        :rtype: Iterator[int]
+        """
+        position = genome.find(pattern)
+        while position >= 0:
+            yield position
+            position = genome.find(pattern, position + 1)
+
+    def find_approx_starting_positions(self, pattern: str, genome: str, num_allowed_mismatches: int) -> list:
+        """Find the starting positions of all approximate occurrences of a pattern in a genome, i.e. of k-mers with at
+        most `num_allowed_mismatches` mismatches to the pattern.
+
+        By the pigeonhole principle, an approximate occurrence matches at least one of `num_allowed_mismatches` + 1
+        non-overlapping pieces of the pattern exactly, so candidates are only the exact occurrences of the pieces,
+        which are found with str.find, instead of every position of the genome.
+
+        :param pattern: A k-mer sequence
+        :type pattern: str
+        :param genome: A DNA string (genome)
+        :type genome: str
+        :param num_allowed_mismatches: Maximum Hamming distance of an approximate occurrence to the pattern
+        :type num_allowed_mismatches: int
+        :return: Starting positions of each approximate occurrence in increasing order
+        :rtype: list
+        """
+        kmer_length = len(pattern)
+        last_start = len(genome) - kmer_length
+        num_pieces = num_allowed_mismatches + 1
+        if num_pieces > kmer_length:
+            candidates = range(last_start + 1)
+        else:
+            candidates = set()
+            for i in range(num_pieces):
+                piece_start = i * kmer_length // num_pieces
+                piece = pattern[piece_start: (i + 1) * kmer_length // num_pieces]
+                for position in self.generate_starting_positions(pattern=piece, genome=genome):
+                    if piece_start <= position <= last_start + piece_start:
+                        candidates.add(position - piece_start)
+
+        return [
+            start
+            for start in sorted(candidates)
+            if sum(map(str.__ne__, pattern, genome[start: start + kmer_length])) <= num_allowed_mismatches
+        ]
 
 
 class TextPattern(RosalindDataset):
+    """Read and represent a Rosalind dataset that contains a DNA string and a pattern (k-mer) on the last line.
+    """
+
     def __init__(self, input_file: click.File, logger: logging.Logger = logging.getLogger(__name__)) -> None:
         super().__init__(input_file=input_file, logger=logger)
 
         self.logger.info("Initialize object with a DNA string and a pattern (k-mer).")
 
-        self.text = self._read_not_last_line()
-        self.pattern = self._read_last_line()
+    @cached_property
+    def text(self) -> str:
+        """DNA string"""
+        text = self._decode_bytes(self.text_bytes)
+        self.logger.info("Text: %s+...", text[:10])
 
-        self._log_init()
+        return text
 
-    
-    def _log_init(self) -> None:
-        """Log attributes created during initialization
-        """
-        self.logger.info("Text: %s+...", self.text[:10])
-        self.logger.info("Pattern: %s", self.pattern)
+    @cached_property
+    def text_bytes(self) -> Union[bytes, memoryview]:
+        """DNA string as ASCII bytes"""
+        return self._read_not_last_line_bytes()
+
+    @cached_property
+    def pattern(self) -> str:
+        """Pattern (k-mer)"""
+        pattern = self._read_last_line()
+        self.logger.info("Pattern: %s", pattern)
+
+        return pattern
 
 
 class PatternGenome(RosalindDataset):
-    def __init__(self, input_file: click.File, logger: logging.Logger = logging.getLogger(__name__)) -> None:
+    """Read and represent a Rosalind dataset that contains a pattern (k-mer) and a genome on the last line. If a
+    FASTA, FASTQ, or 2-bit sequence file is given, the dataset only contains the pattern and the genome is the
+    records of the sequence file joined by RECORD_SEPARATOR.
+    """
+
+    def __init__(
+        self,
+        input_file: click.File,
+        sequence_file: Optional[click.File] = None,
+        logger: logging.Logger = logging.getLogger(__name__),
+    ) -> None:
         super().__init__(input_file=input_file, logger=logger)
 
         self.logger.info("Initialize object with a pattern (k-mer) and genome.")
 
-        self.pattern = self._read_not_last_line()
-        self.genome = self._read_last_line()
+        self.sequence_file = sequence_file
 
-        self._log_init()
+    @cached_property
+    def pattern(self) -> str:
+        """Pattern (k-mer)"""
+        if self.sequence_file is None:
+            pattern = self._read_not_last_line()
+        else:
+            pattern = self._read_first_line()
+        self.logger.info("Pattern: %s", pattern)
 
-    
-    def _log_init(self) -> None:
-        """Log attributes created during initialization
-        """
-        self.logger.info("Pattern: %s", self.pattern)
-        self.logger.info("Pattern: %s+...", self.genome[:10])
+        return pattern
+
+    @cached_property
+    def genome(self) -> str:
+        """Genome"""
+        genome = self._decode_bytes(self.genome_bytes)
+        self.logger.info("Genome: %s+...", genome[:10])
+
+        return genome
+
+    @cached_property
+    def genome_bytes(self) -> Union[bytes, memoryview]:
+        """Genome as ASCII bytes"""
+        if self.sequence_file is None:
+            return self._read_last_line_bytes()
+
+        return RECORD_SEPARATOR.encode().join(self._read_sequence_file_bytes(self.sequence_file))
@@ -1,4 +1,5 @@
 import logging
+from functools import cached_property
 
 import click
 
@@ -12,13 +13,11 @@ class Pattern(RosalindDataset):
 
         self.logger.info("Initialize object with pattern")
 
-        self.pattern = self._read_all_lines()
+    @cached_property
+    def pattern(self) -> str:
+        """Pattern"""
+        pattern = self._read_all_lines()
+        self.logger.info("Pattern: %s", pattern)
 
-        self._log_init()
-
-
-    def _log_init(self) -> None:
-        """Log attributes created during initializtion
-        """
-        self.logger.info("Pattern: %s", self.pattern)
+        return pattern
 
@@ -0,0 +1,135 @@
+import logging
+from typing import Optional
+
+
+class SuffixArray:
+    """Suffix array and longest common prefix (LCP) array of a text.
+
+    Occurrences of the same k-mer are adjacent in the suffix array, so the counts of every k-mer, for every k, can be
+    read from runs of neighboring suffixes whose longest common prefix is at least k. k-mers that contain the
+    separator, if any, e.g. between the records of a sequence file, are not counted.
+    """
+
+    def __init__(
+        self, text: str, separator: Optional[str] = None, logger: logging.Logger = logging.getLogger(__name__)
+    ) -> None:
+        self.text = text
+        self.separator = separator
+        self.logger = logger
+
+        self.logger.info("Construct suffix array and LCP array.")
+
+        self.suffix_array = self._construct_suffix_array()
+        self.lcp_array = self._construct_lcp_array()
+
+
+    def find_most_freq_words(self, min_kmer_length: int, max_kmer_length: int, histogram: bool = False) -> dict:
+        """Find the most frequent k-mers for every k-mer length in a range in one pass over the suffix array
+
+        :param min_kmer_length: Smallest k-mer length
+        :type min_kmer_length: int
+        :param max_kmer_length: Largest k-mer length
+        :type max_kmer_length: int
+        :param histogram: Also report how many distinct k-mers occur each number of times, defaults to False
+        :type histogram: bool
+        :return: k-mer lengths mapped to their most frequent k-mers in lexicographic order or, if `histogram` is True,
+            to a tuple of the most frequent k-mers and a dictionary of counts mapped to their number of distinct k-mers
+        :rtype: dict
+        """
+        kmer_lengths = range(min_kmer_length, max_kmer_length + 1)
+        text_length = len(self.text)
+
+        # start (in the suffix array) of the current run of suffixes sharing a k-mer, for every k
+        run_starts = {k: 0 for k in kmer_lengths}
+        max_freqs = {k: 0 for k in kmer_lengths}
+        most_freq_positions = {k: [] for k in kmer_lengths}
+        histograms = {k: {} for k in kmer_lengths}
+
+        def close_run(k: int, run_start: int, run_end: int) -> None:
+            position = self.suffix_array[run_start]
+            # suffixes shorter than k do not start a k-mer
+            if text_length - position < k:
+                return
+            if self.separator is not None and self.text.find(self.separator, position, position + k) >= 0:
+                return
+            freq = run_end - run_start
+            histograms[k][freq] = histograms[k].get(freq, 0) + 1
+            if freq > max_freqs[k]:
+                max_freqs[k] = freq
+                most_freq_positions[k] = [position]
+            elif freq == max_freqs[k]:
+                most_freq_positions[k].append(position)
+
+        for i in range(1, text_length + 1):
+            lcp = self.lcp_array[i] if i < text_length else 0
+            for k in kmer_lengths:
+                if lcp < k:
+                    close_run(k, run_starts[k], i)
+                    run_starts[k] = i
+
+        most_freq_words = {}
+        for k in kmer_lengths:
+            kmers = [self.text[position: position + k] for position in most_freq_positions[k]]
+            most_freq_words[k] = (kmers, dict(sorted(histograms[k].items()))) if histogram else kmers
+
+        return most_freq_words
+
+
+    def _construct_suffix_array(self) -> list:
+        """Construct the suffix array by prefix doubling, i.e. by sorting suffixes on ranks of prefixes of length 1, 2, 4, ...
+
+        :return: Starting positions of suffixes in lexicographic order
+        :rtype: list
+        """
+        text_length = len(self.text)
+        ranks = [ord(character) for character in self.text]
+        suffix_array = list(range(text_length))
+
+        prefix_length = 1
+        while True:
+            def sort_key(i: int) -> tuple:
+                return (ranks[i], ranks[i + prefix_length] if i + prefix_length < text_length else -1)
+
+            suffix_array.sort(key=sort_key)
+
+            new_ranks = [0] * text_length
+            for previous, current in zip(suffix_array, suffix_array[1:]):
+                new_ranks[current] = new_ranks[previous] + (sort_key(previous) != sort_key(current))
+            ranks = new_ranks
+
+            if not suffix_array or ranks[suffix_array[-1]] == text_length - 1:
+                return suffix_array
+            prefix_length *= 2
+
+
+    def _construct_lcp_array(self) -> list:
+        """Construct the LCP array with Kasai's algorithm
+
+        :return: Length of the longest common prefix of each suffix and the suffix before it in the suffix array. The
+            first entry is 0.
+        :rtype: list
+        """
+        text_length = len(self.text)
+        inverse_suffix_array = [0] * text_length
+        for rank, position in enumerate(self.suffix_array):
+            inverse_suffix_array[position] = rank
+
+        lcp_array = [0] * text_length
+        lcp = 0
+        for position in range(text_length):
+            rank = inverse_suffix_array[position]
+            if rank == 0:
+                lcp = 0
+                continue
+            previous_position = self.suffix_array[rank - 1]
+            while (
+                position + lcp < text_length
+                and previous_position + lcp < text_length
+                and self.text[position + lcp] == self.text[previous_position + lcp]
+            ):
+                lcp += 1
+            lcp_array[rank] = lcp
+            # the next suffix shares at least one fewer character with its predecessor
+            lcp = max(lcp - 1, 0)
+
+        return lcp_array
@@ -1,29 +1,159 @@
-from bioinformatics_textbook.inout import RosalindSolution
+import logging
+from typing import Optional
+
+from bioinformatics_textbook.checkpoint import SearchCheckpoint
+from bioinformatics_textbook.inout import RosalindDataset, RosalindSolution
+from bioinformatics_textbook.ch02.greedy_motif_search import GreedyMotifSearch
 from bioinformatics_textbook.ch02.median_string import MedianString
 from bioinformatics_textbook.ch02.motif import Motif
+from bioinformatics_textbook.ch02.randomized_motif_search import RandomizedMotifSearch
 
 
 class BA2A(RosalindSolution):
+    def __init__(
+        self,
+        dataset: RosalindDataset,
+        checkpoint: Optional[SearchCheckpoint] = None,
+        logger: logging.Logger = logging.getLogger(__name__),
+    ) -> None:
+        self.checkpoint = checkpoint
+        super().__init__(dataset=dataset, logger=logger)
+
     def _solve_problem(self) -> set:
         k_d_motifs = Motif().find_k_d_motifs(
             kmer_length=self.dataset.kmer_length,
             num_allowed_mismatches=self.dataset.num_allowed_mismatches,
             dnas=self.dataset.dnas,
+            checkpoint=self.checkpoint,
         )
 
         return self._format_rosalind_answer(k_d_motifs)
 
 
 class BA2B(RosalindSolution):
+    def __init__(
+        self,
+        dataset: RosalindDataset,
+        num_workers: int = 1,
+        checkpoint: Optional[SearchCheckpoint] = None,
+        logger: logging.Logger = logging.getLogger(__name__),
+    ) -> None:
+        self.num_workers = num_workers
+        self.checkpoint = checkpoint
+        super().__init__(dataset=dataset, logger=logger)
+
     def _solve_problem(self) -> int:
         median_strings = MedianString().find_median_strings(
             kmer_length=self.dataset.k,
             dnas=self.dataset.dnas,
+            num_workers=self.num_workers,
+            checkpoint=self.checkpoint,
         )
 
         return median_strings[0]
 
 
+class BA2C(RosalindSolution):
+    def _solve_problem(self) -> str:
+        most_probable_kmer = GreedyMotifSearch().find_profile_most_probable_kmer(
+            text=self.dataset.text,
+            kmer_length=self.dataset.kmer_length,
+            profile=self.dataset.profile,
+        )
+
+        return most_probable_kmer
+
+
+class BA2D(RosalindSolution):
+    def _solve_problem(self) -> str:
+        motifs = GreedyMotifSearch().find_motifs(
+            kmer_length=self.dataset.kmer_length,
+            dnas=self.dataset.dnas,
+        )
+
+        return self._format_rosalind_answer(motifs, sep='\n')
+
+
+class BA2E(RosalindSolution):
+    def _solve_problem(self) -> str:
+        motifs = GreedyMotifSearch().find_motifs(
+            kmer_length=self.dataset.kmer_length,
+            dnas=self.dataset.dnas,
+            pseudocounts=True,
+        )
+
+        return self._format_rosalind_answer(motifs, sep='\n')
+
+
+class BA2F(RosalindSolution):
+    def __init__(
+        self,
+        dataset: RosalindDataset,
+        num_restarts: int = 1000,
+        num_workers: int = 1,
+        seed: int = 0,
+        patience: Optional[int] = None,
+        logger: logging.Logger = logging.getLogger(__name__),
+    ) -> None:
+        self.num_restarts = num_restarts
+        self.num_workers = num_workers
+        self.seed = seed
+        self.patience = patience
+        super().__init__(dataset=dataset, logger=logger)
+
+    def _solve_problem(self) -> str:
+        motifs = RandomizedMotifSearch().find_motifs_randomized(
+            kmer_length=self.dataset.kmer_length,
+            dnas=self.dataset.dnas,
+            num_restarts=self.num_restarts,
+            num_workers=self.num_workers,
+            seed=self.seed,
+            patience=self.patience,
+        )
+
+        return self._format_rosalind_answer(motifs, sep='\n')
+
+
+class BA2G(BA2F):
+    def __init__(
+        self,
+        dataset: RosalindDataset,
+        num_restarts: int = 1000,
+        num_workers: int = 1,
+        seed: int = 0,
+        patience: Optional[int] = None,
+        num_iterations: Optional[int] = None,
+        logger: logging.Logger = logging.getLogger(__name__),
+    ) -> None:
+        # overrides the number of iterations of the dataset, which is optional
+        self.num_iterations = num_iterations
+        super().__init__(
+            dataset=dataset,
+            num_restarts=num_restarts,
+            num_workers=num_workers,
+            seed=seed,
+            patience=patience,
+            logger=logger,
+        )
+
+    def _solve_problem(self) -> str:
+        num_iterations = self.num_iterations if self.num_iterations is not None else self.dataset.num_iterations
+        if num_iterations is None:
+            raise ValueError("GibbsSampler needs a number of iterations N, but the dataset has none.")
+
+        motifs = RandomizedMotifSearch().find_motifs_gibbs(
+            kmer_length=self.dataset.kmer_length,
+            dnas=self.dataset.dnas,
+            num_iterations=num_iterations,
+            num_restarts=self.num_restarts,
+            num_workers=self.num_workers,
+            seed=self.seed,
+            patience=self.patience,
+        )
+
+        return self._format_rosalind_answer(motifs, sep='\n')
+
+
 class BA2H(RosalindSolution):
     def _solve_problem(self) -> int:
         distance = MedianString().compute_pattern_strings_distance(
@@ -0,0 +1,276 @@
+import logging
+from functools import cached_property
+from typing import Optional, Union
+
+import click
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from bioinformatics_textbook.dna import DNA
+from bioinformatics_textbook.dna_collection import DNACollection
+from bioinformatics_textbook.inout import RosalindDataset
+from bioinformatics_textbook.ch02.window_index import encode_dna
+
+
+class GreedyMotifSearch:
+    """Find motifs by profile scoring.
+
+    DNA sequences are encoded once as uint8 windows, and profiles are scored as log-probability matrices, so the
+    probability of every window of a sequence is computed with a few NumPy operations.
+    """
+
+    def __init__(self, logger: logging.Logger = logging.getLogger(__name__)) -> None:
+        self.logger = logger
+
+    def find_profile_most_probable_kmer(self, text: str, kmer_length: int, profile: np.ndarray) -> DNA:
+        """Find the k-mer of a text that is most probable given a profile
+
+        :param text: A DNA string
+        :type text: str
+        :param kmer_length: k-mer length
+        :type kmer_length: int
+        :param profile: Profile matrix of shape (4, k-mer length) with rows for A, C, G, and T
+        :type profile: np.ndarray
+        :return: The most probable k-mer. Ties are broken by the first occurrence in the text.
+        :rtype: DNA
+        """
+        windows = self._encode_windows(dna=text, kmer_length=kmer_length)
+        position = self._find_most_probable_window(windows=windows, log_profile=self._log(np.asarray(profile)))
+
+        return DNA(text[position: position + kmer_length])
+
+    def find_motifs(self, kmer_length: int, dnas: list, pseudocounts: bool = False) -> list[DNA]:
+        """Find the best motifs of a collection of DNA sequences by greedy motif search. Each k-mer of the first
+        sequence seeds a motif collection, which is extended by the profile-most probable k-mer of each following
+        sequence given the profile of the motifs chosen so far.
+
+        :param kmer_length: k-mer length
+        :type kmer_length: int
+        :param dnas: Collection of DNA sequences
+        :type dnas: Union[list, DNACollection]
+        :param pseudocounts: Apply Laplace's rule of succession by adding 1 to every count of the profiles, defaults to False
+        :type pseudocounts: bool
+        :return: One motif per DNA sequence
+        :rtype: list[DNA]
+        """
+        self.logger.info("Find motifs by greedy motif search%s.", " with pseudocounts" if pseudocounts else "")
+
+        dnas = DNACollection.from_sequences(dnas)
+        windows = self._encode_collection_windows(dnas=dnas, kmer_length=kmer_length)
+
+        best_positions = [0] * len(dnas)
+        best_score = self.score_motifs(np.stack([dna_windows[0] for dna_windows in windows]))
+        for first_position in range(len(windows[0])):
+            motifs = np.empty((len(dnas), kmer_length), dtype=np.uint8)
+            motifs[0] = windows[0][first_position]
+            positions = [first_position]
+            for i in range(1, len(dnas)):
+                profile = self.construct_profile(motifs=motifs[:i], pseudocounts=pseudocounts)
+                position = self._find_most_probable_window(windows=windows[i], log_profile=self._log(profile))
+                motifs[i] = windows[i][position]
+                positions.append(position)
+
+            score = self.score_motifs(motifs)
+            if score < best_score:
+                best_score = score
+                best_positions = positions
+
+        return self._positions_to_motifs(dnas=dnas, positions=best_positions, kmer_length=kmer_length)
+
+    def construct_profile(self, motifs: np.ndarray, pseudocounts: bool = False) -> np.ndarray:
+        """Construct the profile of a collection of motifs, i.e. the frequency of each nucleotide at each position
+
+        :param motifs: Array of shape (number of motifs, k-mer length) of nucleotide codes
+        :type motifs: np.ndarray
+        :param pseudocounts: Add 1 to every count, defaults to False
+        :type pseudocounts: bool
+        :return: Profile matrix of shape (4, k-mer length) with rows for A, C, G, and T
+        :rtype: np.ndarray
+        """
+        counts = self._count_nucleotides(motifs) + (1 if pseudocounts else 0)
+
+        return counts / counts.sum(axis=0)
+
+    def score_motifs(self, motifs: np.ndarray) -> int:
+        """Score a collection of motifs as the number of nucleotides that differ from the most common nucleotide of
+        their position
+
+        :param motifs: Array of shape (number of motifs, k-mer length) of nucleotide codes
+        :type motifs: np.ndarray
+        :return: Score
+        :rtype: int
+        """
+        return int(len(motifs) * motifs.shape[1] - self._count_nucleotides(motifs).max(axis=0).sum())
+
+    def _count_nucleotides(self, motifs: np.ndarray) -> np.ndarray:
+        """Count each nucleotide at each position of a collection of motifs
+
+        :param motifs: Array of shape (number of motifs, k-mer length) of nucleotide codes
+        :type motifs: np.ndarray
+        :return: Counts of shape (4, k-mer length)
+        :rtype: np.ndarray
+        """
+        return (motifs[None, :, :] == np.arange(4, dtype=np.uint8)[:, None, None]).sum(axis=1)
+
+    def _find_most_probable_window(self, windows: np.ndarray, log_profile: np.ndarray) -> int:
+        """Find the window with the highest probability given a log-probability profile
+
+        :param windows: Array of shape (number of windows, k-mer length) of nucleotide codes
+        :type windows: np.ndarray
+        :param log_profile: Log-probability profile of shape (4, k-mer length)
+        :type log_profile: np.ndarray
+        :return: Position of the first most probable window
+        :rtype: int
+        """
+        log_probabilities = log_profile[windows, np.arange(windows.shape[1])].sum(axis=1)
+        max_log_probability = log_probabilities.max()
+        if np.isneginf(max_log_probability):
+            return 0
+
+        # tolerate rounding, since equal products of probabilities may differ slightly as sums of logarithms
+        return int(np.argmax(log_probabilities >= max_log_probability - 1e-9))
+
+    def _encode_windows(self, dna: str, kmer_length: int) -> np.ndarray:
+        """Encode every window of a DNA sequence
+
+        :param dna: DNA sequence
+        :type dna: str
+        :param kmer_length: k-mer length
+        :type kmer_length: int
+        :return: Array of shape (number of windows, k-mer length) of nucleotide codes
+        :rtype: np.ndarray
+        """
+        return sliding_window_view(encode_dna(dna), kmer_length)
+
+    def _encode_collection_windows(self, dnas: DNACollection, kmer_length: int) -> list:
+        """Encode every window of every DNA sequence of a collection
+
+        :param dnas: Collection of DNA sequences
+        :type dnas: DNACollection
+        :param kmer_length: k-mer length
+        :type kmer_length: int
+        :return: Arrays of shape (number of windows, k-mer length) of nucleotide codes, one per DNA sequence
+        :rtype: list
+        """
+        return [sliding_window_view(dnas.codes(i), kmer_length) for i in range(len(dnas))]
+
+    def _positions_to_motifs(self, dnas: DNACollection, positions: list, kmer_length: int) -> list[DNA]:
+        """Slice motifs out of DNA sequences
+
+        :param dnas: Collection of DNA sequences
+        :type dnas: DNACollection
+        :param positions: Position of the motif of each DNA sequence
+        :type positions: list
+        :param kmer_length: k-mer length
+        :type kmer_length: int
+        :return: One motif per DNA sequence
+        :rtype: list[DNA]
+        """
+        return [
+            DNA(bytes(dnas.view(i)[position: position + kmer_length]).decode())
+            for i, position in enumerate(positions)
+        ]
+
+    def _log(self, profile: np.ndarray) -> np.ndarray:
+        """Take the logarithm of a profile, mapping probabilities of 0 to negative infinity
+
+        :param profile: Profile matrix
+        :type profile: np.ndarray
+        :return: Log-probability profile
+        :rtype: np.ndarray
+        """
+        with np.errstate(divide="ignore"):
+            return np.log(profile)
+
+
+class TextKProfile(RosalindDataset):
+    """Read and represent a Rosalind dataset that contains a DNA string, a k-mer length, and a 4 x k profile matrix
+    """
+
+    def __init__(self, input_file: click.File, logger: logging.Logger = logging.getLogger(__name__)) -> None:
+        super().__init__(input_file=input_file, logger=logger)
+
+        self.logger.info("Initialize object with DNA string, k-mer length, and profile matrix")
+
+    @cached_property
+    def text(self) -> str:
+        """DNA string"""
+        text = self._read_first_line()
+        self.logger.info("Text: %s+...", text[:10])
+
+        return text
+
+    @cached_property
+    def kmer_length(self) -> int:
+        """k-mer length"""
+        kmer_length = int(self._read_lines()[1])
+        self.logger.info("k-mer length: %s", kmer_length)
+
+        return kmer_length
+
+    @cached_property
+    def profile(self) -> np.ndarray:
+        """4 x k profile matrix"""
+        profile = np.array([[float(value) for value in line.split()] for line in self._read_lines()[2:6]])
+        self.logger.info("Profile: %s", profile.tolist())
+
+        return profile
+
+
+class KTDNAs(RosalindDataset):
+    """Read and represent a Rosalind dataset that contains a k-mer length, number of DNA strings (t), and optionally a number of iterations (N) on the first line (separated by spaces) and DNA strings on all subsequent lines.
+    """
+
+    def __init__(self, input_file: click.File, logger: logging.Logger = logging.getLogger(__name__)) -> None:
+        super().__init__(input_file=input_file, logger=logger)
+
+        self.logger.info("Initialize object with k-mer length, number of DNA strings, and DNA strings")
+
+    @cached_property
+    def _values(self) -> list:
+        """Values of the first line"""
+        return [int(value) for value in self._read_first_line().split(' ')]
+
+    @cached_property
+    def kmer_length(self) -> int:
+        """k-mer length"""
+        kmer_length = self._values[0]
+        self.logger.info("k-mer length: %s", kmer_length)
+
+        return kmer_length
+
+    @cached_property
+    def t(self) -> int:
+        """Number of DNA strings"""
+        t = self._values[1]
+        self.logger.info("Number DNA strings: %s", t)
+
+        return t
+
+    @cached_property
+    def num_iterations(self) -> Optional[int]:
+        """Number of iterations, if given"""
+        num_iterations = self._values[2] if len(self._values) > 2 else None
+        self.logger.info("Number of iterations: %s", num_iterations)
+
+        return num_iterations
+
+    @cached_property
+    def dnas(self) -> DNACollection:
+        """DNA strings. Every DNA string must hold at least one k-mer and only the nucleotides A, C, G, and T, since
+        motif searches score every k-mer window of every DNA string.
+
+        :raises ValueError: If a DNA string is shorter than the k-mer length or contains other characters
+        """
+        dnas = DNACollection.from_sequences(self._read_last_lines_bytes())
+
+        short_dnas = np.flatnonzero(dnas.lengths < self.kmer_length)
+        if len(short_dnas):
+            raise ValueError(f"DNA string {short_dnas[0] + 1} is shorter than the k-mer length {self.kmer_length}.")
+
+        invalid_positions = np.flatnonzero(dnas.encode() == 255)
+        if len(invalid_positions):
+            invalid_dna = np.searchsorted(dnas.offsets, invalid_positions[0], side="right")
+            raise ValueError(f"DNA string {invalid_dna} contains characters other than A, C, G, and T.")
+
+        return dnas
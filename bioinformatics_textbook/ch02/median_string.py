@@ -1,80 +1,428 @@
 import logging
+import multiprocessing
+from functools import cached_property
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Optional, Union
 
 import click
+import numpy as np
 
+from bioinformatics_textbook.checkpoint import SearchCheckpoint
 from bioinformatics_textbook.dna import DNA
+from bioinformatics_textbook.dna_collection import DNACollection
 from bioinformatics_textbook.inout import RosalindDataset
+from bioinformatics_textbook.ch02.window_index import DNAWindowIndex, decode_kmer_numbers
 
 
 class MedianString:
+    # number of k-mer prefix ranges the search is split into when checkpointing, whatever the number of workers, so
+    # that a checkpoint can be resumed with a different number of workers
+    checkpoint_num_ranges = 256
 
     def __init__(self) -> None:
         self.median_strings = []
         self.minimum_distance = None
+        # minimum distance shared between worker processes, if searching in parallel
+        self._shared_minimum_distance = None
+        # checkpoint of the search, with its description and the indices of the completed prefix ranges
+        self._checkpoint = None
+        self._checkpoint_search = None
+        self._completed_ranges = set()
     
-    def find_median_strings(self, kmer_length: int, dnas: list[DNA]) -> list[DNA]:
+    def find_median_strings(
+        self,
+        kmer_length: int,
+        dnas: Union[list[DNA], DNACollection],
+        search: str = "branch_and_bound",
+        num_workers: int = 1,
+        checkpoint: Optional[SearchCheckpoint] = None,
+    ) -> list[DNA]:
         """Find median string(s), i.e. k-mer(s) that minimize the distance between all k-mers and DNA sequences.
 
         :param kmer_length: k-mer length
         :type kmer_length: int
         :param dnas: DNA sequences
-        :type dnas: list[DNA]
-        :return: Median string(s)
+        :type dnas: Union[list[DNA], DNACollection]
+        :param search: 'exhaustive' computes the distance of every k-mer, 'branch_and_bound' searches a prefix tree of
+            k-mers and skips subtrees that cannot reach the current minimum distance, defaults to 'branch_and_bound'
+        :type search: str
+        :param num_workers: Number of worker processes that search contiguous ranges of k-mer codes, defaults to 1
+        :type num_workers: int
+        :param checkpoint: Checkpoint that the completed prefix ranges and the median strings found so far are saved
+            to after each range, and resumed from, defaults to None
+        :type checkpoint: Optional[SearchCheckpoint]
+        :return: Median string(s) in lexicographic order
         :rtype: list[DNA]
         """
+        if search not in ("branch_and_bound", "exhaustive"):
+            raise ValueError(f"Unknown median string search: {search}")
+
+        dnas = DNACollection.from_sequences(dnas)
+        self.median_strings = []
         self.minimum_distance = kmer_length * len(dnas)
-        for kmer in DNA.generate_all_possible_kmers(kmer_length=kmer_length):
-            distance = self.compute_pattern_strings_distance(pattern=kmer, dnas=dnas)
-            if distance == self.minimum_distance:
-                self.median_strings.append(kmer)
-            elif distance < self.minimum_distance:
-                self.median_strings = [kmer]
-                self.minimum_distance = distance
+
+        if checkpoint is not None:
+            num_ranges = self.checkpoint_num_ranges
+        elif num_workers > 1:
+            # several ranges per worker to balance uneven pruning
+            num_ranges = 8 * num_workers
+        else:
+            num_ranges = 1
+        prefix_length, ranges = self._split_code_ranges(kmer_length=kmer_length, num_ranges=num_ranges)
+
+        self._checkpoint = checkpoint
+        self._completed_ranges = set()
+        if checkpoint is not None:
+            self._checkpoint_search = {
+                "problem": "median_string",
+                "kmer_length": kmer_length,
+                "search": search,
+                "dnas": dnas.fingerprint(),
+                "prefix_length": prefix_length,
+                "num_ranges": len(ranges),
+            }
+            state = checkpoint.load(self._checkpoint_search)
+            if state is not None:
+                self._completed_ranges = set(state["completed_ranges"])
+                self.minimum_distance = state["minimum_distance"]
+                self.median_strings = [DNA(kmer) for kmer in state["median_strings"]]
+
+        remaining_ranges = [i for i in range(len(ranges)) if i not in self._completed_ranges]
+        if num_workers > 1:
+            self._search_in_workers(
+                kmer_length=kmer_length,
+                dnas=dnas,
+                search=search,
+                num_workers=num_workers,
+                prefix_length=prefix_length,
+                ranges={i: ranges[i] for i in remaining_ranges},
+                num_ranges=len(ranges),
+            )
+        elif remaining_ranges:
+            index = DNAWindowIndex(dnas=dnas, kmer_length=kmer_length)
+            for i in remaining_ranges:
+                start, end = ranges[i]
+                self._search_code_range(index=index, search=search, start=start, end=end, prefix_length=prefix_length)
+                self._complete_range(i, num_ranges=len(ranges))
+
+        self.median_strings.sort()
 
         return self.median_strings
+
+
+    def _split_code_ranges(self, kmer_length: int, num_ranges: int) -> tuple:
+        """Split the k-mer codes into contiguous ranges of prefix codes
+
+        :param kmer_length: k-mer length
+        :type kmer_length: int
+        :param num_ranges: Number of ranges wanted. There are fewer if there are fewer prefixes.
+        :type num_ranges: int
+        :return: Length of the prefixes, and the first prefix code and the prefix code after the end of each range
+        :rtype: tuple
+        """
+        prefix_length = 0
+        while 4 ** prefix_length < num_ranges and prefix_length < kmer_length:
+            prefix_length += 1
+        num_prefixes = 4 ** prefix_length
+        num_ranges = min(num_ranges, num_prefixes)
+        bounds = [num_prefixes * i // num_ranges for i in range(num_ranges + 1)]
+
+        return prefix_length, list(zip(bounds, bounds[1:]))
+
+
+    def _search_in_workers(
+        self,
+        kmer_length: int,
+        dnas: DNACollection,
+        search: str,
+        num_workers: int,
+        prefix_length: int,
+        ranges: dict,
+        num_ranges: int,
+    ) -> None:
+        """Search ranges of prefix codes in a process pool, and reduce the results to the global minimum distance and
+        all median strings at that distance.
+
+        Workers share the smallest distance found so far, so each one prunes with the best distance of all of them.
+
+        :param kmer_length: k-mer length
+        :type kmer_length: int
+        :param dnas: DNA sequences
+        :type dnas: DNACollection
+        :param search: Search strategy
+        :type search: str
+        :param num_workers: Number of worker processes
+        :type num_workers: int
+        :param prefix_length: Length of the prefixes
+        :type prefix_length: int
+        :param ranges: First prefix code and prefix code after the end of each range to search, by range index
+        :type ranges: dict
+        :param num_ranges: Total number of ranges, including the ones already searched
+        :type num_ranges: int
+        """
+        if not ranges:
+            return
+
+        shared_minimum_distance = multiprocessing.Value("q", self.minimum_distance)
+        with ProcessPoolExecutor(
+            max_workers=num_workers,
+            initializer=_initialize_worker,
+            initargs=(dnas, kmer_length, shared_minimum_distance),
+        ) as executor:
+            futures = {
+                executor.submit(_search_code_range, search, start, end, prefix_length): i
+                for i, (start, end) in ranges.items()
+            }
+            for future in as_completed(futures):
+                minimum_distance, median_strings = future.result()
+                median_strings = [DNA(kmer) for kmer in median_strings]
+                if minimum_distance < self.minimum_distance:
+                    self.minimum_distance = minimum_distance
+                    self.median_strings = median_strings
+                elif minimum_distance == self.minimum_distance:
+                    self.median_strings.extend(median_strings)
+                self._complete_range(futures[future], num_ranges=num_ranges)
+
+
+    def _complete_range(self, range_index: int, num_ranges: int) -> None:
+        """Record a searched range of prefix codes, and save the checkpoint if there is one
+
+        :param range_index: Index of the range
+        :type range_index: int
+        :param num_ranges: Total number of ranges. The checkpoint is always saved once all of them are searched.
+        :type num_ranges: int
+        """
+        self._completed_ranges.add(range_index)
+        if self._checkpoint is None:
+            return
+
+        state = {
+            "completed_ranges": sorted(self._completed_ranges),
+            "minimum_distance": self.minimum_distance,
+            "median_strings": [str(kmer) for kmer in self.median_strings],
+        }
+        self._checkpoint.save(
+            search=self._checkpoint_search, state=state, force=len(self._completed_ranges) == num_ranges
+        )
+
+
+    def _search_code_range(self, index: DNAWindowIndex, search: str, start: int, end: int, prefix_length: int) -> None:
+        """Search the k-mers whose prefixes of a given length have integer codes in a range
+
+        :param index: Index of the windows of the DNA sequences
+        :type index: DNAWindowIndex
+        :param search: Search strategy
+        :type search: str
+        :param start: First prefix code of the range
+        :type start: int
+        :param end: Prefix code after the end of the range
+        :type end: int
+        :param prefix_length: Length of the prefixes
+        :type prefix_length: int
+        """
+        suffix_bits = 2 * (index.kmer_length - prefix_length)
+        if search == "exhaustive":
+            self._search_all_kmers(index=index, start=start << suffix_bits, end=end << suffix_bits)
+            return
+
+        prefixes = decode_kmer_numbers(np.arange(start, end), prefix_length)
+        for prefix_number, prefix in zip(range(start, end), prefixes):
+            prefix_mismatches = (index.windows[:, :prefix_length] != prefix).sum(axis=1, dtype=np.int64)
+            self._search_prefix_tree(index=index, prefix_number=prefix_number, depth=prefix_length, prefix_mismatches=prefix_mismatches)
+
+
+    def _search_all_kmers(self, index: DNAWindowIndex, start: int, end: int, batch_size: int = 1 << 12) -> None:
+        """Compute the distance of every k-mer in a range of integer codes, in batches of consecutive codes
+
+        :param index: Index of the windows of the DNA sequences
+        :type index: DNAWindowIndex
+        :param start: First integer code
+        :type start: int
+        :param end: Integer code after the end of the range
+        :type end: int
+        :param batch_size: Number of k-mers per batch, defaults to 4096
+        :type batch_size: int
+        """
+        kmer_length = index.kmer_length
+        for batch_start in range(start, end, batch_size):
+            numbers = np.arange(batch_start, min(batch_start + batch_size, end))
+            distances = index.compute_distances(decode_kmer_numbers(numbers, kmer_length))
+            self._update_median_strings(numbers=numbers, distances=distances, kmer_length=kmer_length)
+
+
+    def _search_prefix_tree(
+        self, index: DNAWindowIndex, prefix_number: int, depth: int, prefix_mismatches: np.ndarray
+    ) -> None:
+        """Search the prefix tree of k-mers below a prefix depth first, branch and bound.
+
+        The distance between a prefix and the prefixes of a DNA sequence's k-mers is a lower bound on the distance of
+        every k-mer that extends the prefix, so a subtree is pruned once that bound exceeds the minimum distance.
+
+        :param index: Index of the windows of the DNA sequences
+        :type index: DNAWindowIndex
+        :param prefix_number: Integer code of the prefix
+        :type prefix_number: int
+        :param depth: Length of the prefix
+        :type depth: int
+        :param prefix_mismatches: Mismatches between the prefix and the prefix of each window
+        :type prefix_mismatches: np.ndarray
+        """
+        kmer_length = index.kmer_length
+        # sequences without windows add the same distance to every k-mer
+        base_distance = kmer_length * index.num_short_dnas
+
+        if depth == kmer_length:
+            distance = base_distance + index.compute_prefix_bound(prefix_mismatches)
+            self._update_median_strings(
+                numbers=np.array([prefix_number]), distances=np.array([distance]), kmer_length=kmer_length
+            )
+            return
+
+        children = []
+        for base in range(4):
+            child_mismatches = prefix_mismatches + (index.windows[:, depth] != base)
+            lower_bound = base_distance + index.compute_prefix_bound(child_mismatches)
+            children.append((lower_bound, base, child_mismatches))
+
+        # visit the most promising children first so the minimum distance falls quickly
+        for lower_bound, base, child_mismatches in sorted(children, key=lambda child: child[:2]):
+            if lower_bound > self._get_pruning_distance():
+                break
+            self._search_prefix_tree(
+                index=index,
+                prefix_number=(prefix_number << 2) | base,
+                depth=depth + 1,
+                prefix_mismatches=child_mismatches,
+            )
+
+
+    def _get_pruning_distance(self) -> int:
+        """Get the smallest distance found so far, by this search or by any worker searching in parallel
+
+        :return: Distance above which k-mers cannot be median strings
+        :rtype: int
+        """
+        if self._shared_minimum_distance is None:
+            return self.minimum_distance
+
+        return min(self.minimum_distance, self._shared_minimum_distance.value)
+
+
+    def _update_median_strings(self, numbers: np.ndarray, distances: np.ndarray, kmer_length: int) -> None:
+        """Update the minimum distance and median strings with the distances of integer coded k-mers
+
+        :param numbers: Integer codes of k-mers
+        :type numbers: np.ndarray
+        :param distances: Distance of each k-mer
+        :type distances: np.ndarray
+        :param kmer_length: k-mer length
+        :type kmer_length: int
+        """
+        batch_minimum = int(distances.min())
+        if batch_minimum > self.minimum_distance:
+            return
+        if batch_minimum < self.minimum_distance:
+            self.median_strings = []
+            self.minimum_distance = batch_minimum
+            if self._shared_minimum_distance is not None:
+                with self._shared_minimum_distance.get_lock():
+                    if batch_minimum < self._shared_minimum_distance.value:
+                        self._shared_minimum_distance.value = batch_minimum
+
+        self.median_strings.extend(
+            DNA.number_to_pattern(int(number), kmer_length) for number in numbers[distances == batch_minimum]
+        )
         
 
-    def compute_pattern_strings_distance(self, pattern: DNA, dnas: list[DNA]) -> int:
+    def compute_pattern_strings_distance(self, pattern: DNA, dnas: Union[list[DNA], DNACollection]) -> int:
         """Compute the distance between a pattern and a collection of DNA sequences
 
         :param pattern: k-mer
         :type pattern: DNA
         :param dnas: Collection of DNA sequences
-        :type dnas: list[DNA]
+        :type dnas: Union[list[DNA], DNACollection]
         :return: Distance between pattern and DNA sequences
         :rtype: int
         """
-        global_distance = 0
-        for dna in dnas:
-            local_distance = len(pattern)
-            for kmer in dna.generate_kmers(kmer_length=len(pattern)):
-                hamming_distance = pattern.compute_hamming_distance(dna_q=kmer)
-                local_distance = hamming_distance if hamming_distance < local_distance else local_distance
-            
-            global_distance += local_distance
+        return DNAWindowIndex(dnas=dnas, kmer_length=len(pattern)).compute_pattern_distance(pattern=pattern)
 
-        return global_distance
+
+# state of a median string worker process, set once by the pool initializer
+_worker_median_string = None
+_worker_index = None
+
+
+def _initialize_worker(dnas: DNACollection, kmer_length: int, shared_minimum_distance) -> None:
+    """Index the DNA sequences once per worker process and attach the shared minimum distance
+
+    :param dnas: Collection of DNA sequences
+    :type dnas: DNACollection
+    :param kmer_length: k-mer length
+    :type kmer_length: int
+    :param shared_minimum_distance: Minimum distance shared between workers
+    :type shared_minimum_distance: multiprocessing.Value
+    """
+    global _worker_median_string, _worker_index
+
+    _worker_index = DNAWindowIndex(dnas=dnas, kmer_length=kmer_length)
+    _worker_median_string = MedianString()
+    _worker_median_string._shared_minimum_distance = shared_minimum_distance
+
+
+def _search_code_range(search: str, start: int, end: int, prefix_length: int) -> tuple:
+    """Search a range of k-mer prefix codes in a worker process
+
+    :return: The minimum distance found in the range and the median strings at that distance
+    :rtype: tuple
+    """
+    _worker_median_string.median_strings = []
+    _worker_median_string.minimum_distance = _worker_index.kmer_length * (
+        len(_worker_index.offsets) + _worker_index.num_short_dnas
+    )
+    _worker_median_string._search_code_range(
+        index=_worker_index, search=search, start=start, end=end, prefix_length=prefix_length
+    )
+
+    return _worker_median_string.minimum_distance, [str(kmer) for kmer in _worker_median_string.median_strings]
 
 
 class KDNAs(RosalindDataset):
-    """Read and represent a Rosalind dataset that contains a k-mer 'pattern' and DNA strings
+    """Read and represent a Rosalind dataset that contains a k-mer length and DNA strings. If a FASTA, FASTQ, or 2-bit
+    sequence file is given, the DNA strings are its records instead.
     """
 
-    def __init__(self, input_file: click.File, logger: logging.Logger = logging.getLogger(__name__)) -> None:
+    def __init__(
+        self,
+        input_file: click.File,
+        sequence_file: Optional[click.File] = None,
+        logger: logging.Logger = logging.getLogger(__name__),
+    ) -> None:
         super().__init__(input_file=input_file, logger=logger)
 
         self.logger.info("Initialize object with k-mer pattern and DNA strings")
 
-        self.k = int(self._read_first_line())
-        self.dnas = [DNA(seq) for seq in self._read_last_lines()]
+        self.sequence_file = sequence_file
 
-        self._log_init()
+    @cached_property
+    def k(self) -> int:
+        """k-mer length"""
+        k = int(self._read_first_line())
+        self.logger.info("k: %s", k)
 
-    def _log_init(self) -> None:
-        """Log attributes created during initializtion
-        """
-        self.logger.info("k: %s", self.k)
-        self.logger.info("Number DNA strings: %s", len(self.dnas))
+        return k
+
+    @cached_property
+    def dnas(self) -> DNACollection:
+        """DNA strings"""
+        if self.sequence_file is None:
+            dnas = DNACollection.from_sequences(self._read_last_lines_bytes())
+        elif (two_bit := self._read_two_bit_file(self.sequence_file)) is not None:
+            dnas = DNACollection.from_two_bit(two_bit)
+        else:
+            dnas = DNACollection.from_sequences(self._read_sequence_file_bytes(self.sequence_file))
+        self.logger.info("Number DNA strings: %s", len(dnas))
+
+        return dnas
 
 
 class PatternDNAs(RosalindDataset):
@@ -86,13 +434,18 @@ class PatternDNAs(RosalindDataset):
 
         self.logger.info("Initialize object with k-mer pattern and DNA strings")
 
-        self.pattern = DNA(self._read_first_line())
-        self.dnas = [DNA(seq) for seq in self._read_last_line().split(' ')]
+    @cached_property
+    def pattern(self) -> DNA:
+        """k-mer pattern"""
+        pattern = DNA(self._read_first_line())
+        self.logger.info("Pattern: %s", pattern)
 
-        self._log_init()
+        return pattern
 
-    def _log_init(self) -> None:
-        """Log attributes created during initializtion
-        """
-        self.logger.info("Pattern: %s", self.pattern)
-        self.logger.info("Number DNA strings: %s", len(self.dnas))
+    @cached_property
+    def dnas(self) -> DNACollection:
+        """DNA strings"""
+        dnas = DNACollection.from_sequences(self._read_last_line_bytes().tobytes().split(b' '))
+        self.logger.info("Number DNA strings: %s", len(dnas))
+
+        return dnas
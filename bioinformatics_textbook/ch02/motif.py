@@ -1,13 +1,37 @@
 import logging
+import math
+import re
+from functools import cached_property
+from typing import Iterator, Optional, Union
 
 import click
 
+from bioinformatics_textbook.checkpoint import SearchCheckpoint, decode_bitmap, encode_bitmap
 from bioinformatics_textbook.dna import DNA
+from bioinformatics_textbook.dna_collection import DNACollection
 from bioinformatics_textbook.inout import RosalindDataset
+from bioinformatics_textbook.kmer_trie import KmerTrie
 
 
 class Motif:
-    def find_k_d_motifs(self, kmer_length: int, num_allowed_mismatches: int, dnas: list) -> set:
+    # largest k-mer length whose candidates are represented as a bitmap of all 4^k k-mers (8 MiB per bitmap)
+    max_bitmap_kmer_length = 13
+
+    def __init__(self, logger: logging.Logger = logging.getLogger(__name__)) -> None:
+        self.logger = logger
+
+        # checkpoint of the search and its description
+        self._checkpoint = None
+        self._checkpoint_search = None
+
+    def find_k_d_motifs(
+        self,
+        kmer_length: int,
+        num_allowed_mismatches: int,
+        dnas: list,
+        engine: str = "auto",
+        checkpoint: Optional[SearchCheckpoint] = None,
+    ) -> set:
         """Find (k,d)-motifs in a collection of DNA sequences. That is, find all k-mers that appear in every string of the collection of DNA sequences with at most d mismatches.
 
         :param kmer_length: Length of (k,d)-motifs
@@ -15,22 +39,257 @@ class Motif:
         :param num_allowed_mismatches: Number of allowed mismatches (equivalent to maximum Hamming distance)
         :type num_allowed_mismatches: int
         :param dnas: Collection of DNA sequences
-        :type dnas: list
+        :type dnas: Union[list, DNACollection]
+        :param engine: How candidate motifs are found. 'set' intersects sets of k-mer strings of each DNA sequence's
+            neighborhood, 'bitset' intersects bitmaps of integer coded k-mers, 'verify' checks the neighborhood of the
+            shortest sequence against the other sequences, and 'auto' picks 'bitset' or 'verify' by estimated cost,
+            defaults to 'auto'
+        :type engine: str
+        :param checkpoint: Checkpoint that the number of DNA sequences processed and the intersection of their
+            neighborhoods are saved to after each sequence, and resumed from, defaults to None
+        :type checkpoint: Optional[SearchCheckpoint]
         :return: All unique (k,d)-motifs
         :rtype: set
         """
-        patterns = set()
-        for dna in dnas:
+        collection = DNACollection.from_sequences(dnas)
+        if engine != "set":
+            # integer coded engines read k-mers straight from views of the collection's buffer
+            dnas = list(collection.views())
+        if engine == "auto":
+            engine = self._choose_engine(kmer_length, num_allowed_mismatches, dnas)
+
+        self._checkpoint = checkpoint
+        if checkpoint is not None:
+            self._checkpoint_search = {
+                "problem": "k_d_motifs",
+                "kmer_length": kmer_length,
+                "num_allowed_mismatches": num_allowed_mismatches,
+                "engine": engine,
+                "dnas": collection.fingerprint(),
+            }
+
+        if engine == "set":
+            return self._find_k_d_motifs_with_sets(kmer_length, num_allowed_mismatches, dnas)
+        if engine == "bitset":
+            return self._find_k_d_motifs_with_bitsets(kmer_length, num_allowed_mismatches, dnas)
+        if engine == "verify":
+            return self._find_k_d_motifs_by_verification(kmer_length, num_allowed_mismatches, dnas)
+
+        raise ValueError(f"Unknown motif enumeration engine: {engine}")
+
+    def _find_k_d_motifs_with_sets(self, kmer_length: int, num_allowed_mismatches: int, dnas: list) -> set:
+        """Find (k,d)-motifs by intersecting sets of the k-mer strings in the neighborhoods of each DNA sequence
+
+        :return: All unique (k,d)-motifs
+        :rtype: set
+        """
+        self.logger.info("Find (k,d)-motifs by intersecting sets of k-mers.")
+
+        patterns, first_sequence = self._load_partial_motifs()
+        for sequence_index in range(first_sequence, len(dnas)):
+            dna = dnas[sequence_index]
             candidate_patterns = set()
             for i in range(len(dna) - kmer_length + 1):
                 kmer = DNA(dna[i: i + kmer_length])
                 candidate_patterns.update(kmer.generate_d_neighborhood(num_allowed_mismatches=num_allowed_mismatches))
-            if not patterns:
+            if patterns is None:
                 patterns = candidate_patterns
             else:
                 patterns.intersection_update(candidate_patterns)
+            self._save_partial_motifs(motifs=patterns, next_sequence=sequence_index + 1, num_sequences=len(dnas))
+
+        return patterns if patterns is not None else set()
+
+    def _find_k_d_motifs_with_bitsets(self, kmer_length: int, num_allowed_mismatches: int, dnas: list) -> set:
+        """Find (k,d)-motifs by intersecting integer coded neighborhoods of each DNA sequence.
+
+        Neighborhoods are bitmaps with one bit per possible k-mer, intersected a machine word at a time. For k-mers
+        too long for a bitmap, sets of integer codes are intersected instead. Codes are only decoded to strings for
+        the final motifs.
+
+        :return: All unique (k,d)-motifs
+        :rtype: set
+        """
+        use_bitmap = kmer_length <= self.max_bitmap_kmer_length
+        self.logger.info("Find (k,d)-motifs by intersecting %s of k-mer codes.", "bitmaps" if use_bitmap else "sets")
+
+        motifs, first_sequence = self._load_partial_motifs()
+        for i in range(first_sequence, len(dnas)):
+            candidate_numbers = self._generate_neighborhood_numbers(dnas[i], kmer_length, num_allowed_mismatches)
+            if use_bitmap:
+                bitmap = bytearray(max(4 ** kmer_length // 8, 1))
+                for number in candidate_numbers:
+                    bitmap[number >> 3] |= 1 << (number & 7)
+                candidates = int.from_bytes(bitmap, "little")
+                motifs = candidates if motifs is None else motifs & candidates
+            else:
+                candidates = set(candidate_numbers)
+                motifs = candidates if motifs is None else motifs & candidates
+
+            if not motifs:
+                # an empty bitmap is saved as 0 rather than an empty set, so a resumed search can still decode it
+                self._save_partial_motifs(motifs=motifs, next_sequence=len(dnas), num_sequences=len(dnas))
+                return set()
+            self._save_partial_motifs(motifs=motifs, next_sequence=i + 1, num_sequences=len(dnas))
+
+        if not motifs:
+            return set()
+
+        numbers = self._decode_bitmap(motifs, kmer_length) if use_bitmap else motifs
+
+        return {DNA.number_to_pattern(number, kmer_length) for number in numbers}
+
+    def _find_k_d_motifs_by_verification(self, kmer_length: int, num_allowed_mismatches: int, dnas: list) -> set:
+        """Find (k,d)-motifs by enumerating candidates from the neighborhood of the shortest DNA sequence only and
+        keeping the candidates that are within d mismatches of some k-mer of every other sequence. Sequences are
+        verified from shortest to longest, stopping as soon as no candidates remain.
+
+        :return: All unique (k,d)-motifs
+        :rtype: set
+        """
+        self.logger.info("Find (k,d)-motifs by verifying candidates from the shortest DNA sequence.")
+
+        if not dnas:
+            return set()
+
+        dnas = sorted(dnas, key=len)
+        candidates, first_sequence = self._load_partial_motifs()
+        if candidates is None:
+            candidates = set(self._generate_neighborhood_numbers(dnas[0], kmer_length, num_allowed_mismatches))
+            first_sequence = 1
+            self._save_partial_motifs(motifs=candidates, next_sequence=first_sequence, num_sequences=len(dnas))
+
+        # two bit codes differ at a base if either of its bits differ; this mask keeps one bit per base
+        base_mask = int("01" * kmer_length, 2) if kmer_length else 0
+        for i in range(first_sequence, len(dnas)):
+            if not candidates:
+                break
+            kmers = list(set(DNA.generate_kmer_numbers(dnas[i], kmer_length)))
+            candidates = {
+                candidate
+                for candidate in candidates
+                if any(
+                    (((difference := candidate ^ kmer) | (difference >> 1)) & base_mask).bit_count()
+                    <= num_allowed_mismatches
+                    for kmer in kmers
+                )
+            }
+            self._save_partial_motifs(motifs=candidates, next_sequence=i + 1, num_sequences=len(dnas))
 
-        return patterns
+        return {DNA.number_to_pattern(number, kmer_length) for number in candidates}
+
+    def _choose_engine(self, kmer_length: int, num_allowed_mismatches: int, dnas: list) -> str:
+        """Choose between the bitset and verification engines by their estimated number of k-mer operations
+
+        Enumerating costs one operation per neighbor of every k-mer. Verifying costs one operation per candidate and
+        k-mer compared, where the candidates that survive a sequence are estimated from the chance that a random k-mer
+        lies within d mismatches of at least one of its k-mers.
+
+        :return: Name of the cheaper engine
+        :rtype: str
+        """
+        num_windows = sorted(max(len(dna) - kmer_length + 1, 0) for dna in dnas)
+        if not num_windows:
+            return "bitset"
+
+        neighborhood_size = sum(
+            math.comb(kmer_length, num_mismatches) * 3 ** num_mismatches
+            for num_mismatches in range(min(num_allowed_mismatches, kmer_length) + 1)
+        )
+        neighbor_probability = min(neighborhood_size / 4 ** kmer_length, 1)
+
+        enumeration_cost = neighborhood_size * sum(num_windows)
+        if kmer_length <= self.max_bitmap_kmer_length:
+            enumeration_cost += len(num_windows) * 4 ** kmer_length / 64
+
+        num_candidates = min(neighborhood_size * num_windows[0], 4 ** kmer_length)
+        verification_cost = num_candidates
+        for windows in num_windows[1:]:
+            verification_cost += num_candidates * windows
+            num_candidates *= 1 - (1 - neighbor_probability) ** windows
+            if num_candidates < 1:
+                break
+
+        self.logger.info(
+            "Estimated costs of (k,d)-motif engines: bitset %.3g, verify %.3g", enumeration_cost, verification_cost
+        )
+
+        return "verify" if verification_cost < enumeration_cost else "bitset"
+
+    def _generate_neighborhood_numbers(self, dna: str, kmer_length: int, num_allowed_mismatches: int) -> Iterator[int]:
+        """Generate the integer codes of the d-neighborhoods of every k-mer of a DNA sequence with a single walk over a
+        trie of its distinct k-mers
+
+        :param dna: DNA sequence
+        :type dna: str
+        :param kmer_length: k-mer length
+        :type kmer_length: int
+        :param num_allowed_mismatches: Number of allowed mismatches
+        :type num_allowed_mismatches: int
+        :yield: Integer codes of neighbors in increasing order
+        :rtype: Iterator[int]
+        """
+        trie = KmerTrie.from_sequences([dna], kmer_length=kmer_length, logger=self.logger)
+        for number, _ in trie.generate_neighborhood_counts(num_allowed_mismatches=num_allowed_mismatches):
+            yield number
+
+    def _load_partial_motifs(self) -> tuple:
+        """Load the intersection of the neighborhoods of the DNA sequences processed before a checkpoint
+
+        :return: Partial (k,d)-motifs as a bitmap or a set, or None if there is nothing to resume, and the number of DNA sequences processed
+        :rtype: tuple
+        """
+        if self._checkpoint is None:
+            return None, 0
+
+        state = self._checkpoint.load(self._checkpoint_search)
+        if state is None:
+            return None, 0
+
+        motifs = decode_bitmap(state["bitmap"]) if "bitmap" in state else set(state["motifs"])
+
+        return motifs, state["next_sequence"]
+
+    def _save_partial_motifs(self, motifs: Union[int, set], next_sequence: int, num_sequences: int) -> None:
+        """Save the intersection of the neighborhoods of the DNA sequences processed so far to the checkpoint, if
+        there is one
+
+        :param motifs: Partial (k,d)-motifs as a bitmap or a set of k-mers or of their integer codes
+        :type motifs: Union[int, set]
+        :param next_sequence: Number of DNA sequences processed
+        :type next_sequence: int
+        :param num_sequences: Number of DNA sequences. The checkpoint is always saved once all of them are processed.
+        :type num_sequences: int
+        """
+        if self._checkpoint is None:
+            return
+
+        state = {"bitmap": encode_bitmap(motifs)} if isinstance(motifs, int) else {"motifs": sorted(motifs)}
+        state["next_sequence"] = next_sequence
+        self._checkpoint.save(
+            search=self._checkpoint_search, state=state, force=next_sequence == num_sequences
+        )
+
+    def _decode_bitmap(self, bitmap: int, kmer_length: int) -> list:
+        """Find the integer codes of the set bits of a bitmap
+
+        :param bitmap: Bitmap with one bit per possible k-mer
+        :type bitmap: int
+        :param kmer_length: k-mer length
+        :type kmer_length: int
+        :return: Integer codes of k-mers in increasing order
+        :rtype: list
+        """
+        bitmap_bytes = bitmap.to_bytes(max(4 ** kmer_length // 8, 1), "little")
+
+        numbers = []
+        # only visit nonzero bytes, found by the regular expression engine rather than a Python loop
+        for match in re.finditer(rb"[^\x00]", bitmap_bytes):
+            byte_index = match.start()
+            byte = bitmap_bytes[byte_index]
+            numbers.extend(8 * byte_index + bit for bit in range(8) if byte >> bit & 1)
+
+        return numbers
         
 
 class KDDNA(RosalindDataset):
@@ -42,17 +301,26 @@ class KDDNA(RosalindDataset):
 
         self.logger.info("Initialize object with k-mer length, maximum allowed mismatches, and DNA strings")
 
-        k, d = self._read_first_line().split(' ')
-        self.kmer_length = int(k)
-        self.num_allowed_mismatches = int(d)
+    @cached_property
+    def kmer_length(self) -> int:
+        """k-mer length (k)"""
+        kmer_length = int(self._read_first_line().split(' ')[0])
+        self.logger.info("k-mer length: %s", kmer_length)
 
-        self.dnas = self._read_last_lines()
+        return kmer_length
 
-        self._log_init()
+    @cached_property
+    def num_allowed_mismatches(self) -> int:
+        """Maximum allowed mismatches (d)"""
+        num_allowed_mismatches = int(self._read_first_line().split(' ')[1])
+        self.logger.info("Max allowed Hamming distance: %s", num_allowed_mismatches)
 
-    def _log_init(self) -> None:
-        """Log attributes created during initializtion
-        """
-        self.logger.info("k-mer length: %s", self.kmer_length)
-        self.logger.info("Max allowed Hamming distance: %s", self.num_allowed_mismatches)
-        self.logger.info("Number DNA strings: %s", len(self.dnas))
+        return num_allowed_mismatches
+
+    @cached_property
+    def dnas(self) -> DNACollection:
+        """DNA strings"""
+        dnas = DNACollection.from_sequences(self._read_last_lines_bytes())
+        self.logger.info("Number DNA strings: %s", len(dnas))
+
+        return dnas
@@ -0,0 +1,257 @@
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Union
+
+import numpy as np
+
+from bioinformatics_textbook.dna import DNA
+from bioinformatics_textbook.dna_collection import DNACollection
+from bioinformatics_textbook.ch02.greedy_motif_search import GreedyMotifSearch
+
+
+class RandomizedMotifSearch(GreedyMotifSearch):
+    """Find motifs by randomized motif search and Gibbs sampling from many random restarts.
+
+    Each restart draws from its own random generator, seeded by the search seed and the restart number, so results
+    only depend on the seed and never on how restarts are spread across worker processes. Restarts are run in
+    rounds of a fixed size and examined in order, which keeps early stopping reproducible too.
+    """
+
+    # number of restarts run before checking whether the best score stopped improving
+    restarts_per_round = 128
+    # number of restarts per task submitted to a worker process
+    restarts_per_task = 16
+
+    def find_motifs_randomized(
+        self,
+        kmer_length: int,
+        dnas: list,
+        num_restarts: int = 1000,
+        num_workers: int = 1,
+        seed: int = 0,
+        patience: Optional[int] = None,
+    ) -> list[DNA]:
+        """Find the best motifs of a collection of DNA sequences by randomized motif search. Each restart starts from
+        random motifs and replaces them by the profile-most probable k-mers of their profile until the score stops
+        improving.
+
+        :param kmer_length: k-mer length
+        :type kmer_length: int
+        :param dnas: Collection of DNA sequences
+        :type dnas: Union[list, DNACollection]
+        :param num_restarts: Maximum number of random restarts, defaults to 1000
+        :type num_restarts: int
+        :param num_workers: Number of worker processes to run restarts in, defaults to 1
+        :type num_workers: int
+        :param seed: Seed of the random generators of the restarts, defaults to 0
+        :type seed: int
+        :param patience: Stop after this many consecutive restarts without a better score. If None, run all restarts, defaults to None
+        :type patience: Optional[int]
+        :return: One motif per DNA sequence
+        :rtype: list[DNA]
+        """
+        self.logger.info("Find motifs by randomized motif search.")
+
+        return self._find_best_motifs(
+            kmer_length, dnas, "randomized", num_restarts, num_workers, seed, patience, num_iterations=None
+        )
+
+    def find_motifs_gibbs(
+        self,
+        kmer_length: int,
+        dnas: list,
+        num_iterations: int,
+        num_restarts: int = 20,
+        num_workers: int = 1,
+        seed: int = 0,
+        patience: Optional[int] = None,
+    ) -> list[DNA]:
+        """Find the best motifs of a collection of DNA sequences with a Gibbs sampler. Each restart starts from random
+        motifs and, at every iteration, replaces the motif of a random sequence by a k-mer drawn with probability
+        proportional to its probability given the profile of the other motifs.
+
+        :param kmer_length: k-mer length
+        :type kmer_length: int
+        :param dnas: Collection of DNA sequences
+        :type dnas: Union[list, DNACollection]
+        :param num_iterations: Number of iterations of each restart
+        :type num_iterations: int
+        :param num_restarts: Maximum number of random restarts, defaults to 20
+        :type num_restarts: int
+        :param num_workers: Number of worker processes to run restarts in, defaults to 1
+        :type num_workers: int
+        :param seed: Seed of the random generators of the restarts, defaults to 0
+        :type seed: int
+        :param patience: Stop after this many consecutive restarts without a better score. If None, run all restarts, defaults to None
+        :type patience: Optional[int]
+        :return: One motif per DNA sequence
+        :rtype: list[DNA]
+        """
+        self.logger.info("Find motifs by Gibbs sampling.")
+
+        return self._find_best_motifs(
+            kmer_length, dnas, "gibbs", num_restarts, num_workers, seed, patience, num_iterations=num_iterations
+        )
+
+    def run_restarts(
+        self, windows: list, method: str, seed: int, start: int, end: int, num_iterations: Optional[int]
+    ) -> list:
+        """Run a range of restarts
+
+        :param windows: Encoded windows of each DNA sequence
+        :type windows: list
+        :param method: 'randomized' or 'gibbs'
+        :type method: str
+        :param seed: Seed of the search
+        :type seed: int
+        :param start: First restart number
+        :type start: int
+        :param end: Restart number after the end of the range
+        :type end: int
+        :param num_iterations: Number of Gibbs sampling iterations
+        :type num_iterations: Optional[int]
+        :return: Score and motif positions of each restart
+        :rtype: list
+        """
+        results = []
+        for restart in range(start, end):
+            rng = np.random.default_rng([seed, restart])
+            if method == "gibbs":
+                positions = self._sample_gibbs(windows=windows, num_iterations=num_iterations, rng=rng)
+            else:
+                positions = self._search_randomized(windows=windows, rng=rng)
+            results.append((self.score_motifs(self._select_motifs(windows, positions)), positions))
+
+        return results
+
+    def _find_best_motifs(
+        self,
+        kmer_length: int,
+        dnas: list,
+        method: str,
+        num_restarts: int,
+        num_workers: int,
+        seed: int,
+        patience: Optional[int],
+        num_iterations: Optional[int],
+    ) -> list[DNA]:
+        """Run restarts in rounds, optionally in a process pool, and keep the motifs with the lowest score. Ties go
+        to the earliest restart.
+
+        :return: One motif per DNA sequence
+        :rtype: list[DNA]
+        """
+        dnas = DNACollection.from_sequences(dnas)
+        windows = self._encode_collection_windows(dnas=dnas, kmer_length=kmer_length)
+
+        executor = None
+        if num_workers > 1:
+            executor = ProcessPoolExecutor(
+                max_workers=num_workers, initializer=_initialize_worker, initargs=(dnas, kmer_length)
+            )
+
+        best_score, best_positions = None, None
+        last_improvement = 0
+        try:
+            for round_start in range(0, num_restarts, self.restarts_per_round):
+                round_end = min(round_start + self.restarts_per_round, num_restarts)
+                tasks = [
+                    (method, seed, start, min(start + self.restarts_per_task, round_end), num_iterations)
+                    for start in range(round_start, round_end, self.restarts_per_task)
+                ]
+                if executor is None:
+                    task_results = [self.run_restarts(windows, *task) for task in tasks]
+                else:
+                    task_results = list(executor.map(_run_restarts, tasks))
+
+                restart_results = [result for results in task_results for result in results]
+                for restart, (score, positions) in enumerate(restart_results, start=round_start):
+                    if best_score is None or score < best_score:
+                        best_score, best_positions = score, positions
+                        last_improvement = restart
+                    elif patience is not None and restart - last_improvement >= patience:
+                        self.logger.info("Stop after restart %s without improvement since restart %s.", restart, last_improvement)
+                        return self._positions_to_motifs(dnas=dnas, positions=best_positions, kmer_length=kmer_length)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        self.logger.info("Best motif score: %s", best_score)
+
+        return self._positions_to_motifs(dnas=dnas, positions=best_positions, kmer_length=kmer_length)
+
+    def _search_randomized(self, windows: list, rng: np.random.Generator) -> list:
+        """Run one restart of randomized motif search
+
+        :return: Positions of the best motifs
+        :rtype: list
+        """
+        positions = [int(rng.integers(len(dna_windows))) for dna_windows in windows]
+        best_score = self.score_motifs(self._select_motifs(windows, positions))
+        while True:
+            log_profile = self._log(self.construct_profile(self._select_motifs(windows, positions), pseudocounts=True))
+            new_positions = [self._find_most_probable_window(dna_windows, log_profile) for dna_windows in windows]
+            score = self.score_motifs(self._select_motifs(windows, new_positions))
+            if score >= best_score:
+                return positions
+            positions, best_score = new_positions, score
+
+    def _sample_gibbs(self, windows: list, num_iterations: int, rng: np.random.Generator) -> list:
+        """Run one restart of the Gibbs sampler
+
+        :return: Positions of the best motifs
+        :rtype: list
+        """
+        positions = [int(rng.integers(len(dna_windows))) for dna_windows in windows]
+        best_positions = list(positions)
+        best_score = self.score_motifs(self._select_motifs(windows, positions))
+        for _ in range(num_iterations):
+            i = int(rng.integers(len(windows)))
+            other_motifs = self._select_motifs(windows[:i] + windows[i + 1:], positions[:i] + positions[i + 1:])
+            profile = self.construct_profile(other_motifs, pseudocounts=True)
+            probabilities = profile[windows[i], np.arange(windows[i].shape[1])].prod(axis=1)
+            positions[i] = int(rng.choice(len(probabilities), p=probabilities / probabilities.sum()))
+
+            score = self.score_motifs(self._select_motifs(windows, positions))
+            if score < best_score:
+                best_positions, best_score = list(positions), score
+
+        return best_positions
+
+    def _select_motifs(self, windows: list, positions: list) -> np.ndarray:
+        """Select one window of each DNA sequence
+
+        :return: Array of shape (number of motifs, k-mer length) of nucleotide codes
+        :rtype: np.ndarray
+        """
+        return np.stack([dna_windows[position] for dna_windows, position in zip(windows, positions)])
+
+
+# state of a randomized motif search worker process, set once by the pool initializer
+_worker_search = None
+_worker_windows = None
+
+
+def _initialize_worker(dnas: DNACollection, kmer_length: int) -> None:
+    """Encode the DNA sequences once per worker process
+
+    :param dnas: Collection of DNA sequences
+    :type dnas: DNACollection
+    :param kmer_length: k-mer length
+    :type kmer_length: int
+    """
+    global _worker_search, _worker_windows
+
+    _worker_search = RandomizedMotifSearch()
+    _worker_windows = _worker_search._encode_collection_windows(dnas=dnas, kmer_length=kmer_length)
+
+
+def _run_restarts(task: tuple) -> list:
+    """Run a task of restarts in a worker process
+
+    :param task: Method, seed, first and last restart numbers, and number of Gibbs sampling iterations
+    :type task: tuple
+    :return: Score and motif positions of each restart
+    :rtype: list
+    """
+    return _worker_search.run_restarts(_worker_windows, *task)
@@ -0,0 +1,120 @@
+"""window_index.py
+
+A module for computing distances between patterns and a fixed collection of DNA sequences through the DNAWindowIndex class
+"""
+
+import logging
+from typing import Iterable, Union
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from bioinformatics_textbook.dna_collection import NUCLEOTIDE_CODES, DNACollection
+
+
+def encode_dna(seq: str) -> np.ndarray:
+    """Encode a DNA sequence as an array of 2-bit nucleotide codes
+
+    :param seq: DNA sequence
+    :type seq: str
+    :return: Nucleotide codes (A=0, C=1, G=2, T=3)
+    :rtype: np.ndarray
+    """
+    return NUCLEOTIDE_CODES[np.frombuffer(seq.encode(), dtype=np.uint8)]
+
+
+def decode_kmer_numbers(numbers: np.ndarray, kmer_length: int) -> np.ndarray:
+    """Expand integer coded k-mers into rows of nucleotide codes
+
+    :param numbers: Integer codes of k-mers
+    :type numbers: np.ndarray
+    :param kmer_length: k-mer length
+    :type kmer_length: int
+    :return: Array of shape (number of k-mers, k-mer length) of nucleotide codes
+    :rtype: np.ndarray
+    """
+    shifts = 2 * np.arange(kmer_length - 1, -1, -1, dtype=np.int64)
+
+    return ((np.asarray(numbers, dtype=np.int64)[:, None] >> shifts) & 3).astype(np.uint8)
+
+
+class DNAWindowIndex:
+    """Every k-mer window of every string of a DNA collection, encoded once as a 2D uint8 matrix.
+
+    Windows of each DNA sequence are stored in a contiguous block of rows, so the distance of a pattern to each
+    sequence is the minimum over its block of the pattern's Hamming distances to the rows.
+    """
+
+    # maximum number of bytes of the pattern by window comparison matrix computed at once
+    max_batch_bytes = 1 << 26
+
+    def __init__(
+        self,
+        dnas: Union[Iterable[str], DNACollection],
+        kmer_length: int,
+        logger: logging.Logger = logging.getLogger(__name__),
+    ) -> None:
+        self.kmer_length = kmer_length
+        self.logger = logger
+
+        self.logger.info("Index windows of length %s of the DNA sequences.", kmer_length)
+
+        collection = DNACollection.from_sequences(dnas)
+        blocks = []
+        self.num_short_dnas = 0
+        for i in range(len(collection)):
+            codes = collection.codes(i)
+            if len(codes) < kmer_length:
+                # a sequence with no windows is at the maximum distance from every pattern
+                self.num_short_dnas += 1
+                continue
+            # a pattern's distance to a sequence only depends on its distinct windows
+            blocks.append(np.unique(sliding_window_view(codes, kmer_length), axis=0))
+
+        self.windows = np.concatenate(blocks) if blocks else np.empty((0, kmer_length), dtype=np.uint8)
+        self.offsets = np.cumsum([0] + [len(block) for block in blocks[:-1]]) if blocks else np.empty(0, dtype=np.int64)
+
+    def compute_distances(self, patterns: np.ndarray) -> np.ndarray:
+        """Compute the distance between each of a batch of patterns and the DNA sequences
+
+        :param patterns: Array of shape (number of patterns, k-mer length) of nucleotide codes
+        :type patterns: np.ndarray
+        :return: Distance of each pattern
+        :rtype: np.ndarray
+        """
+        distances = np.full(len(patterns), self.kmer_length * self.num_short_dnas, dtype=np.int64)
+        if not len(self.windows):
+            return distances
+
+        batch_size = max(self.max_batch_bytes // max(self.windows.size, 1), 1)
+        for start in range(0, len(patterns), batch_size):
+            batch = patterns[start: start + batch_size]
+            # broadcast to (patterns, windows, k-mer length) and count mismatches of each pattern and window
+            hamming_distances = (batch[:, None, :] != self.windows[None, :, :]).sum(axis=2, dtype=np.int64)
+            dna_distances = np.minimum.reduceat(hamming_distances, self.offsets, axis=1)
+            distances[start: start + batch_size] += dna_distances.sum(axis=1)
+
+        return distances
+
+    def compute_pattern_distance(self, pattern: str) -> int:
+        """Compute the distance between a single pattern and the DNA sequences
+
+        :param pattern: k-mer
+        :type pattern: str
+        :return: Distance between pattern and DNA sequences
+        :rtype: int
+        """
+        return int(self.compute_distances(encode_dna(str(pattern))[None, :])[0])
+
+    def compute_prefix_bound(self, prefix_mismatches: np.ndarray) -> int:
+        """Compute the lower bound on the distance of patterns that extend a prefix
+
+        :param prefix_mismatches: Mismatches between the prefix and the prefix of each window
+        :type prefix_mismatches: np.ndarray
+        :return: Sum over DNA sequences of the minimum mismatches of their windows
+        :rtype: int
+        """
+        if not len(self.windows):
+            return 0
+
+        return int(np.minimum.reduceat(prefix_mismatches, self.offsets).sum())
@@ -0,0 +1,118 @@
+"""checkpoint.py
+
+A module for saving and resuming the progress of long running searches through the SearchCheckpoint class
+"""
+
+import base64
+import json
+import logging
+import os
+import time
+import zlib
+from typing import Optional
+
+
+class SearchCheckpoint:
+    """JSON checkpoint file of the progress of a search.
+
+    A checkpoint holds a description of the search, e.g. its parameters and a fingerprint of its input, and the state
+    the search needs to continue, e.g. the work completed and the best results so far. States are only loaded back for
+    the same search, so a checkpoint cannot be resumed with different inputs.
+
+    Saves are throttled to one per `interval` seconds unless forced, and each save writes a temporary file that
+    atomically replaces the previous checkpoint, so an interrupted save never leaves a partial checkpoint behind.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        interval: float = 60.0,
+        resume: bool = False,
+        logger: logging.Logger = logging.getLogger(__name__),
+    ) -> None:
+        """Initialize the checkpoint object
+
+        :param path: Path of the checkpoint file
+        :type path: str
+        :param interval: Minimum number of seconds between saves that are not forced, defaults to 60.0
+        :type interval: float
+        :param resume: Load the state of an existing checkpoint file, defaults to False
+        :type resume: bool
+        :param logger: Logger, defaults to logging.getLogger(__name__)
+        :type logger: logging.Logger
+        """
+        self.path = path
+        self.interval = interval
+        self.resume = resume
+        self.logger = logger
+
+        self._last_save = time.monotonic()
+
+    def load(self, search: dict) -> Optional[dict]:
+        """Load the state of a search
+
+        :param search: Description of the search
+        :type search: dict
+        :raises ValueError: If the checkpoint file was written by a different search
+        :return: State of the search, or None if not resuming or there is no checkpoint file
+        :rtype: Optional[dict]
+        """
+        if not self.resume or not os.path.exists(self.path):
+            return None
+
+        with open(self.path, "r") as f:
+            checkpoint = json.load(f)
+
+        if checkpoint["search"] != search:
+            raise ValueError(f"Checkpoint {self.path} was written by a different search: {checkpoint['search']}")
+
+        self.logger.info("Resume search from checkpoint %s.", self.path)
+
+        return checkpoint["state"]
+
+    def save(self, search: dict, state: dict, force: bool = False) -> None:
+        """Save the state of a search, if forced or the save interval has passed since the last save
+
+        :param search: Description of the search
+        :type search: dict
+        :param state: State of the search
+        :type state: dict
+        :param force: Save regardless of the save interval, defaults to False
+        :type force: bool
+        """
+        if not force and time.monotonic() - self._last_save < self.interval:
+            return
+
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w") as f:
+            json.dump({"search": search, "state": state}, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.path)
+
+        self._last_save = time.monotonic()
+        self.logger.debug("Saved checkpoint %s.", self.path)
+
+
+def encode_bitmap(bitmap: int) -> str:
+    """Encode a bitmap as compressed base64 text for a checkpoint
+
+    :param bitmap: Bitmap
+    :type bitmap: int
+    :return: Encoded bitmap
+    :rtype: str
+    """
+    data = bitmap.to_bytes((bitmap.bit_length() + 7) // 8, "little")
+
+    return base64.b64encode(zlib.compress(data)).decode()
+
+
+def decode_bitmap(text: str) -> int:
+    """Decode a bitmap encoded by encode_bitmap
+
+    :param text: Encoded bitmap
+    :type text: str
+    :return: Bitmap
+    :rtype: int
+    """
+    return int.from_bytes(zlib.decompress(base64.b64decode(text)), "little")
@@ -1,9 +1,14 @@
+import importlib
 import logging
+import sys
 
 import click
 
 import bioinformatics_textbook
 
+# name of the console handler of the root logger created by the CLI
+CONSOLE_HANDLER_NAME = "bioinformatics_textbook.console"
+
 
 class Config(object):
     def __init__(self):
@@ -13,262 +18,104 @@ class Config(object):
 
 pass_config = click.make_pass_decorator(Config, ensure=True)
 
-
-@click.group()
+# module and name of the command function of each subcommand
+LAZY_COMMANDS = {
+    "ba1a": "bioinformatics_textbook.commands.ch01:ba1a",
+    "ba1b": "bioinformatics_textbook.commands.ch01:ba1b",
+    "ba1c": "bioinformatics_textbook.commands.ch01:ba1c",
+    "ba1d": "bioinformatics_textbook.commands.ch01:ba1d",
+    "ba1e": "bioinformatics_textbook.commands.ch01:ba1e",
+    "ba1f": "bioinformatics_textbook.commands.ch01:ba1f",
+    "ba1g": "bioinformatics_textbook.commands.ch01:ba1g",
+    "ba1h": "bioinformatics_textbook.commands.ch01:ba1h",
+    "ba1i": "bioinformatics_textbook.commands.ch01:ba1i",
+    "ba1j": "bioinformatics_textbook.commands.ch01:ba1j",
+    "ba1n": "bioinformatics_textbook.commands.ch01:ba1n",
+    "kmer-spectrum": "bioinformatics_textbook.commands.ch01:kmer_spectrum",
+    "ba2a": "bioinformatics_textbook.commands.ch02:ba2a",
+    "ba2b": "bioinformatics_textbook.commands.ch02:ba2b",
+    "ba2c": "bioinformatics_textbook.commands.ch02:ba2c",
+    "ba2d": "bioinformatics_textbook.commands.ch02:ba2d",
+    "ba2e": "bioinformatics_textbook.commands.ch02:ba2e",
+    "ba2f": "bioinformatics_textbook.commands.ch02:ba2f",
+    "ba2g": "bioinformatics_textbook.commands.ch02:ba2g",
+    "ba2h": "bioinformatics_textbook.commands.ch02:ba2h",
+    "batch": "bioinformatics_textbook.commands.tools:batch",
+    "query": "bioinformatics_textbook.commands.tools:query",
+    "serve": "bioinformatics_textbook.commands.tools:serve",
+    "two-bit": "bioinformatics_textbook.commands.tools:two_bit",
+}
+
+
+class LazyGroup(click.Group):
+    """Click group whose subcommands are imported from their modules when they are looked up.
+
+    Command modules only import the package, whose chapters are imported on first access, so starting the CLI and
+    listing its commands stays cheap, and running a command imports only what that command uses.
+    """
+
+    def __init__(self, *args, lazy_commands: dict = None, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = lazy_commands or {}
+
+    def list_commands(self, ctx: click.Context) -> list:
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_commands))
+
+    def get_command(self, ctx: click.Context, cmd_name: str):
+        if cmd_name in self.lazy_commands:
+            return self._load_command(cmd_name)
+
+        return super().get_command(ctx, cmd_name)
+
+    def _load_command(self, cmd_name: str) -> click.Command:
+        """Import the command function of a subcommand
+
+        :param cmd_name: Name of the subcommand
+        :type cmd_name: str
+        :return: The command
+        :rtype: click.Command
+        """
+        module_name, attribute = self.lazy_commands[cmd_name].split(":")
+        command = getattr(importlib.import_module(module_name), attribute)
+        if not isinstance(command, click.Command):
+            raise TypeError(f"{self.lazy_commands[cmd_name]} is not a click command.")
+
+        return command
+
+
+@click.group(cls=LazyGroup, lazy_commands=LAZY_COMMANDS)
 @click.option("--verbose", "-v", is_flag=True, help="Print more logging messages.")
+@click.option(
+    "--output",
+    "-o",
+    type=click.File("w"),
+    default=None,
+    help="File to write solutions to instead of standard output.",
+)
 @pass_config
-def cli(config, verbose):
+@click.pass_context
+def cli(ctx, config, verbose, output):
     """Run commands from cfb_rankings_analysis module."""
     config.verbose = verbose
     config.logger = create_root_logger(verbose)
 
-    config.logger.info("Start CLI program.")
-
-
-@cli.command()
-@click.argument("input_file", type=click.File("rb"))
-@pass_config
-def ba1a(config, input_file):
-    """
-    Program to solve Rosalind problem BA1A: Compute the Number of Times a Pattern Appears in a Text
-
-    https://rosalind.info/problems/ba1a/
-    """
-    config.logger.info(
-        "Run command to solve BA1A: Compute the Number of Times a Pattern Appears in a Text"
-    )
-
-    dataset = bioinformatics_textbook.ch01.pattern_occurrences.TextPattern(input_file)
-    bioinformatics_textbook.ch01.BA1A(dataset=dataset)
-
-    config.logger.info(
-        "Finished command to solve BA1A: Compute the Number of Times a Pattern Appears in a Text"
-    )
-
-
-@cli.command()
-@click.argument("input_file", type=click.File("rb"))
-@pass_config
-def ba1b(config, input_file):
-    """
-    Program to solve Rosalind problem BA1B: Find the Most Frequent Words in a String
-
-    https://rosalind.info/problems/ba1b/
-    """
-    config.logger.info(
-        "Run command to solve BA1B: Find the most frequent words in a string"
-    )
-
-    dataset = bioinformatics_textbook.ch01.frequent_words.TextKmerLength(input_file)
-    bioinformatics_textbook.ch01.BA1B(dataset=dataset)
-
-    config.logger.info(
-        "Finished command to solve BA1B: Found the most frequent words in a string"
-    )
-
-
-@cli.command()
-@click.argument("input_file", type=click.File("r"))
-@pass_config
-def ba1c(config, input_file):
-    """
-    Program to solve Rosalind problem BA1C: Find the Reverse Complement of a String
-
-    https://rosalind.info/problems/ba1c/
-    """
-    config.logger.info("Find the reverse complement of a string")
-
-    dataset = bioinformatics_textbook.ch01.reverse_complement.Pattern(input_file)
-    bioinformatics_textbook.ch01.BA1C(dataset=dataset)
-
-    config.logger.info("Found the reverse complement of a string")
-
-
-@cli.command()
-@click.argument("input_file", type=click.File("rb"))
-@pass_config
-def ba1d(config, input_file):
-    """
-    Program to solve Rosalind problem BA1D: Find All Occurrences of a Pattern in a String
-
-    https://rosalind.info/problems/ba1d/
-    """
-    config.logger.info("Find all occurrences of a pattern in a string")
-
-    dataset = bioinformatics_textbook.ch01.pattern_occurrences.PatternGenome(input_file)
-    bioinformatics_textbook.ch01.BA1D(dataset=dataset)
-
-    config.logger.info("Found all occurrences of a pattern in a string")
-
-
-@cli.command()
-@click.argument("input_file", type=click.File("rb"))
-@pass_config
-def ba1e(config, input_file):
-    """
-    Program to solve Rosalind problem BA1E: Find Patterns Forming Clumps in a String
-
-    https://rosalind.info/problems/ba1e/
-    """
-    config.logger.info("Run CLI command to solve BA1E")
-
-    clump_patterns = bioinformatics_textbook.ch01.ch01.ba1e(input_file)
-    click.echo(clump_patterns)
-
-    config.logger.info("Finished CLI command to solve BA1E")
-
-
-@cli.command()
-@click.argument("input_file", type=click.File("r"))
-@pass_config
-def ba1f(config, input_file):
-    """Program to solve Rosalind problem BA1F: Find a Position in a Genome Minimizing the Skew.
-
-    https://rosalind.info/problems/ba1f/
-    """
-    config.logger.info("Run CLI command to solve BA1F")
-
-    min_skew_positions = bioinformatics_textbook.ch01.ch01.ba1f(input_file)
-    click.echo(min_skew_positions)
-
-    config.logger.info("Finished CLI command to solve BA1F")
-
-
-@cli.command()
-@click.argument("input_file", type=click.File("rb"))
-@pass_config
-def ba1g(config, input_file):
-    """Program to solve Rosalind problem BA1G: Compute the Hamming Distance Between Two Strings
-
-    https://rosalind.info/problems/ba1g/
-    """
-    config.logger.info("Run CLI command to solve BA1G")
-
-    hamming_distance = bioinformatics_textbook.ch01.ch01.ba1g(input_file)
-    click.echo(hamming_distance)
-
-    config.logger.info("Finished CLI command to solve BA1G")
-
-
-@cli.command()
-@click.argument("input_file", type=click.File("rb"))
-@pass_config
-def ba1h(config, input_file):
-    """Program to solve Rosalind problem BA1H: Find All Approximate Occurrences of a Pattern in a String
-
-    https://rosalind.info/problems/ba1h/
-    """
-    config.logger.info("Run CLI command to solve BA1H")
-
-    approx_occurrence_positions = bioinformatics_textbook.ch01.ch01.ba1h(input_file)
-    click.echo(approx_occurrence_positions)
-
-    config.logger.info("Finished CLI command to solve BA1H")
-
-
-@cli.command()
-@click.argument("input_file", type=click.File("rb"))
-@pass_config
-def ba1i(config, input_file):
-    """Program to solve Rosalind problem BA1I: Find the Most Frequent Words with Mismatches in a String
-
-    https://rosalind.info/problems/ba1i/
-    """
-    config.logger.info(
-        "Run command to solve BA1I: Find the Most Frequent Words with Mismatches in a String"
-    )
-
-    dataset = bioinformatics_textbook.ch01.frequent_words.TextKmerLengthHammingDist(
-        input_file
-    )
-    bioinformatics_textbook.ch01.BA1I(dataset=dataset)
-
-    config.logger.info(
-        "Finished command to solve BA1I: Find the Most Frequent Words with Mismatches in a String"
-    )
-
-
-@cli.command()
-@click.argument("input_file", type=click.File("rb"))
-@pass_config
-def ba1j(config, input_file):
-    """Program to solve Rosalind problem BA1J: Find Frequent Words with Mismatches and Reverse Complements
-
-    https://rosalind.info/problems/ba1j/
-    """
-    config.logger.info(
-        "Run command to solve BA1J: Find Frequent Words with Mismatches and Reverse Complements"
-    )
+    if output is not None:
+        ctx.meta[bioinformatics_textbook.inout.OUTPUT_FILE_KEY] = output
 
-    dataset = bioinformatics_textbook.ch01.frequent_words.TextKmerLengthHammingDist(
-        input_file
-    )
-    bioinformatics_textbook.ch01.BA1J(dataset=dataset)
-
-    config.logger.info(
-        "Finished command to solve BA1J: Find Frequent Words with Mismatches and Reverse Complements"
-    )
-
-
-@cli.command()
-@click.argument("input_file", type=click.File("rb"))
-@pass_config
-def ba1n(config, input_file):
-    """Program to solve Rosalind problem BA1N: Generate the d-Neighborhood of a String
-
-    https://rosalind.info/problems/ba1n/
-    """
-    config.logger.info(
-        "Run CLI command to solve BA1N: Generate the d-Neighborhood of a String"
-    )
-
-    dataset = bioinformatics_textbook.ch01.frequent_words.PatternHammingDist(input_file)
-    bioinformatics_textbook.ch01.BA1N(dataset=dataset)
-
-    config.logger.info(
-        "Finished CLI command to solve BA1N: Generate the d-Neighborhood of a String"
-    )
-
-
-@cli.command()
-@click.argument("input_file", type=click.File("rb"))
-@pass_config
-def ba2a(config, input_file):
-    """Program to solve Rosalind problem BA2A: Implement MotifEnumeration
-
-    https://rosalind.info/problems/ba2a/
-    """
-    config.logger.info("Run CLI command to solve BA2A: Implement MotifEnumeration")
-    dataset = bioinformatics_textbook.ch02.motif.KDDNA(input_file)
-    bioinformatics_textbook.ch02.BA2A(dataset=dataset)
-
-
-@cli.command()
-@click.argument("input_file", type=click.File("rb"))
-@pass_config
-def ba2b(config, input_file):
-    """Program to solve Rosalind problem BA2B: Find a median string
-
-    https://rosalind.info/problems/ba2h/
-    """
-    config.logger.info("Run CLI command to solve BA2B: Find a Median String")
-    dataset = bioinformatics_textbook.ch02.median_string.KDNAs(input_file)
-    bioinformatics_textbook.ch02.BA2B(dataset=dataset)
+    config.logger.info("Start CLI program.")
 
 
-@cli.command()
-@click.argument("input_file", type=click.File("rb"))
-@pass_config
-def ba2h(config, input_file):
-    """Program to solve Rosalind problem BA2H: Implement DistanceBetweenPatternAndStrings
-
-    https://rosalind.info/problems/ba2h/
-    """
-    config.logger.info(
-        "Run CLI command to solve BA2H: Implement DistanceBetweenPatternAndStrings"
-    )
-    dataset = bioinformatics_textbook.ch02.median_string.PatternDNAs(input_file)
-    bioinformatics_textbook.ch02.BA2H(dataset=dataset)
+def sequence_file_option(command):
+    """Option of commands whose DNA strings can be read from a FASTA, FASTQ, or 2-bit file"""
+    return click.option(
+        "--sequence-file",
+        type=click.File("rb"),
+        default=None,
+        help=(
+            "FASTA, FASTQ, or 2-bit file to read the DNA strings from. The input file then only holds the other "
+            "values."
+        ),
+    )(command)
 
 
 def create_root_logger(verbose):
@@ -279,6 +126,13 @@ def create_root_logger(verbose):
     logger = logging.getLogger()
     logger.setLevel(logging.INFO)
 
+    # reuse the handlers of an earlier call in the same process, e.g. by a batch worker, instead of duplicating them
+    for handler in logger.handlers:
+        if handler.get_name() == CONSOLE_HANDLER_NAME:
+            handler.setLevel(set_handler_level(verbose))
+            handler.setStream(sys.stderr)
+            return logger
+
     # create a file handler
     file_handler = logging.FileHandler(".log")
     file_handler.setLevel(logging.DEBUG)
@@ -286,6 +140,7 @@ def create_root_logger(verbose):
     # create a console handler
     console_handler = logging.StreamHandler()
     console_handler.setLevel(set_handler_level(verbose))
+    console_handler.set_name(CONSOLE_HANDLER_NAME)
 
     # create formatter and add to handlers
     formatter = logging.Formatter(
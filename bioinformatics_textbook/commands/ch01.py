@@ -0,0 +1,269 @@
+"""ch01.py
+
+CLI commands of the chapter 1 problems, loaded by the CLI group when one of them is run
+"""
+
+import click
+
+import bioinformatics_textbook
+from bioinformatics_textbook.cli import pass_config, sequence_file_option
+
+
+@click.command()
+@click.argument("input_file", type=click.File("rb"))
+@pass_config
+def ba1a(config, input_file):
+    """
+    Program to solve Rosalind problem BA1A: Compute the Number of Times a Pattern Appears in a Text
+
+    https://rosalind.info/problems/ba1a/
+    """
+    config.logger.info(
+        "Run command to solve BA1A: Compute the Number of Times a Pattern Appears in a Text"
+    )
+
+    dataset = bioinformatics_textbook.ch01.pattern_occurrences.TextPattern(input_file)
+    bioinformatics_textbook.ch01.BA1A(dataset=dataset)
+
+    config.logger.info(
+        "Finished command to solve BA1A: Compute the Number of Times a Pattern Appears in a Text"
+    )
+
+
+@click.command()
+@click.argument("input_file", type=click.File("rb"))
+@click.option(
+    "--num-workers",
+    "-j",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Number of worker processes to count k-mers with.",
+)
+@click.option(
+    "--max-kmer-length",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Report the most frequent words of every k-mer length from the dataset's k up to this length.",
+)
+@sequence_file_option
+@pass_config
+def ba1b(config, input_file, num_workers, max_kmer_length, sequence_file):
+    """
+    Program to solve Rosalind problem BA1B: Find the Most Frequent Words in a String
+
+    With --max-kmer-length, one line is reported per k-mer length in the form "k: k-mers". All lengths are counted
+    from one suffix array in a single process, so it cannot be combined with --num-workers.
+
+    https://rosalind.info/problems/ba1b/
+    """
+    config.logger.info(
+        "Run command to solve BA1B: Find the most frequent words in a string"
+    )
+
+    if max_kmer_length is not None and num_workers > 1:
+        raise click.UsageError("--num-workers cannot be combined with --max-kmer-length.")
+
+    dataset = bioinformatics_textbook.ch01.frequent_words.TextKmerLength(input_file, sequence_file=sequence_file)
+    if max_kmer_length is not None and max_kmer_length < dataset.kmer_length:
+        raise click.BadParameter(
+            f"{max_kmer_length} is smaller than the dataset's k-mer length {dataset.kmer_length}.",
+            param_hint="'--max-kmer-length'",
+        )
+
+    bioinformatics_textbook.ch01.BA1B(
+        dataset=dataset, num_workers=num_workers, max_kmer_length=max_kmer_length
+    )
+
+    config.logger.info(
+        "Finished command to solve BA1B: Found the most frequent words in a string"
+    )
+
+
+@click.command()
+@click.argument("input_file", type=click.File("rb"))
+@sequence_file_option
+@pass_config
+def kmer_spectrum(config, input_file, sequence_file):
+    """
+    Compute the k-mer abundance spectrum of a string.
+
+    The input file has the same format as for BA1B: a DNA string followed by the k-mer length on the last line.
+    Output is a two column, tab separated table of each count and the number of distinct k-mers with that count.
+    """
+    config.logger.info("Run command to compute the k-mer abundance spectrum of a string")
+
+    dataset = bioinformatics_textbook.ch01.frequent_words.TextKmerLength(input_file, sequence_file=sequence_file)
+    bioinformatics_textbook.ch01.KmerSpectrum(dataset=dataset)
+
+    config.logger.info("Finished command to compute the k-mer abundance spectrum of a string")
+
+
+@click.command()
+@click.argument("input_file", type=click.File("rb"))
+@pass_config
+def ba1c(config, input_file):
+    """
+    Program to solve Rosalind problem BA1C: Find the Reverse Complement of a String
+
+    https://rosalind.info/problems/ba1c/
+    """
+    config.logger.info("Find the reverse complement of a string")
+
+    dataset = bioinformatics_textbook.ch01.reverse_complement.Pattern(input_file)
+    bioinformatics_textbook.ch01.BA1C(dataset=dataset)
+
+    config.logger.info("Found the reverse complement of a string")
+
+
+@click.command()
+@click.argument("input_file", type=click.File("rb"))
+@sequence_file_option
+@pass_config
+def ba1d(config, input_file, sequence_file):
+    """
+    Program to solve Rosalind problem BA1D: Find All Occurrences of a Pattern in a String
+
+    https://rosalind.info/problems/ba1d/
+    """
+    config.logger.info("Find all occurrences of a pattern in a string")
+
+    dataset = bioinformatics_textbook.ch01.pattern_occurrences.PatternGenome(input_file, sequence_file=sequence_file)
+    bioinformatics_textbook.ch01.BA1D(dataset=dataset)
+
+    config.logger.info("Found all occurrences of a pattern in a string")
+
+
+@click.command()
+@click.argument("input_file", type=click.File("rb"))
+@pass_config
+def ba1e(config, input_file):
+    """
+    Program to solve Rosalind problem BA1E: Find Patterns Forming Clumps in a String
+
+    https://rosalind.info/problems/ba1e/
+    """
+    config.logger.info("Run CLI command to solve BA1E")
+
+    clump_patterns = bioinformatics_textbook.ch01.ch01.ba1e(input_file)
+    bioinformatics_textbook.inout.write_answer(clump_patterns)
+
+    config.logger.info("Finished CLI command to solve BA1E")
+
+
+@click.command()
+@click.argument("input_file", type=click.File("rb"))
+@pass_config
+def ba1f(config, input_file):
+    """Program to solve Rosalind problem BA1F: Find a Position in a Genome Minimizing the Skew.
+
+    https://rosalind.info/problems/ba1f/
+    """
+    config.logger.info("Run CLI command to solve BA1F")
+
+    min_skew_positions = bioinformatics_textbook.ch01.ch01.ba1f(input_file)
+    bioinformatics_textbook.inout.write_answer(min_skew_positions)
+
+    config.logger.info("Finished CLI command to solve BA1F")
+
+
+@click.command()
+@click.argument("input_file", type=click.File("rb"))
+@pass_config
+def ba1g(config, input_file):
+    """Program to solve Rosalind problem BA1G: Compute the Hamming Distance Between Two Strings
+
+    https://rosalind.info/problems/ba1g/
+    """
+    config.logger.info("Run CLI command to solve BA1G")
+
+    hamming_distance = bioinformatics_textbook.ch01.ch01.ba1g(input_file)
+    bioinformatics_textbook.inout.write_answer(hamming_distance)
+
+    config.logger.info("Finished CLI command to solve BA1G")
+
+
+@click.command()
+@click.argument("input_file", type=click.File("rb"))
+@pass_config
+def ba1h(config, input_file):
+    """Program to solve Rosalind problem BA1H: Find All Approximate Occurrences of a Pattern in a String
+
+    https://rosalind.info/problems/ba1h/
+    """
+    config.logger.info("Run CLI command to solve BA1H")
+
+    approx_occurrence_positions = bioinformatics_textbook.ch01.ch01.ba1h(input_file)
+    bioinformatics_textbook.inout.write_answer(approx_occurrence_positions)
+
+    config.logger.info("Finished CLI command to solve BA1H")
+
+
+@click.command()
+@click.argument("input_file", type=click.File("rb"))
+@pass_config
+def ba1i(config, input_file):
+    """Program to solve Rosalind problem BA1I: Find the Most Frequent Words with Mismatches in a String
+
+    https://rosalind.info/problems/ba1i/
+    """
+    config.logger.info(
+        "Run command to solve BA1I: Find the Most Frequent Words with Mismatches in a String"
+    )
+
+    dataset = bioinformatics_textbook.ch01.frequent_words.TextKmerLengthHammingDist(
+        input_file
+    )
+    bioinformatics_textbook.ch01.BA1I(dataset=dataset)
+
+    config.logger.info(
+        "Finished command to solve BA1I: Find the Most Frequent Words with Mismatches in a String"
+    )
+
+
+@click.command()
+@click.argument("input_file", type=click.File("rb"))
+@click.option(
+    "--max-table-size",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Maximum number of k-mer counts to hold in memory before spilling them to temporary files.",
+)
+@pass_config
+def ba1j(config, input_file, max_table_size):
+    """Program to solve Rosalind problem BA1J: Find Frequent Words with Mismatches and Reverse Complements
+
+    https://rosalind.info/problems/ba1j/
+    """
+    config.logger.info(
+        "Run command to solve BA1J: Find Frequent Words with Mismatches and Reverse Complements"
+    )
+
+    dataset = bioinformatics_textbook.ch01.frequent_words.TextKmerLengthHammingDist(
+        input_file
+    )
+    bioinformatics_textbook.ch01.BA1J(dataset=dataset, max_table_size=max_table_size)
+
+    config.logger.info(
+        "Finished command to solve BA1J: Find Frequent Words with Mismatches and Reverse Complements"
+    )
+
+
+@click.command()
+@click.argument("input_file", type=click.File("rb"))
+@pass_config
+def ba1n(config, input_file):
+    """Program to solve Rosalind problem BA1N: Generate the d-Neighborhood of a String
+
+    https://rosalind.info/problems/ba1n/
+    """
+    config.logger.info(
+        "Run CLI command to solve BA1N: Generate the d-Neighborhood of a String"
+    )
+
+    dataset = bioinformatics_textbook.ch01.frequent_words.PatternHammingDist(input_file)
+    bioinformatics_textbook.ch01.BA1N(dataset=dataset)
+
+    config.logger.info(
+        "Finished CLI command to solve BA1N: Generate the d-Neighborhood of a String"
+    )
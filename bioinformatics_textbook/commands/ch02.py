@@ -0,0 +1,234 @@
+"""ch02.py
+
+CLI commands of the chapter 2 problems, loaded by the CLI group when one of them is run
+"""
+
+import click
+
+import bioinformatics_textbook
+from bioinformatics_textbook.cli import pass_config, sequence_file_option
+
+
+def checkpoint_options(command):
+    """Options shared by commands whose searches can be checkpointed and resumed"""
+    command = click.option(
+        "--checkpoint-interval",
+        type=click.FloatRange(min=0),
+        default=60.0,
+        show_default=True,
+        help="Minimum number of seconds between checkpoint saves.",
+    )(command)
+    command = click.option(
+        "--resume", is_flag=True, help="Continue the search from the checkpoint file, if it exists."
+    )(command)
+    command = click.option(
+        "--checkpoint",
+        type=click.Path(dir_okay=False, writable=True),
+        default=None,
+        help="File to periodically save the progress of the search to.",
+    )(command)
+
+    return command
+
+
+def create_checkpoint(checkpoint, resume, checkpoint_interval):
+    """
+    Create the checkpoint of a search from the checkpoint options
+    """
+    if checkpoint is None:
+        if resume:
+            raise click.UsageError("--resume requires --checkpoint.")
+        return None
+
+    return bioinformatics_textbook.checkpoint.SearchCheckpoint(
+        path=checkpoint, interval=checkpoint_interval, resume=resume
+    )
+
+@click.command()
+@click.argument("input_file", type=click.File("rb"))
+@checkpoint_options
+@pass_config
+def ba2a(config, input_file, checkpoint, resume, checkpoint_interval):
+    """Program to solve Rosalind problem BA2A: Implement MotifEnumeration
+
+    https://rosalind.info/problems/ba2a/
+    """
+    config.logger.info("Run CLI command to solve BA2A: Implement MotifEnumeration")
+    search_checkpoint = create_checkpoint(checkpoint, resume, checkpoint_interval)
+    dataset = bioinformatics_textbook.ch02.motif.KDDNA(input_file)
+    bioinformatics_textbook.ch02.BA2A(dataset=dataset, checkpoint=search_checkpoint)
+
+
+@click.command()
+@click.argument("input_file", type=click.File("rb"))
+@click.option(
+    "--num-workers",
+    "-j",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Number of worker processes to search k-mers with.",
+)
+@checkpoint_options
+@sequence_file_option
+@pass_config
+def ba2b(config, input_file, num_workers, checkpoint, resume, checkpoint_interval, sequence_file):
+    """Program to solve Rosalind problem BA2B: Find a median string
+
+    https://rosalind.info/problems/ba2h/
+    """
+    config.logger.info("Run CLI command to solve BA2B: Find a Median String")
+    search_checkpoint = create_checkpoint(checkpoint, resume, checkpoint_interval)
+    dataset = bioinformatics_textbook.ch02.median_string.KDNAs(input_file, sequence_file=sequence_file)
+    bioinformatics_textbook.ch02.BA2B(dataset=dataset, num_workers=num_workers, checkpoint=search_checkpoint)
+
+
+@click.command()
+@click.argument("input_file", type=click.File("rb"))
+@pass_config
+def ba2c(config, input_file):
+    """Program to solve Rosalind problem BA2C: Find a Profile-most Probable k-mer in a String
+
+    https://rosalind.info/problems/ba2c/
+    """
+    config.logger.info(
+        "Run CLI command to solve BA2C: Find a Profile-most Probable k-mer in a String"
+    )
+    dataset = bioinformatics_textbook.ch02.greedy_motif_search.TextKProfile(input_file)
+    bioinformatics_textbook.ch02.BA2C(dataset=dataset)
+
+
+def read_ktdnas(input_file):
+    """Read a dataset of a k-mer length and DNA strings, reporting invalid DNA strings as usage errors"""
+    dataset = bioinformatics_textbook.ch02.greedy_motif_search.KTDNAs(input_file)
+    try:
+        dataset.dnas
+    except ValueError as error:
+        raise click.UsageError(str(error))
+
+    return dataset
+
+
+@click.command()
+@click.argument("input_file", type=click.File("rb"))
+@pass_config
+def ba2d(config, input_file):
+    """Program to solve Rosalind problem BA2D: Implement GreedyMotifSearch
+
+    https://rosalind.info/problems/ba2d/
+    """
+    config.logger.info("Run CLI command to solve BA2D: Implement GreedyMotifSearch")
+    dataset = read_ktdnas(input_file)
+    bioinformatics_textbook.ch02.BA2D(dataset=dataset)
+
+
+@click.command()
+@click.argument("input_file", type=click.File("rb"))
+@pass_config
+def ba2e(config, input_file):
+    """Program to solve Rosalind problem BA2E: Implement GreedyMotifSearch with Pseudocounts
+
+    https://rosalind.info/problems/ba2e/
+    """
+    config.logger.info(
+        "Run CLI command to solve BA2E: Implement GreedyMotifSearch with Pseudocounts"
+    )
+    dataset = read_ktdnas(input_file)
+    bioinformatics_textbook.ch02.BA2E(dataset=dataset)
+
+
+def restart_options(default_num_restarts):
+    """Options shared by commands that search for motifs from random restarts"""
+
+    def decorator(command):
+        command = click.option(
+            "--patience",
+            type=click.IntRange(min=1),
+            default=None,
+            help="Stop after this many consecutive restarts without a better score.",
+        )(command)
+        command = click.option(
+            "--seed", type=int, default=0, show_default=True, help="Seed of the random restarts."
+        )(command)
+        command = click.option(
+            "--num-workers",
+            "-j",
+            type=click.IntRange(min=1),
+            default=1,
+            show_default=True,
+            help="Number of worker processes to run restarts in.",
+        )(command)
+        command = click.option(
+            "--num-restarts",
+            type=click.IntRange(min=1),
+            default=default_num_restarts,
+            show_default=True,
+            help="Number of random restarts.",
+        )(command)
+
+        return command
+
+    return decorator
+
+
+@click.command()
+@click.argument("input_file", type=click.File("rb"))
+@restart_options(default_num_restarts=1000)
+@pass_config
+def ba2f(config, input_file, num_restarts, num_workers, seed, patience):
+    """Program to solve Rosalind problem BA2F: Implement RandomizedMotifSearch
+
+    https://rosalind.info/problems/ba2f/
+    """
+    config.logger.info("Run CLI command to solve BA2F: Implement RandomizedMotifSearch")
+    dataset = read_ktdnas(input_file)
+    bioinformatics_textbook.ch02.BA2F(
+        dataset=dataset, num_restarts=num_restarts, num_workers=num_workers, seed=seed, patience=patience
+    )
+
+
+@click.command()
+@click.argument("input_file", type=click.File("rb"))
+@restart_options(default_num_restarts=20)
+@click.option(
+    "--num-iterations",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Number of Gibbs sampling iterations (N) of each restart. Required if the dataset's first line has no N.",
+)
+@pass_config
+def ba2g(config, input_file, num_restarts, num_workers, seed, patience, num_iterations):
+    """Program to solve Rosalind problem BA2G: Implement GibbsSampler
+
+    The number of iterations N is read from the first line of the dataset ("k t N") unless --num-iterations is given.
+
+    https://rosalind.info/problems/ba2g/
+    """
+    config.logger.info("Run CLI command to solve BA2G: Implement GibbsSampler")
+    dataset = read_ktdnas(input_file)
+    if num_iterations is None and dataset.num_iterations is None:
+        raise click.UsageError("The dataset's first line has no number of iterations N; pass --num-iterations.")
+
+    bioinformatics_textbook.ch02.BA2G(
+        dataset=dataset,
+        num_restarts=num_restarts,
+        num_workers=num_workers,
+        seed=seed,
+        patience=patience,
+        num_iterations=num_iterations,
+    )
+
+
+@click.command()
+@click.argument("input_file", type=click.File("rb"))
+@pass_config
+def ba2h(config, input_file):
+    """Program to solve Rosalind problem BA2H: Implement DistanceBetweenPatternAndStrings
+
+    https://rosalind.info/problems/ba2h/
+    """
+    config.logger.info(
+        "Run CLI command to solve BA2H: Implement DistanceBetweenPatternAndStrings"
+    )
+    dataset = bioinformatics_textbook.ch02.median_string.PatternDNAs(input_file)
+    bioinformatics_textbook.ch02.BA2H(dataset=dataset)
@@ -0,0 +1,187 @@
+"""tools.py
+
+CLI commands of tools that are not Rosalind problems, loaded by the CLI group when one of them is run
+"""
+
+import os
+import sys
+
+import click
+
+import bioinformatics_textbook
+from bioinformatics_textbook.cli import pass_config
+
+
+@click.command()
+@click.argument("manifest_file", type=click.File("r"))
+@click.option(
+    "--num-workers",
+    "-j",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Number of worker processes to run jobs in.",
+)
+@pass_config
+def batch(config, manifest_file, num_workers):
+    """
+    Run the jobs of a manifest in a pool of worker processes.
+
+    Each line of the manifest is a job, either as a JSON object with "command", "input", "output", and optionally
+    "args" (a list of extra arguments of the command), or as tab separated command, input, output, and extra
+    arguments. Each job writes its solution to its output file. One tab separated line is reported per job, in
+    order of the manifest: job number, status (ok or failed), seconds, command, input, output, and the reason of a
+    failure. Failed jobs do not stop the other jobs, but make the exit code 1.
+    """
+    config.logger.info("Run command to run the jobs of a manifest")
+
+    try:
+        jobs = bioinformatics_textbook.batch.read_manifest(manifest_file)
+    except ValueError as error:
+        raise click.ClickException(str(error))
+
+    num_failed = 0
+    runner = bioinformatics_textbook.batch.BatchRunner(num_workers=num_workers)
+    for job_number, result in enumerate(runner.run(jobs), start=1):
+        num_failed += result.status != "ok"
+        click.echo(
+            "\t".join(
+                [
+                    str(job_number),
+                    result.status,
+                    f"{result.seconds:.3f}",
+                    result.job.command,
+                    result.job.input,
+                    result.job.output,
+                    result.message.replace("\n", " "),
+                ]
+            )
+        )
+
+    config.logger.info("Finished command to run %s jobs, of which %s failed", len(jobs), num_failed)
+
+    if num_failed:
+        sys.exit(1)
+
+
+@click.command()
+@click.argument("sequence_file", type=click.File("rb"))
+@click.argument("output_file", type=click.File("wb"))
+@pass_config
+def two_bit(config, sequence_file, output_file):
+    """
+    Convert a FASTA or FASTQ file to a 2-bit file.
+
+    A 2-bit file packs four nucleotides per byte and stores runs of N separately, so it is a quarter of the size
+    of the sequences and is memory mapped instead of parsed when it is given as a --sequence-file. Sequences may
+    only contain A, C, G, T, and N, in either case.
+    """
+    config.logger.info("Run command to convert a sequence file to a 2-bit file")
+
+    records = (
+        (record.name, record.sequence) for record in bioinformatics_textbook.inout.read_sequence_records(sequence_file)
+    )
+    try:
+        num_records = bioinformatics_textbook.two_bit.write_two_bit(records, output_file)
+    except ValueError as error:
+        raise click.ClickException(str(error))
+
+    config.logger.info("Finished command to convert a sequence file to a 2-bit file with %s records", num_records)
+
+
+def server_address_options(command):
+    """Options of the address of a query server"""
+    command = click.option(
+        "--port", type=click.IntRange(min=1, max=65535), default=None, help="Port of the server at localhost."
+    )(command)
+    command = click.option(
+        "--socket",
+        "socket_path",
+        type=click.Path(dir_okay=False),
+        default=None,
+        help="Unix domain socket of the server.",
+    )(command)
+
+    return command
+
+
+def check_server_address(socket_path, port):
+    """
+    Check that exactly one of the server address options is given
+    """
+    if (socket_path is None) == (port is None):
+        raise click.UsageError("Exactly one of --socket and --port is required.")
+
+
+@click.command()
+@click.argument("sequence_files", nargs=-1, type=click.Path(exists=True, dir_okay=False))
+@server_address_options
+@click.option(
+    "--num-workers",
+    "-j",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Number of worker processes to answer queries in.",
+)
+@pass_config
+def serve(config, sequence_files, socket_path, port, num_workers):
+    """
+    Serve BA1A, BA1D, BA1G, and BA1H queries against genomes loaded once.
+
+    The records of the FASTA, FASTQ, or 2-bit SEQUENCE_FILES are loaded as genomes named after the records and stay
+    in memory until the server is stopped, e.g. with Ctrl-C. Queries are JSON objects, one per line, on a Unix domain
+    socket or a localhost port; see the query command for a client.
+    """
+    check_server_address(socket_path, port)
+    config.logger.info("Run command to serve queries against %s sequence files", len(sequence_files))
+
+    try:
+        server = bioinformatics_textbook.server.QueryServer(sequence_paths=sequence_files, num_workers=num_workers)
+    except ValueError as error:
+        raise click.ClickException(str(error))
+
+    try:
+        server.run(socket_path=socket_path, port=port)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if socket_path is not None and os.path.exists(socket_path):
+            os.remove(socket_path)
+
+    config.logger.info("Finished command to serve queries")
+
+
+@click.command()
+@click.argument("command", type=click.Choice(["ba1a", "ba1d", "ba1g", "ba1h", "genomes"]))
+@click.argument("pattern", required=False)
+@server_address_options
+@click.option("--genome", default=None, help="Name of the loaded genome to search. Optional if only one is loaded.")
+@click.option("--text", default=None, help="Text to search instead of a loaded genome, or the second string of BA1G.")
+@click.option(
+    "--hamming-dist", "-d", type=click.IntRange(min=0), default=None, help="Maximum number of mismatches of BA1H."
+)
+@pass_config
+def query(config, command, pattern, socket_path, port, genome, text, hamming_dist):
+    """
+    Send a query to a server started by the serve command and print its answer.
+    """
+    check_server_address(socket_path, port)
+    config.logger.info("Run command to query a server")
+
+    request = {"command": command}
+    for field, value in (("pattern", pattern), ("genome", genome), ("text", text), ("hamming_dist", hamming_dist)):
+        if value is not None:
+            request[field] = value
+
+    try:
+        with bioinformatics_textbook.server.QueryClient(socket_path=socket_path, port=port) as client:
+            response = client.query(request)
+    except OSError as error:
+        raise click.ClickException(f"Cannot query the server: {error}")
+
+    if not response["ok"]:
+        raise click.ClickException(response["error"])
+    bioinformatics_textbook.inout.write_answer(response["answer"])
+
+    config.logger.info("Finished command to query a server")
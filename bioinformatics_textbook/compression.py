@@ -0,0 +1,271 @@
+"""compression.py
+
+A module for reading gzip, bzip2, and xz compressed input files transparently, with BGZF files decompressed in
+parallel through the BGZFReader class
+"""
+
+import bz2
+import gzip
+import io
+import lzma
+import os
+import struct
+import zlib
+from collections import deque
+from typing import BinaryIO, Optional, Union
+
+import click
+
+GZIP_MAGIC = b"\x1f\x8b"
+BZIP2_MAGIC = b"BZh"
+XZ_MAGIC = b"\xfd7zXZ\x00"
+# number of bytes needed to detect the compression of a file, i.e. a gzip header up to the first extra subfield id
+MAGIC_SIZE = 14
+
+# fixed part of a gzip header: magic, compression method, flags, modification time, extra flags, OS, and extra length
+BGZF_HEADER = struct.Struct("<2sBBIBBH")
+# extra subfield of a BGZF block, which holds the size of the whole block minus 1
+BGZF_SUBFIELD = struct.Struct("<2sHH")
+GZIP_FEXTRA = 4
+
+
+def detect_compression(head: bytes) -> Optional[str]:
+    """Detect the compression of a file from its first bytes
+
+    :param head: First MAGIC_SIZE bytes of the file
+    :type head: bytes
+    :return: 'bgzf', 'gzip', 'bz2', 'xz', or None if the file is not compressed
+    :rtype: Optional[str]
+    """
+    if head.startswith(GZIP_MAGIC):
+        if len(head) >= MAGIC_SIZE and head[3] & GZIP_FEXTRA and head[12:14] == b"BC":
+            return "bgzf"
+        return "gzip"
+    if head.startswith(BZIP2_MAGIC):
+        return "bz2"
+    if head.startswith(XZ_MAGIC):
+        return "xz"
+
+    return None
+
+
+def open_input(
+    input_file: Union[BinaryIO, io.TextIOBase], num_threads: Optional[int] = None
+) -> Union[BinaryIO, io.TextIOBase]:
+    """Open a decompressing reader over an input file if it is compressed
+
+    :param input_file: The input file. Files opened in text mode are never compressed and are returned as is.
+    :type input_file: Union[BinaryIO, io.TextIOBase]
+    :param num_threads: Number of threads that decompress BGZF blocks. If None, use the number of CPUs, defaults to None
+    :type num_threads: Optional[int]
+    :return: A binary reader of the decompressed contents, or the input file itself if it is not compressed
+    :rtype: Union[BinaryIO, io.TextIOBase]
+    """
+    if isinstance(input_file, io.TextIOBase):
+        return input_file
+
+    head = _peek(input_file, MAGIC_SIZE)
+    if isinstance(head, str):
+        return input_file
+
+    compression = detect_compression(head)
+    if compression is None:
+        return input_file
+    name = getattr(input_file, "name", "<input>")
+    if compression == "bgzf":
+        return io.BufferedReader(DecompressedStream(BGZFReader(input_file, num_threads=num_threads), name=name))
+
+    openers = {"gzip": gzip.open, "bz2": bz2.open, "xz": lzma.open}
+
+    return io.BufferedReader(DecompressedStream(openers[compression](input_file, "rb"), name=name))
+
+
+class DecompressedStream(io.RawIOBase):
+    """Forward-only raw stream of the decompressed contents of a file.
+
+    Unlike the readers of the gzip, bz2, and lzma modules, it has no file descriptor, so the compressed file is never
+    mistaken for the decompressed contents, e.g. memory mapped. Errors of a truncated or corrupt file are raised as a
+    click.FileError naming the file, instead of surfacing as a bare EOFError.
+    """
+
+    # EOFError for a truncated file, OSError (e.g. gzip.BadGzipFile), lzma.LZMAError, or zlib.error for corrupt data,
+    # and ValueError for a corrupt BGZF block
+    errors = (EOFError, OSError, lzma.LZMAError, zlib.error, ValueError)
+
+    def __init__(self, reader: BinaryIO, name: str = "<input>") -> None:
+        self.reader = reader
+        self.name = name
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        try:
+            return self.reader.readinto(buffer)
+        except self.errors as error:
+            raise self._file_error(error) from error
+
+    def readall(self) -> bytes:
+        try:
+            return self.reader.read()
+        except self.errors as error:
+            raise self._file_error(error) from error
+
+    def close(self) -> None:
+        self.reader.close()
+        super().close()
+
+    def _file_error(self, error: Exception) -> click.FileError:
+        """Describe an error reading the compressed file
+
+        :param error: The error raised by the decompressing reader
+        :type error: Exception
+        :return: An error naming the file
+        :rtype: click.FileError
+        """
+        return click.FileError(self.name, hint=f"the compressed file is truncated or corrupt ({error})")
+
+
+class BGZFReader(io.RawIOBase):
+    """Forward-only raw stream of the decompressed contents of a BGZF file.
+
+    BGZF files are gzip files of independent blocks of at most 64 KiB, each of which records its compressed size in
+    its header. Blocks are read ahead in order and inflated in a thread pool, where zlib releases the GIL, while the
+    inflated blocks are served in order of the file.
+    """
+
+    # number of blocks read ahead per thread
+    blocks_per_thread = 4
+
+    def __init__(self, input_file: BinaryIO, num_threads: Optional[int] = None) -> None:
+        """Initialize the BGZF reader object
+
+        :param input_file: The BGZF file. Must be opened for reading in binary mode.
+        :type input_file: BinaryIO
+        :param num_threads: Number of threads that inflate blocks. If None, use the number of CPUs, defaults to None
+        :type num_threads: Optional[int]
+        """
+        self.input_file = input_file
+        num_threads = num_threads or os.cpu_count() or 1
+        self.max_pending = self.blocks_per_thread * num_threads
+
+        # imported here, since only BGZF files are inflated in threads and most inputs are not compressed
+        from concurrent.futures import Future, ThreadPoolExecutor
+
+        self._executor = ThreadPoolExecutor(max_workers=num_threads)
+        self._pending: deque[Future] = deque()
+        self._block = memoryview(b"")
+        self._at_end = False
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self._block:
+            self._read_ahead()
+            if not self._pending:
+                return 0
+            self._block = memoryview(self._pending.popleft().result())
+
+        size = min(len(buffer), len(self._block))
+        buffer[:size] = self._block[:size]
+        self._block = self._block[size:]
+
+        return size
+
+    def readall(self) -> bytes:
+        chunks = [self._block.tobytes()]
+        self._block = memoryview(b"")
+        while True:
+            self._read_ahead()
+            if not self._pending:
+                return b"".join(chunks)
+            chunks.append(self._pending.popleft().result())
+
+    def close(self) -> None:
+        self._executor.shutdown(cancel_futures=True)
+        super().close()
+
+    def _read_ahead(self) -> None:
+        """Submit blocks for inflation until enough are pending or the file ends"""
+        while not self._at_end and len(self._pending) < self.max_pending:
+            block = self._read_block()
+            if block is None:
+                self._at_end = True
+            else:
+                self._pending.append(self._executor.submit(inflate_bgzf_block, block))
+
+    def _read_block(self) -> Optional[bytes]:
+        """Read the next compressed block
+
+        :raises ValueError: If the block is not a BGZF block
+        :return: The whole block, or None at the end of the file
+        :rtype: Optional[bytes]
+        """
+        header = self.input_file.read(BGZF_HEADER.size)
+        if not header:
+            return None
+        if len(header) < BGZF_HEADER.size:
+            raise ValueError("Truncated BGZF block header.")
+
+        magic, _, flags, _, _, _, extra_length = BGZF_HEADER.unpack(header)
+        if magic != GZIP_MAGIC or not flags & GZIP_FEXTRA:
+            raise ValueError("Not a BGZF block.")
+
+        extra = self.input_file.read(extra_length)
+        block_size = None
+        position = 0
+        while position + BGZF_SUBFIELD.size <= len(extra):
+            subfield_id, subfield_length, value = BGZF_SUBFIELD.unpack_from(extra, position)
+            if subfield_id == b"BC" and subfield_length == 2:
+                block_size = value + 1
+            position += 4 + subfield_length
+        if block_size is None:
+            raise ValueError("BGZF block has no block size.")
+
+        rest = self.input_file.read(block_size - len(header) - len(extra))
+        if len(rest) < block_size - len(header) - len(extra):
+            raise ValueError("Truncated BGZF block.")
+
+        return header + extra + rest
+
+
+def inflate_bgzf_block(block: bytes) -> bytes:
+    """Inflate a BGZF block and check its CRC32 and size
+
+    :param block: The whole compressed block
+    :type block: bytes
+    :raises ValueError: If the inflated data does not match the CRC32 or size of the block
+    :return: Inflated data
+    :rtype: bytes
+    """
+    extra_length = BGZF_HEADER.unpack_from(block)[-1]
+    data = zlib.decompress(block[BGZF_HEADER.size + extra_length: -8], wbits=-zlib.MAX_WBITS)
+
+    crc, size = struct.unpack_from("<II", block, len(block) - 8)
+    if size != len(data) & 0xFFFFFFFF or crc != zlib.crc32(data):
+        raise ValueError("BGZF block failed its CRC32 or size check.")
+
+    return data
+
+
+def _peek(input_file: BinaryIO, size: int) -> bytes:
+    """Read the first bytes of a file without consuming them
+
+    :param input_file: The input file, positioned at its start
+    :type input_file: BinaryIO
+    :param size: Number of bytes
+    :type size: int
+    :return: Up to size bytes
+    :rtype: bytes
+    """
+    if input_file.seekable():
+        position = input_file.tell()
+        head = input_file.read(size)
+        input_file.seek(position, os.SEEK_SET)
+        return head
+
+    if hasattr(input_file, "peek"):
+        return input_file.peek(size)[:size]
+
+    raise io.UnsupportedOperation("Cannot detect the compression of a file that is neither seekable nor peekable.")
@@ -5,7 +5,19 @@ A module for working with DNA sequences through the DNA class
 
 from __future__ import annotations
 import itertools
-from typing import Iterable, Iterator, Optional
+from typing import Iterable, Iterator, Optional, Union
+
+# 2-bit codes of nucleotides in lexicographic order, keyed by both characters and bytes
+NUCLEOTIDE_NUMBERS = {
+    **{base: number for number, base in enumerate("ACGT")},
+    **{ord(base): number for number, base in enumerate("ACGT")},
+}
+# codes of nucleotides in either case, so soft-masked (lower case) sequences are encoded like upper case ones
+CASE_INSENSITIVE_NUCLEOTIDE_NUMBERS = {
+    **NUCLEOTIDE_NUMBERS,
+    **{base: number for number, base in enumerate("acgt")},
+    **{ord(base): number for number, base in enumerate("acgt")},
+}
 
 
 class DNA(str):
@@ -88,6 +100,113 @@ class DNA(str):
 
         return map(DNA, kmers)
 
+    @staticmethod
+    def pattern_to_number(pattern: str) -> int:
+        """Convert a k-mer to its integer code, i.e. its index in the lexicographic ordering of all k-mers of the same length
+
+        :param pattern: k-mer
+        :type pattern: str
+        :return: Integer code of the k-mer
+        :rtype: int
+        """
+        number = 0
+        for base in pattern:
+            number = (number << 2) | NUCLEOTIDE_NUMBERS[base]
+
+        return number
+
+    @staticmethod
+    def number_to_pattern(number: int, kmer_length: int) -> DNA:
+        """Convert an integer code back to its k-mer
+
+        :param number: Integer code of a k-mer
+        :type number: int
+        :param kmer_length: k-mer length
+        :type kmer_length: int
+        :return: k-mer
+        :rtype: DNA
+        """
+        bases = []
+        for _ in range(kmer_length):
+            bases.append("ACGT"[number & 3])
+            number >>= 2
+
+        return DNA("".join(reversed(bases)))
+
+    @staticmethod
+    def reverse_complement_number(number: int, kmer_length: int) -> int:
+        """Compute the integer code of the reverse complement of a k-mer from its integer code
+
+        :param number: Integer code of a k-mer
+        :type number: int
+        :param kmer_length: k-mer length
+        :type kmer_length: int
+        :return: Integer code of the reverse complement
+        :rtype: int
+        """
+        # complementary bases have complementary 2-bit codes, so complementing flips every bit
+        complement = number ^ ((1 << (2 * kmer_length)) - 1)
+        rev_comp = 0
+        for _ in range(kmer_length):
+            rev_comp = (rev_comp << 2) | (complement & 3)
+            complement >>= 2
+
+        return rev_comp
+
+    @staticmethod
+    def generate_d_neighborhood_numbers(
+        number: int, kmer_length: int, num_allowed_mismatches: int
+    ) -> Iterator[int]:
+        """Generate the integer codes of all k-mers whose Hamming distance from a k-mer does not exceed a set maximum (d).
+
+        Substituting a base is an XOR of its 2-bit code with 1, 2, or 3, so every neighbor is generated exactly once
+        from a set of mismatched positions and the substitutions at them.
+
+        :param number: Integer code of the k-mer
+        :type number: int
+        :param kmer_length: k-mer length
+        :type kmer_length: int
+        :param num_allowed_mismatches: The maximum allowed Hamming distance (i.e. the maximum number of allowed mismatches).
+        :type num_allowed_mismatches: int
+        :yield: Integer codes of k-mers in the d neighborhood of the k-mer
+        :rtype: Iterator[int]
+        """
+        for num_mismatches in range(min(num_allowed_mismatches, kmer_length) + 1):
+            for positions in itertools.combinations(range(kmer_length), num_mismatches):
+                for substitutions in itertools.product((1, 2, 3), repeat=num_mismatches):
+                    neighbor = number
+                    for position, substitution in zip(positions, substitutions):
+                        neighbor ^= substitution << (2 * position)
+                    yield neighbor
+
+    @staticmethod
+    def generate_kmer_numbers(
+        seq: Union[str, bytes, memoryview], kmer_length: int
+    ) -> Iterator[int]:
+        """Generate the integer codes of all k-mers of a sequence with a rolling 2-bit encoding. Lower case bases are
+        encoded like upper case ones, and windows that contain any other character, e.g. N, are skipped.
+
+        :param seq: DNA sequence as a string or as ASCII bytes
+        :type seq: Union[str, bytes, memoryview]
+        :param kmer_length: k-mer length
+        :type kmer_length: int
+        :yield: Integer codes of k-mers in order of position
+        :rtype: Iterator[int]
+        """
+        mask = (1 << (2 * kmer_length)) - 1
+        number = 0
+        # number of consecutive nucleotides ending at the current base
+        run_length = 0
+        for base in seq:
+            code = CASE_INSENSITIVE_NUCLEOTIDE_NUMBERS.get(base)
+            if code is None:
+                run_length = 0
+                continue
+            number = ((number << 2) | code) & mask
+            run_length += 1
+            if run_length >= kmer_length:
+                yield number
+
     def compute_hamming_distance(self, dna_q: str) -> int:
         """Compute the Hamming distance of two k-mers defined as the number of mismatches between two strings
 
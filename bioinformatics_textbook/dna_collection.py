@@ -0,0 +1,188 @@
+"""dna_collection.py
+
+A module for working with collections of DNA sequences through the DNACollection class
+"""
+
+from __future__ import annotations
+import hashlib
+from typing import Iterable, Iterator, Optional, Union
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from bioinformatics_textbook.dna import DNA
+from bioinformatics_textbook.two_bit import TwoBitFile
+
+# 2-bit codes of nucleotides indexed by their ASCII byte; other bytes map to 255
+NUCLEOTIDE_CODES = np.full(256, 255, dtype=np.uint8)
+NUCLEOTIDE_CODES[np.frombuffer(b"ACGT", dtype=np.uint8)] = np.arange(4, dtype=np.uint8)
+# ASCII bytes of nucleotides indexed by their 2-bit code; other codes map to N
+CODE_NUCLEOTIDES = np.full(256, ord("N"), dtype=np.uint8)
+CODE_NUCLEOTIDES[:4] = np.frombuffer(b"ACGT", dtype=np.uint8)
+
+
+class DNACollection:
+    """Representation of a collection of DNA sequences stored in one contiguous byte buffer.
+
+    Sequence i occupies bytes offsets[i] to offsets[i + 1] of the buffer. Sequences are available as zero-copy views
+    of the buffer, or as DNA objects, and the whole buffer is encoded to 2-bit nucleotide codes at once. A collection
+    of 2-bit records starts from their codes instead, and its buffer is only decoded if it is needed.
+    """
+
+    def __init__(self, buffer: Optional[bytes], offsets: np.ndarray, codes: Optional[np.ndarray] = None) -> None:
+        """Initialize the DNA collection object
+
+        :param buffer: Concatenated sequences as ASCII bytes, or None to decode them from `codes` when needed
+        :type buffer: Optional[bytes]
+        :param offsets: Start of each sequence in the buffer, followed by the end of the last sequence
+        :type offsets: np.ndarray
+        :param codes: Nucleotide codes of the concatenated sequences, defaults to None
+        :type codes: Optional[np.ndarray]
+        :raises ValueError: If neither the buffer nor the codes are given
+        """
+        if buffer is None and codes is None:
+            raise ValueError("Either a buffer or codes are required.")
+
+        self._buffer = buffer
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        self._codes = codes
+
+    @classmethod
+    def from_sequences(cls, sequences: Iterable[Union[str, bytes]]) -> DNACollection:
+        """Construct a DNA collection from individual sequences
+
+        :param sequences: DNA sequences as strings or ASCII bytes
+        :type sequences: Iterable[Union[str, bytes]]
+        :return: DNA collection
+        :rtype: DNACollection
+        """
+        if isinstance(sequences, DNACollection):
+            return sequences
+
+        encoded = [seq.encode() if isinstance(seq, str) else bytes(seq) for seq in sequences]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(seq) for seq in encoded], out=offsets[1:])
+
+        return cls(buffer=b"".join(encoded), offsets=offsets)
+
+    @classmethod
+    def from_two_bit(cls, two_bit: TwoBitFile) -> DNACollection:
+        """Construct a DNA collection from the records of a 2-bit file without decoding them to ASCII. Runs of N have
+        the code of other characters that are not nucleotides.
+
+        :param two_bit: The 2-bit file
+        :type two_bit: TwoBitFile
+        :return: DNA collection
+        :rtype: DNACollection
+        """
+        offsets = np.zeros(len(two_bit) + 1, dtype=np.int64)
+        np.cumsum(two_bit.lengths, out=offsets[1:])
+        codes = np.concatenate(
+            [np.empty(0, dtype=np.uint8), *(two_bit.masked_codes(i) for i in range(len(two_bit)))]
+        )
+
+        return cls(buffer=None, offsets=offsets, codes=codes)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i: int) -> DNA:
+        return DNA(bytes(self.view(i)).decode())
+
+    def __iter__(self) -> Iterator[DNA]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def __reduce__(self) -> tuple:
+        if self._buffer is None:
+            return (self.__class__, (None, self.offsets, self._codes))
+
+        return (self.__class__, (self._buffer, self.offsets))
+
+    @property
+    def buffer(self) -> bytes:
+        """Concatenated sequences as ASCII bytes"""
+        if self._buffer is None:
+            self._buffer = CODE_NUCLEOTIDES[self._codes].tobytes()
+
+        return self._buffer
+
+    @property
+    def lengths(self) -> np.ndarray:
+        """Length of each sequence"""
+        return np.diff(self.offsets)
+
+    def fingerprint(self) -> str:
+        """Compute a digest that identifies the sequences of the collection
+
+        :return: SHA-256 hex digest of the sequences and their boundaries
+        :rtype: str
+        """
+        digest = hashlib.sha256(self.offsets.astype("<i8").tobytes())
+        digest.update(self.buffer)
+
+        return digest.hexdigest()
+
+    def view(self, i: int) -> memoryview:
+        """Get a sequence as a zero-copy view of the buffer
+
+        :param i: Index of the sequence
+        :type i: int
+        :return: The sequence as ASCII bytes
+        :rtype: memoryview
+        """
+        if not -len(self) <= i < len(self):
+            raise IndexError("DNA collection index out of range")
+        i %= len(self)
+
+        return memoryview(self.buffer)[self.offsets[i]: self.offsets[i + 1]]
+
+    def views(self) -> Iterator[memoryview]:
+        """Get every sequence as a zero-copy view of the buffer
+
+        :yield: Sequences as ASCII bytes
+        :rtype: Iterator[memoryview]
+        """
+        for i in range(len(self)):
+            yield self.view(i)
+
+    def encode(self) -> np.ndarray:
+        """Encode the buffer as 2-bit nucleotide codes (A=0, C=1, G=2, T=3). The encoding is computed once.
+
+        :return: Nucleotide codes of the whole buffer
+        :rtype: np.ndarray
+        """
+        if self._codes is None:
+            self._codes = NUCLEOTIDE_CODES[np.frombuffer(self.buffer, dtype=np.uint8)]
+
+        return self._codes
+
+    def codes(self, i: int) -> np.ndarray:
+        """Get the nucleotide codes of a sequence as a view of the encoded buffer
+
+        :param i: Index of the sequence
+        :type i: int
+        :return: Nucleotide codes of the sequence
+        :rtype: np.ndarray
+        """
+        return self.encode()[self.offsets[i]: self.offsets[i + 1]]
+
+    def windows(self, kmer_length: int) -> tuple:
+        """Extract every k-mer window of every sequence at once
+
+        :param kmer_length: k-mer length
+        :type kmer_length: int
+        :return: Array of shape (number of windows, k-mer length) of nucleotide codes, and the index of the sequence of each window
+        :rtype: tuple
+        """
+        codes = self.encode()
+        if len(codes) < kmer_length:
+            return np.empty((0, kmer_length), dtype=np.uint8), np.empty(0, dtype=np.int64)
+
+        num_windows = np.maximum(self.lengths - kmer_length + 1, 0)
+        sequence_indices = np.repeat(np.arange(len(self)), num_windows)
+        # a window's start is its sequence's offset plus its rank among the windows of that sequence
+        window_ranks = np.arange(num_windows.sum()) - np.repeat(np.cumsum(num_windows) - num_windows, num_windows)
+        starts = self.offsets[:-1][sequence_indices] + window_ranks
+
+        return sliding_window_view(codes, kmer_length)[starts], sequence_indices
@@ -1,12 +1,185 @@
+import io
+import itertools
 import logging
+import mmap
 import os
-import re
+import sys
+import weakref
 from abc import ABC, abstractmethod
+from array import array
+from typing import Any, BinaryIO, Iterable, Iterator, NamedTuple, Optional, TextIO, Union
 
 import click
 
+import bioinformatics_textbook
+from bioinformatics_textbook.compression import open_input
 from bioinformatics_textbook.dna import DNA
 
+# number of bytes read from a sequence file at a time
+SEQUENCE_BUFFER_SIZE = 1 << 20
+# number of bytes of a forward-only input kept in memory before it spills to a temporary file
+SPOOL_MEMORY_SIZE = 1 << 26
+# number of answer items formatted and written at a time
+ANSWER_CHUNK_SIZE = 1 << 16
+# key of the output file of solutions in the metadata of the click context
+OUTPUT_FILE_KEY = "bioinformatics_textbook.output_file"
+# joins the records of a sequence file into a single text; a newline never occurs in the text of a dataset, whose
+# lines are joined without them, so counters that skip the windows that contain it leave plain texts as they are
+RECORD_SEPARATOR = "\n"
+
+
+class SequenceRecord(NamedTuple):
+    """A record of a FASTA or FASTQ file. Quality is None for FASTA records."""
+
+    name: str
+    sequence: bytes
+    quality: Optional[bytes] = None
+
+
+class LineIndex:
+    """Offsets of the lines of a file, built in a single forward scan.
+
+    The file is memory mapped when possible, or else read once, and lines are served as zero-copy slices of the
+    mapping. Pipes and other forward-only inputs are spooled in a single pass, since dataset fields such as the
+    k-mer length on the last line can only be reached after the lines before them.
+
+    Line i spans from `starts[i]` up to its newline at `ends[i]`, excluding carriage returns. As with readlines, a
+    newline at the very end of the file does not start another line.
+    """
+
+    def __init__(self, input_file: Union[BinaryIO, io.TextIOBase]) -> None:
+        """Initialize the line index object
+
+        :param input_file: The input file, opened for reading in binary or text mode.
+        :type input_file: Union[BinaryIO, io.TextIOBase]
+        """
+        self.buffer = self._map_file(input_file)
+        self.view = memoryview(self.buffer)
+
+        self.starts = array("q")
+        self.ends = array("q")
+        size = len(self.buffer)
+        start = 0
+        while start < size:
+            end = self.buffer.find(b"\n", start)
+            if end < 0:
+                end = size
+            self.starts.append(start)
+            self.ends.append(end - 1 if end > start and self.buffer[end - 1] == 13 else end)
+            start = end + 1
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def line(self, i: int) -> memoryview:
+        """Get a line without its newline characters
+
+        :param i: Index of the line. Negative indices count from the last line.
+        :type i: int
+        :return: The line as a view of the file
+        :rtype: memoryview
+        """
+        return self.view[self.starts[i]: self.ends[i]]
+
+    def span(self, start: int, stop: int) -> memoryview:
+        """Get consecutive lines, including the newline characters between them
+
+        :param start: Index of the first line
+        :type start: int
+        :param stop: Index of the line after the last line
+        :type stop: int
+        :return: The lines as a view of the file
+        :rtype: memoryview
+        """
+        start, stop, _ = slice(start, stop).indices(len(self))
+        if start >= stop:
+            return self.view[0:0]
+
+        return self.view[self.starts[start]: self.ends[stop - 1]]
+
+    def _map_file(self, input_file: Union[BinaryIO, io.TextIOBase]) -> Union[mmap.mmap, bytes]:
+        """Memory map a file, or read it whole if it cannot be mapped, e.g. an empty, in-memory, or compressed file
+
+        :param input_file: The input file
+        :type input_file: Union[BinaryIO, io.TextIOBase]
+        :return: Contents of the file, decompressed if it is compressed
+        :rtype: Union[mmap.mmap, bytes]
+        """
+        reader = open_input(input_file)
+        if reader is not input_file:
+            with reader:
+                return self._spool(reader)
+
+        try:
+            return mmap.mmap(input_file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (AttributeError, OSError, ValueError, io.UnsupportedOperation):
+            pass
+
+        if not input_file.seekable():
+            return self._spool(input_file)
+
+        input_file.seek(0, os.SEEK_SET)
+        contents = input_file.read()
+
+        return contents.encode() if isinstance(contents, str) else contents
+
+    def _spool(self, reader: Union[BinaryIO, io.TextIOBase]) -> Union[mmap.mmap, bytes]:
+        """Read a forward-only stream, e.g. a pipe or a decompressing reader, in one pass. Contents are kept in memory
+        up to SPOOL_MEMORY_SIZE bytes and then spill to a temporary file that is memory mapped.
+
+        :param reader: The stream, at its start
+        :type reader: Union[BinaryIO, io.TextIOBase]
+        :return: Contents of the stream
+        :rtype: Union[mmap.mmap, bytes]
+        """
+        chunks = []
+        size = 0
+        temp_file = None
+        while True:
+            chunk = reader.read(SEQUENCE_BUFFER_SIZE)
+            if not chunk:
+                break
+            chunk = chunk.encode() if isinstance(chunk, str) else chunk
+            if temp_file is not None:
+                temp_file.write(chunk)
+                continue
+
+            chunks.append(chunk)
+            size += len(chunk)
+            if size > SPOOL_MEMORY_SIZE:
+                # imported here, since only large piped inputs are spooled to a temporary file
+                import tempfile
+
+                temp_file = tempfile.TemporaryFile()
+                temp_file.writelines(chunks)
+                chunks = []
+
+        if temp_file is None:
+            return b"".join(chunks)
+
+        with temp_file:
+            temp_file.flush()
+            return mmap.mmap(temp_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+# line indexes of the files read by the module level read functions, built once per file object
+_line_indexes = weakref.WeakKeyDictionary()
+
+
+def get_line_index(input_file: Union[BinaryIO, io.TextIOBase]) -> LineIndex:
+    """Get the line index of a file, building it on first use
+
+    :param input_file: The input file, opened for reading in binary or text mode.
+    :type input_file: Union[BinaryIO, io.TextIOBase]
+    :return: Line index of the file
+    :rtype: LineIndex
+    """
+    line_index = _line_indexes.get(input_file)
+    if line_index is None:
+        line_index = _line_indexes[input_file] = LineIndex(input_file)
+
+    return line_index
+
 
 def read_text_k(input_file: click.File) -> tuple:
     # get the text from all lines except the last
@@ -26,10 +199,9 @@ def read_all_lines(input_file: click.File) -> str:
     :return: A string with no new lines
     :rtype: str
     """
-    all_lines = input_file.read()
-    all_lines_stripped = strip_newlines(all_lines)
+    line_index = get_line_index(input_file)
 
-    return all_lines_stripped
+    return line_index.span(0, len(line_index)).tobytes().translate(None, b"\r\n").decode()
 
 
 def read_not_last_line(input_file: click.File) -> str:
@@ -40,20 +212,7 @@ def read_not_last_line(input_file: click.File) -> str:
     :return: The lines.
     :rtype: str
     """
-    input_file.seek(0, os.SEEK_END)
-    position = input_file.tell() - 1
-
-    while position > 0 and input_file.read(1) != b"\n":
-        position -= 1
-        input_file.seek(position, os.SEEK_SET)
-
-    if position > 0:
-        input_file.seek(0, os.SEEK_SET)
-        not_last_lines = input_file.read(position).decode()
-
-    not_last_lines_stripped = strip_newlines(not_last_lines)
-
-    return not_last_lines_stripped
+    return get_line_index(input_file).span(0, -1).tobytes().translate(None, b"\r\n").decode()
 
 
 def read_first_line(input_file: click.File) -> str:
@@ -64,13 +223,7 @@ def read_first_line(input_file: click.File) -> str:
     :return: The first line of the file.
     :rtype: str
     """
-    # always set the file object position to the very beginning
-    input_file.seek(0, os.SEEK_SET)
-
-    first_line = input_file.readline().decode()
-    first_line_stripped = strip_newlines(first_line)
-
-    return first_line_stripped
+    return get_line_index(input_file).line(0).tobytes().decode()
 
 
 def read_second_line(input_file: click.File) -> str:
@@ -81,13 +234,7 @@ def read_second_line(input_file: click.File) -> str:
     :return: The second line.
     :rtype: str
     """
-    # always set the file object position to the very beginning
-    input_file.seek(0, os.SEEK_SET)
-
-    second_line = input_file.readlines()[1:2][0].decode()
-    second_line_stripped = strip_newlines(second_line)
-
-    return second_line_stripped
+    return get_line_index(input_file).line(1).tobytes().decode()
 
 
 def read_last_line(input_file: click.File) -> str:
@@ -98,14 +245,156 @@ def read_last_line(input_file: click.File) -> str:
     :return: The last line.
     :rtype: str
     """
-    input_file.seek(-2, os.SEEK_END)
-    while input_file.read(1) != b"\n":
-        input_file.seek(-2, os.SEEK_CUR)
+    return get_line_index(input_file).line(-1).tobytes().decode().rstrip()
+
+
+def iterate_lines(
+    input_file: BinaryIO, buffer_size: int = SEQUENCE_BUFFER_SIZE, head: bytes = b""
+) -> Iterator[memoryview]:
+    """Iterate over the lines of a file read in large binary chunks
+
+    :param input_file: The input file. Must be opened for reading in binary mode.
+    :type input_file: BinaryIO
+    :param buffer_size: Number of bytes read at a time, defaults to SEQUENCE_BUFFER_SIZE
+    :type buffer_size: int
+    :param head: Bytes already read from the start of the file, defaults to b""
+    :type head: bytes
+    :yield: Lines without their newline characters, as views of the chunk they were read in
+    :rtype: Iterator[memoryview]
+    """
+    remainder = head
+    while True:
+        chunk = input_file.read(buffer_size)
+        if not chunk:
+            break
+        if remainder:
+            chunk = remainder + chunk
+
+        view = memoryview(chunk)
+        start = 0
+        end = chunk.find(b"\n")
+        while end >= 0:
+            yield view[start: end - 1] if end > start and chunk[end - 1] == 13 else view[start: end]
+            start = end + 1
+            end = chunk.find(b"\n", start)
+        remainder = chunk[start:]
+
+    if remainder:
+        yield memoryview(remainder.rstrip(b"\r"))
+
+
+def read_sequence_records(input_file: BinaryIO, buffer_size: int = SEQUENCE_BUFFER_SIZE) -> Iterator[SequenceRecord]:
+    """Stream the records of a FASTA, FASTQ, or 2-bit file. The format is detected from the start of the file, which
+    may be gzip, bzip2, or xz compressed.
+
+    :param input_file: The input file. Must be opened for reading in binary mode.
+    :type input_file: BinaryIO
+    :param buffer_size: Number of bytes read at a time, defaults to SEQUENCE_BUFFER_SIZE
+    :type buffer_size: int
+    :raises ValueError: If the file is neither FASTA, FASTQ, nor 2-bit
+    :yield: Records in order of the file
+    :rtype: Iterator[SequenceRecord]
+    """
+    # the 2-bit module depends on NumPy, so it is only imported once a sequence file is read
+    two_bit_module = bioinformatics_textbook.two_bit
+    reader = open_input(input_file)
+    try:
+        head = reader.read(len(two_bit_module.TWO_BIT_MAGIC))
+        if two_bit_module.is_two_bit(head):
+            two_bit = two_bit_module.TwoBitFile.from_file(reader, head=head)
+            for name, sequence in two_bit.records():
+                yield SequenceRecord(name=name, sequence=sequence)
+            return
+
+        lines = iterate_lines(reader, buffer_size=buffer_size, head=head)
+        for line in lines:
+            if not line:
+                continue
+            lines = itertools.chain([line], lines)
+            if line[:1] == b">":
+                yield from read_fasta_records(lines)
+            elif line[:1] == b"@":
+                yield from read_fastq_records(lines)
+            else:
+                raise ValueError("Sequence file is neither FASTA, FASTQ, nor 2-bit.")
+            return
+    finally:
+        if reader is not input_file:
+            reader.close()
+
+
+def read_two_bit_file(input_file: BinaryIO) -> Optional["bioinformatics_textbook.two_bit.TwoBitFile"]:
+    """Load a sequence file, which may be compressed, if it is a 2-bit file, so that solvers can use the 2-bit codes
+    of its records without decoding them to ASCII
+
+    :param input_file: The sequence file. Must be opened for reading in binary mode.
+    :type input_file: BinaryIO
+    :return: The 2-bit file, or None if the file is not a 2-bit file or cannot be rewound to be read by
+        read_sequence_records, in which case the file is left at its position
+    :rtype: Optional[TwoBitFile]
+    """
+    if not input_file.seekable():
+        return None
+
+    two_bit_module = bioinformatics_textbook.two_bit
+    position = input_file.tell()
+    reader = open_input(input_file)
+    try:
+        head = reader.read(len(two_bit_module.TWO_BIT_MAGIC))
+        if two_bit_module.is_two_bit(head):
+            return two_bit_module.TwoBitFile.from_file(reader, head=head)
+    finally:
+        if reader is not input_file:
+            reader.close()
+
+    input_file.seek(position, os.SEEK_SET)
+
+    return None
 
-    last_line = input_file.readline().decode().rstrip()
-    last_line_stripped = strip_newlines(last_line)
 
-    return last_line_stripped
+def read_fasta_records(lines: Iterator[memoryview]) -> Iterator[SequenceRecord]:
+    """Parse the records of a FASTA file. Sequences may span several lines.
+
+    :param lines: Lines of the file
+    :type lines: Iterator[memoryview]
+    :raises ValueError: If sequence lines come before the first header
+    :yield: Records in order of the file
+    :rtype: Iterator[SequenceRecord]
+    """
+    name = None
+    sequence = bytearray()
+    for line in lines:
+        if line[:1] == b">":
+            if name is not None:
+                yield SequenceRecord(name=name, sequence=bytes(sequence))
+            name = bytes(line[1:]).decode().strip()
+            sequence = bytearray()
+        elif name is not None:
+            sequence += line
+        elif bytes(line).strip():
+            raise ValueError("FASTA sequence found before the first header.")
+
+    if name is not None:
+        yield SequenceRecord(name=name, sequence=bytes(sequence))
+
+
+def read_fastq_records(lines: Iterator[memoryview]) -> Iterator[SequenceRecord]:
+    """Parse the records of a FASTQ file of four lines per record
+
+    :param lines: Lines of the file
+    :type lines: Iterator[memoryview]
+    :raises ValueError: If a record is malformed
+    :yield: Records in order of the file
+    :rtype: Iterator[SequenceRecord]
+    """
+    for header in lines:
+        if not header:
+            continue
+        sequence, separator, quality = next(lines, None), next(lines, None), next(lines, None)
+        if quality is None or header[:1] != b"@" or separator[:1] != b"+" or len(quality) != len(sequence):
+            raise ValueError(f"Malformed FASTQ record: {bytes(header).decode()}")
+
+        yield SequenceRecord(name=bytes(header[1:]).decode().strip(), sequence=bytes(sequence), quality=bytes(quality))
 
 
 def strip_newlines(text: str) -> str:
@@ -116,12 +405,19 @@ def strip_newlines(text: str) -> str:
     :return: The text string stripped of newline characters
     :rtype: str
     """
-    stripped_text = re.sub(r"\r|\n", "", text)
+    stripped_text = text.replace("\r", "").replace("\n", "")
 
     return stripped_text
 
 
 class RosalindDataset:
+    """Base class of Rosalind datasets.
+
+    Subclasses declare their fields as cached properties, so each field is only read from the input file, parsed,
+    and logged when a solver first uses it. Fields that solvers can use as raw bytes have a `*_bytes` variant that
+    is served from the file's line index without decoding.
+    """
+
     def __init__(
         self,
         input_file: click.File,
@@ -131,6 +427,17 @@ class RosalindDataset:
         self._input_file = input_file
         self.logger = logger
 
+        self._index = None
+
+    @property
+    def _line_index(self) -> LineIndex:
+        """Index of the lines of the input file, built on first use"""
+        if self._index is None:
+            self.logger.info("Index the lines of the input file.")
+            self._index = LineIndex(self._input_file)
+
+        return self._index
+
     def _read_all_lines(self) -> str:
         """Read all lines of a file into a single string with no new lines
 
@@ -139,10 +446,7 @@ class RosalindDataset:
         """
         self.logger.info("Read all lines of the input file.")
 
-        all_lines = self._input_file.read()
-        all_lines_stripped = self._strip_newlines(all_lines)
-
-        return all_lines_stripped
+        return self._decode_lines(self._line_index.span(0, len(self._line_index)))
 
     def _read_first_line(self) -> str:
         """Read the first line of a file
@@ -152,11 +456,7 @@ class RosalindDataset:
         """
         self.logger.info("Read the first line of the input file.")
 
-        self._set_file_position_to_beginning()
-
-        first_line = self._input_file.readline().decode()
-
-        return self._strip_newlines(first_line)
+        return self._line_index.line(0).tobytes().decode()
 
     def _read_last_line(self) -> str:
         """Read the last line of a file
@@ -166,13 +466,7 @@ class RosalindDataset:
         """
         self.logger.info("Read the last line of the input file.")
 
-        self._input_file.seek(-2, os.SEEK_END)
-        while self._input_file.read(1) != b"\n":
-            self._input_file.seek(-2, os.SEEK_CUR)
-
-        last_line = self._input_file.readline().decode().rstrip()
-
-        return self._strip_newlines(last_line)
+        return self._line_index.line(-1).tobytes().decode().rstrip()
 
     def _read_not_last_line(self) -> str:
         """Read every line of a file except for the last line
@@ -182,20 +476,19 @@ class RosalindDataset:
         """
         self.logger.info("Read every line of the input file except for the last line.")
 
-        self._input_file.seek(0, os.SEEK_END)
-        position = self._input_file.tell() - 1
+        return self._decode_lines(self._line_index.span(0, -1))
 
-        while position > 0 and self._input_file.read(1) != b"\n":
-            position -= 1
-            self._input_file.seek(position, os.SEEK_SET)
+    def _read_lines(self) -> list:
+        """Read every line of a file
 
-        if position > 0:
-            self._input_file.seek(0, os.SEEK_SET)
-            not_last_lines = self._input_file.read(position).decode()
+        :return: The lines, stripped of newlines.
+        :rtype: list
+        """
+        self.logger.info("Read every line of the input file.")
 
-        not_last_lines_stripped = strip_newlines(not_last_lines)
+        line_index = self._line_index
 
-        return not_last_lines_stripped
+        return [line_index.line(i).tobytes().decode() for i in range(len(line_index))]
 
     def _read_last_lines(self) -> list:
         """Read every line of a file except for the first line
@@ -205,13 +498,109 @@ class RosalindDataset:
         """
         self.logger.info("Read every line of the input file except for the last line.")
 
-        self._set_file_position_to_beginning()
+        line_index = self._line_index
 
-        last_lines = self._input_file.readlines()
-        last_lines.pop(0)
-        last_lines = [DNA(self._strip_newlines(line.decode())) for line in last_lines]
+        return [DNA(line_index.line(i).tobytes().decode()) for i in range(1, len(line_index))]
+
+    def _read_first_line_bytes(self) -> memoryview:
+        """Read the first line of a file as ASCII bytes without a copy
+
+        :return: The first line of the file.
+        :rtype: memoryview
+        """
+        return self._line_index.line(0)
+
+    def _read_last_line_bytes(self) -> memoryview:
+        """Read the last line of a file as ASCII bytes without a copy
+
+        :return: The last line.
+        :rtype: memoryview
+        """
+        return self._line_index.line(-1)
+
+    def _read_not_last_line_bytes(self) -> Union[bytes, memoryview]:
+        """Read every line of a file except for the last line as ASCII bytes with no new lines. A single line is
+        returned without a copy.
+
+        :return: The lines.
+        :rtype: Union[bytes, memoryview]
+        """
+        line_index = self._line_index
+        if len(line_index) == 2:
+            return line_index.line(0)
+
+        return line_index.span(0, -1).tobytes().translate(None, b"\r\n")
+
+    def _read_last_lines_bytes(self) -> list:
+        """Read every line of a file except for the first line as ASCII bytes without a copy
+
+        :return: The lines.
+        :rtype: list
+        """
+        line_index = self._line_index
+
+        return [line_index.line(i) for i in range(1, len(line_index))]
+
+    def _decode_bytes(self, data: Union[bytes, memoryview]) -> str:
+        """Decode a field read as ASCII bytes
+
+        :param data: The field as ASCII bytes
+        :type data: Union[bytes, memoryview]
+        :return: The field as a string
+        :rtype: str
+        """
+        return bytes(data).decode()
+
+    def _decode_lines(self, lines: memoryview) -> str:
+        """Decode consecutive lines into a single string with no new lines
+
+        :param lines: Lines as a view of the file
+        :type lines: memoryview
+        :return: A string with no new lines
+        :rtype: str
+        """
+        return lines.tobytes().translate(None, b"\r\n").decode()
 
-        return last_lines
+    def _read_sequence_file(self, sequence_file: BinaryIO) -> list:
+        """Read the sequences of every record of a FASTA, FASTQ, or 2-bit file
+
+        :param sequence_file: The sequence file. Must be opened for reading in binary mode.
+        :type sequence_file: BinaryIO
+        :return: The sequences.
+        :rtype: list
+        """
+        return [DNA(sequence.decode()) for sequence in self._read_sequence_file_bytes(sequence_file)]
+
+    def _read_sequence_file_bytes(self, sequence_file: BinaryIO) -> list:
+        """Read the sequences of every record of a FASTA, FASTQ, or 2-bit file as upper case ASCII bytes, so
+        soft-masked (lower case) regions are read like the rest of the sequence
+
+        :param sequence_file: The sequence file. Must be opened for reading in binary mode.
+        :type sequence_file: BinaryIO
+        :return: The sequences.
+        :rtype: list
+        """
+        self.logger.info("Read the records of the sequence file.")
+
+        sequences = [bytes(record.sequence).upper() for record in read_sequence_records(sequence_file)]
+
+        self.logger.info("Read %s records from the sequence file.", len(sequences))
+
+        return sequences
+
+    def _read_two_bit_file(self, sequence_file: BinaryIO) -> Optional["bioinformatics_textbook.two_bit.TwoBitFile"]:
+        """Load a sequence file if it is a 2-bit file
+
+        :param sequence_file: The sequence file. Must be opened for reading in binary mode.
+        :type sequence_file: BinaryIO
+        :return: The 2-bit file, or None if the sequence file is read as records instead
+        :rtype: Optional[TwoBitFile]
+        """
+        two_bit = read_two_bit_file(sequence_file)
+        if two_bit is not None:
+            self.logger.info("Loaded %s records from the 2-bit sequence file.", len(two_bit))
+
+        return two_bit
 
     def _strip_newlines(self, text: str) -> str:
         """Strip carriage return and line feed newline characters from a text string
@@ -221,7 +610,7 @@ class RosalindDataset:
         :return: The text string stripped of newline characters
         :rtype: str
         """
-        return re.sub(r"\r|\n", "", text)
+        return text.replace("\r", "").replace("\n", "")
 
     def _set_file_position_to_beginning(self) -> None:
         """Set the file position back to the beginning"""
@@ -230,6 +619,64 @@ class RosalindDataset:
         return None
 
 
+class RosalindAnswer:
+    """Answer made of items separated by a separator, formatted lazily.
+
+    Items are converted to strings and joined ANSWER_CHUNK_SIZE at a time as the answer is written, so a large answer
+    never exists as a single string. An answer built from an iterator can only be written once.
+    """
+
+    def __init__(self, items: Iterable, sep: str = " ") -> None:
+        """Initialize the answer object
+
+        :param items: Items of the answer. Items that are not strings are converted with str.
+        :type items: Iterable
+        :param sep: Separator of the items, defaults to " "
+        :type sep: str
+        """
+        self.items = items
+        self.sep = sep
+
+    def __iter__(self) -> Iterator[str]:
+        items = iter(self.items)
+        first_chunk = True
+        while True:
+            chunk = self.sep.join(map(str, itertools.islice(items, ANSWER_CHUNK_SIZE)))
+            if not chunk:
+                return
+            yield chunk if first_chunk else self.sep + chunk
+            first_chunk = False
+
+    def __str__(self) -> str:
+        return "".join(self)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (str, RosalindAnswer)):
+            return str(self) == str(other)
+
+        return NotImplemented
+
+
+def write_answer(answer: Any, output_file: Optional[TextIO] = None) -> None:
+    """Write an answer followed by a newline. RosalindAnswer objects are written a chunk at a time.
+
+    :param answer: The answer. Answers that are not RosalindAnswer objects are converted with str.
+    :type answer: Any
+    :param output_file: Output file. If None, the output file of the current click context or else standard output, defaults to None
+    :type output_file: Optional[TextIO]
+    """
+    if output_file is None:
+        context = click.get_current_context(silent=True)
+        output_file = context.meta.get(OUTPUT_FILE_KEY) if context is not None else None
+    if output_file is None:
+        output_file = sys.stdout
+
+    for chunk in answer if isinstance(answer, RosalindAnswer) else [str(answer)]:
+        output_file.write(chunk)
+    output_file.write("\n")
+    output_file.flush()
+
+
 class RosalindSolution(ABC):
     """A representation of a submission to Rosalind"""
 
@@ -246,29 +693,30 @@ class RosalindSolution(ABC):
         self.report_solution()
 
     @abstractmethod
-    def _solve_problem(self) -> str:
+    def _solve_problem(self) -> Union[str, RosalindAnswer]:
         """Implement the solution to solve the problem in Rosalind
 
         :return: The solution to the problem in the format expected by Rosalind.
-        :rtype: str
+        :rtype: Union[str, RosalindAnswer]
         """
 
     def report_solution(self) -> None:
         """Report the solution"""
-        click.echo(self.solution)
+        write_answer(self.solution)
 
-    def _format_rosalind_answer(self, answer: list, sep: str = " ") -> str:
-        """Format a list as a string with elements separated by spaces as is commonly expected for solutions to problems for Rosalind.
+    def _format_rosalind_answer(self, answer: Iterable, sep: str = " ") -> RosalindAnswer:
+        """Format an iterable with elements separated by spaces as is commonly expected for solutions to problems for Rosalind.
 
-        :param list_to_format: List to format. If elements are not strings they will be converted.
-        :type list_to_format: list
-        :return: String of list formatted for Rosalind.
-        :rtype: str
+        :param answer: Iterable to format. If elements are not strings they will be converted.
+        :type answer: Iterable
+        :param sep: Separator of the elements, defaults to " "
+        :type sep: str
+        :return: Answer formatted for Rosalind as it is written.
+        :rtype: RosalindAnswer
         """
         self.logger.info("Formatting answer for submission to Rosalind")
 
-        formatted_answer = sep.join(answer)
-        return formatted_answer
+        return RosalindAnswer(answer, sep=sep)
 
     def _convert_iterable_to_list_of_str(self, iterable) -> list:
         """Convert an iterable to a list of strings
@@ -0,0 +1,140 @@
+"""kmer_trie.py
+
+A module for enumerating the d-neighborhoods of many k-mers at once through the KmerTrie class
+"""
+
+from __future__ import annotations
+import logging
+from array import array
+from collections import Counter
+from typing import Iterable, Iterator, Union
+
+from bioinformatics_textbook.dna import DNA
+
+
+class KmerTrie:
+    """Trie of integer coded k-mers with a count at each leaf.
+
+    Every distinct k-mer is inserted once, so k-mers that share a prefix share the nodes of that prefix. The
+    d-neighborhoods of all k-mers are enumerated by a single depth-first walk over neighbor prefixes that carries the
+    trie nodes still within the mismatch budget. The work of a prefix is done once for every k-mer below it, and
+    each neighbor is emitted once together with the total count of the k-mers it is a neighbor of.
+
+    Nodes are numbered from the root (0) and stored in flat arrays: the children of node n are at positions 4n to
+    4n + 3 of `children`, where 0 means no child since the root is nobody's child.
+    """
+
+    def __init__(self, kmer_length: int, logger: logging.Logger = logging.getLogger(__name__)) -> None:
+        self.kmer_length = kmer_length
+        self.logger = logger
+
+        self.children = array("l", [0, 0, 0, 0])
+        self.counts = array("q", [0])
+
+    @classmethod
+    def from_sequences(
+        cls,
+        sequences: Iterable[Union[str, bytes, memoryview]],
+        kmer_length: int,
+        logger: logging.Logger = logging.getLogger(__name__),
+    ) -> KmerTrie:
+        """Construct a trie of every k-mer window of a collection of DNA sequences
+
+        :param sequences: DNA sequences as strings or ASCII bytes
+        :type sequences: Iterable[Union[str, bytes, memoryview]]
+        :param kmer_length: k-mer length
+        :type kmer_length: int
+        :return: Trie in which each distinct window is counted once per occurrence
+        :rtype: KmerTrie
+        """
+        window_counts = Counter()
+        for seq in sequences:
+            window_counts.update(DNA.generate_kmer_numbers(seq, kmer_length))
+
+        trie = cls(kmer_length=kmer_length, logger=logger)
+        for number, count in window_counts.items():
+            trie.insert(number, count)
+
+        trie.logger.info("Inserted %s distinct k-mers into a trie of %s nodes.", len(window_counts), len(trie))
+
+        return trie
+
+    def __len__(self) -> int:
+        return len(self.counts)
+
+    def insert(self, number: int, count: int = 1) -> None:
+        """Insert a k-mer, or add to its count if it is already in the trie
+
+        :param number: Integer code of the k-mer
+        :type number: int
+        :param count: Count to add, defaults to 1
+        :type count: int
+        """
+        node = 0
+        for shift in range(2 * self.kmer_length - 2, -1, -2):
+            slot = 4 * node + ((number >> shift) & 3)
+            child = self.children[slot]
+            if not child:
+                child = len(self.counts)
+                self.children[slot] = child
+                self.children.extend((0, 0, 0, 0))
+                self.counts.append(0)
+            node = child
+
+        self.counts[node] += count
+
+    def generate_neighborhood_counts(self, num_allowed_mismatches: int) -> Iterator[tuple]:
+        """Generate every k-mer within a Hamming distance (d) of some k-mer of the trie
+
+        :param num_allowed_mismatches: The maximum allowed Hamming distance (i.e. the maximum number of allowed mismatches).
+        :type num_allowed_mismatches: int
+        :yield: (code, count) pairs in increasing order of code, where count is the total count of the k-mers of the trie within d mismatches of the k-mer
+        :rtype: Iterator[tuple]
+        """
+        if not self.kmer_length:
+            if self.counts[0]:
+                yield 0, self.counts[0]
+            return
+
+        # existing (base, child) pairs of each node, and the bases a mismatch at each base can turn into
+        node_children = [
+            [(base, child) for base, child in enumerate(self.children[4 * node: 4 * node + 4]) if child]
+            for node in range(len(self))
+        ]
+        other_bases = [[other_base for other_base in range(4) if other_base != base] for base in range(4)]
+        counts = self.counts
+        last_depth = self.kmer_length - 1
+
+        # each entry is a neighbor prefix, its length, and the trie nodes it reaches with their mismatches so far
+        stack = [(0, 0, [(0, 0)])]
+        while stack:
+            prefix, depth, active = stack.pop()
+
+            if depth == last_depth:
+                # the children of the active nodes are leaves, so only their counts are needed
+                leaf_counts = [0, 0, 0, 0]
+                for node, num_mismatches in active:
+                    for base, child in node_children[node]:
+                        leaf_counts[base] += counts[child]
+                        if num_mismatches < num_allowed_mismatches:
+                            for other_base in other_bases[base]:
+                                leaf_counts[other_base] += counts[child]
+                for base, count in enumerate(leaf_counts):
+                    if count:
+                        yield (prefix << 2) | base, count
+                continue
+
+            # distribute the children of the active nodes over the four possible next bases of the prefix
+            next_active = ([], [], [], [])
+            for node, num_mismatches in active:
+                for base, child in node_children[node]:
+                    next_active[base].append((child, num_mismatches))
+                    if num_mismatches < num_allowed_mismatches:
+                        for other_base in other_bases[base]:
+                            next_active[other_base].append((child, num_mismatches + 1))
+
+            # push in reverse so that prefixes are popped in lexicographic order
+            for base in range(3, -1, -1):
+                if next_active[base]:
+                    stack.append(((prefix << 2) | base, depth + 1, next_active[base]))
+
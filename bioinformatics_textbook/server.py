@@ -0,0 +1,329 @@
+"""server.py
+
+A module for answering pattern matching queries against genomes that stay loaded between queries, through the
+QueryServer class and its QueryClient
+
+Requests and responses are JSON objects, one per line, over a Unix domain socket or a localhost TCP socket. A request
+has a "command" and the fields of that command:
+
+* ba1a: "pattern", and "genome" (name of a loaded genome) or "text" -> number of occurrences of the pattern
+* ba1d: "pattern", and "genome" or "text" -> starting positions of the pattern
+* ba1h: "pattern", "hamming_dist", and "genome" or "text" -> starting positions of approximate occurrences
+* ba1g: "pattern" and "text" -> Hamming distance of the two strings
+* genomes: no fields -> names of the loaded genomes
+
+"genome" may be omitted when exactly one genome is loaded. A response is {"ok": true, "answer": "..."} with the answer
+formatted as for Rosalind, or {"ok": false, "error": "..."}.
+"""
+
+import asyncio
+import json
+import logging
+import socket
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Iterable, Optional
+
+from bioinformatics_textbook.ch01.pattern_occurrences import PatternOccurrences
+from bioinformatics_textbook.dna import DNA
+from bioinformatics_textbook.inout import RosalindAnswer, read_sequence_records
+
+# maximum size of a request line, which may hold a whole text
+MAX_REQUEST_SIZE = 1 << 26
+LOCALHOST = "127.0.0.1"
+
+
+def load_genomes(sequence_paths: Iterable[str]) -> dict:
+    """Load the records of FASTA, FASTQ, or 2-bit files as genomes
+
+    :param sequence_paths: Paths of the sequence files, which may be compressed
+    :type sequence_paths: Iterable[str]
+    :raises ValueError: If two records have the same name
+    :return: Record names mapped to their sequences
+    :rtype: dict
+    """
+    genomes = {}
+    for path in sequence_paths:
+        with open(path, "rb") as f:
+            for record in read_sequence_records(f):
+                if record.name in genomes:
+                    raise ValueError(f"Genome {record.name} is in more than one record.")
+                genomes[record.name] = bytes(record.sequence).decode()
+
+    return genomes
+
+
+def answer_request(request: dict, genomes: dict) -> str:
+    """Answer a request
+
+    :param request: The request
+    :type request: dict
+    :param genomes: Loaded genomes
+    :type genomes: dict
+    :raises ValueError: If the request is not valid
+    :return: Answer formatted as for Rosalind
+    :rtype: str
+    """
+    if not isinstance(request, dict):
+        raise ValueError("Request is not a JSON object.")
+
+    command = request.get("command")
+    if command == "genomes":
+        return str(RosalindAnswer(genomes, sep="\n"))
+    if command not in ("ba1a", "ba1d", "ba1g", "ba1h"):
+        raise ValueError(f"Unknown command: {command}")
+
+    pattern = _get_field(request, "pattern", str)
+    if command == "ba1g":
+        return str(DNA(pattern).compute_hamming_distance(_get_field(request, "text", str)))
+
+    if "text" in request:
+        text = _get_field(request, "text", str)
+    elif "genome" in request:
+        name = _get_field(request, "genome", str)
+        if name not in genomes:
+            raise ValueError(f"Unknown genome: {name}")
+        text = genomes[name]
+    elif len(genomes) == 1:
+        text = next(iter(genomes.values()))
+    else:
+        raise ValueError(f"Request has neither a text nor a genome, and {len(genomes)} genomes are loaded.")
+
+    pattern_occurrences = PatternOccurrences()
+    if command == "ba1a":
+        return str(sum(1 for _ in pattern_occurrences.generate_starting_positions(pattern=pattern, genome=text)))
+    if command == "ba1d":
+        return str(RosalindAnswer(pattern_occurrences.generate_starting_positions(pattern=pattern, genome=text)))
+
+    positions = pattern_occurrences.find_approx_starting_positions(
+        pattern=pattern, genome=text, num_allowed_mismatches=_get_field(request, "hamming_dist", int)
+    )
+
+    return str(RosalindAnswer(positions))
+
+
+def _get_field(request: dict, field: str, field_type: type):
+    """Get a required field of a request
+
+    :raises ValueError: If the field is missing or of another type
+    """
+    value = request.get(field)
+    if not isinstance(value, field_type) or isinstance(value, bool):
+        raise ValueError(f"Request field {field} must be of type {field_type.__name__}.")
+
+    return value
+
+
+# genomes of the current process, loaded once by _initialize_worker
+_genomes: dict = {}
+_genome_paths: tuple = ()
+
+
+def _initialize_worker(sequence_paths: tuple) -> None:
+    """Load the genomes of the server once per process. Forked workers inherit the genomes of the server instead."""
+    global _genomes, _genome_paths
+
+    if _genome_paths != sequence_paths:
+        _genomes = load_genomes(sequence_paths)
+        _genome_paths = sequence_paths
+
+
+def _answer_request_in_worker(request: dict) -> dict:
+    """Answer a request with the genomes of the current process
+
+    :param request: The request
+    :type request: dict
+    :return: Response to the request
+    :rtype: dict
+    """
+    try:
+        return {"ok": True, "answer": answer_request(request, _genomes)}
+    except ValueError as error:
+        return {"ok": False, "error": str(error)}
+
+
+class QueryServer:
+    """Server that loads genomes once and answers requests until it is stopped.
+
+    Connections are accepted by an asyncio event loop, and requests are answered in a pool of worker processes, or in
+    a single background thread for one worker, so CPU-bound requests never block other connections. Requests of the
+    same connection are answered in order.
+    """
+
+    def __init__(
+        self,
+        sequence_paths: Iterable[str] = (),
+        num_workers: int = 1,
+        logger: logging.Logger = logging.getLogger(__name__),
+    ) -> None:
+        """Initialize the server object and load its genomes
+
+        :param sequence_paths: Paths of FASTA, FASTQ, or 2-bit files of the genomes, defaults to ()
+        :type sequence_paths: Iterable[str]
+        :param num_workers: Number of worker processes that answer requests, defaults to 1
+        :type num_workers: int
+        :param logger: Logger, defaults to logging.getLogger(__name__)
+        :type logger: logging.Logger
+        """
+        self.sequence_paths = tuple(sequence_paths)
+        self.num_workers = num_workers
+        self.logger = logger
+
+        _initialize_worker(self.sequence_paths)
+        self.logger.info("Loaded %s genomes.", len(_genomes))
+
+    def run(self, socket_path: Optional[str] = None, port: Optional[int] = None) -> None:
+        """Answer requests in a new event loop until the server is interrupted
+
+        :param socket_path: Path of a Unix domain socket to listen on, defaults to None
+        :type socket_path: Optional[str]
+        :param port: Port to listen on at localhost, if no socket path is given, defaults to None
+        :type port: Optional[int]
+        """
+        asyncio.run(self.serve(socket_path=socket_path, port=port))
+
+    async def serve(self, socket_path: Optional[str] = None, port: Optional[int] = None) -> None:
+        """Answer requests until the server is cancelled
+
+        :param socket_path: Path of a Unix domain socket to listen on, defaults to None
+        :type socket_path: Optional[str]
+        :param port: Port to listen on at localhost, if no socket path is given, defaults to None
+        :type port: Optional[int]
+        """
+        with self._create_executor() as executor:
+            server = await self.start(executor, socket_path=socket_path, port=port)
+            async with server:
+                await server.serve_forever()
+
+    async def start(
+        self, executor: Executor, socket_path: Optional[str] = None, port: Optional[int] = None
+    ) -> asyncio.AbstractServer:
+        """Start listening for connections
+
+        :param executor: Executor that answers requests
+        :type executor: Executor
+        :param socket_path: Path of a Unix domain socket to listen on, defaults to None
+        :type socket_path: Optional[str]
+        :param port: Port to listen on at localhost, if no socket path is given, defaults to None
+        :type port: Optional[int]
+        :raises ValueError: If neither a socket path nor a port is given
+        :return: The listening server
+        :rtype: asyncio.AbstractServer
+        """
+
+        async def handle_connection(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+            await self._handle_connection(executor, reader, writer)
+
+        if socket_path is not None:
+            server = await asyncio.start_unix_server(handle_connection, path=socket_path, limit=MAX_REQUEST_SIZE)
+        elif port is not None:
+            server = await asyncio.start_server(handle_connection, host=LOCALHOST, port=port, limit=MAX_REQUEST_SIZE)
+        else:
+            raise ValueError("Either a socket path or a port is required.")
+
+        self.logger.info("Listening on %s.", socket_path or f"{LOCALHOST}:{port}")
+
+        return server
+
+    def _create_executor(self) -> Executor:
+        """Create the executor that answers requests
+
+        :return: A thread pool of one thread for one worker, else a pool of worker processes
+        :rtype: Executor
+        """
+        if self.num_workers == 1:
+            return ThreadPoolExecutor(max_workers=1)
+
+        return ProcessPoolExecutor(
+            max_workers=self.num_workers, initializer=_initialize_worker, initargs=(self.sequence_paths,)
+        )
+
+    async def _handle_connection(
+        self, executor: Executor, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Answer the requests of a connection until the client closes it
+
+        :param executor: Executor that answers requests
+        :type executor: Executor
+        :param reader: Reader of the connection
+        :type reader: asyncio.StreamReader
+        :param writer: Writer of the connection
+        :type writer: asyncio.StreamWriter
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    response = {"ok": False, "error": f"Request is larger than {MAX_REQUEST_SIZE} bytes."}
+                    writer.write(json.dumps(response).encode() + b"\n")
+                    break
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+
+                try:
+                    request = json.loads(line)
+                except ValueError as error:
+                    response = {"ok": False, "error": f"Request is not valid JSON: {error}"}
+                else:
+                    response = await loop.run_in_executor(executor, _answer_request_in_worker, request)
+                    self.logger.debug("Answered a request: ok = %s", response["ok"])
+
+                writer.write(json.dumps(response).encode() + b"\n")
+                await writer.drain()
+        except ConnectionError:
+            self.logger.debug("Client closed its connection.")
+        finally:
+            writer.close()
+
+
+class QueryClient:
+    """Blocking client of a QueryServer, which sends requests over one connection"""
+
+    def __init__(self, socket_path: Optional[str] = None, port: Optional[int] = None) -> None:
+        """Initialize the client object and connect to the server
+
+        :param socket_path: Path of the Unix domain socket of the server, defaults to None
+        :type socket_path: Optional[str]
+        :param port: Port of the server at localhost, if no socket path is given, defaults to None
+        :type port: Optional[int]
+        :raises ValueError: If neither a socket path nor a port is given
+        """
+        if socket_path is not None:
+            self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self.socket.connect(socket_path)
+        elif port is not None:
+            self.socket = socket.create_connection((LOCALHOST, port))
+        else:
+            raise ValueError("Either a socket path or a port is required.")
+
+        self._file = self.socket.makefile("rwb")
+
+    def query(self, request: dict) -> dict:
+        """Send a request and wait for its response
+
+        :param request: The request
+        :type request: dict
+        :raises ConnectionError: If the server closed the connection
+        :return: Response of the server
+        :rtype: dict
+        """
+        self._file.write(json.dumps(request).encode() + b"\n")
+        self._file.flush()
+        line = self._file.readline()
+        if not line:
+            raise ConnectionError("Server closed the connection.")
+
+        return json.loads(line)
+
+    def close(self) -> None:
+        self._file.close()
+        self.socket.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,308 @@
+"""two_bit.py
+
+A module for caching genomes in a compact 2-bit binary format and loading them back through the TwoBitFile class
+
+Layout of a 2-bit file, with all integers little-endian:
+
+* header: magic, format version, number of records, number of N blocks, and size of the record names
+* int64 arrays: byte offset of each record in the packed data (plus the end of the last record), length of each
+  record, index of the first N block of each record (plus the total), and start and length of each N block
+* record names, separated by newlines and padded to a multiple of 8 bytes
+* packed data: four nucleotides per byte with the first nucleotide in the high bits, each record starting on a new
+  byte. Runs of N are stored as N blocks and packed as A.
+"""
+
+from __future__ import annotations
+import io
+import mmap
+import os
+import struct
+from typing import BinaryIO, Iterable, Iterator, Union
+
+import numpy as np
+
+TWO_BIT_MAGIC = b"2BIT"
+TWO_BIT_VERSION = 1
+TWO_BIT_HEADER = struct.Struct("<4sIQQQ")
+
+# 2-bit codes of nucleotides indexed by their ASCII byte, in either case; N maps to N_CODE and other bytes to 255
+N_CODE = 4
+PACKING_CODES = np.full(256, 255, dtype=np.uint8)
+PACKING_CODES[np.frombuffer(b"ACGTNacgtn", dtype=np.uint8)] = [0, 1, 2, 3, N_CODE, 0, 1, 2, 3, N_CODE]
+# four 2-bit codes of each packed byte
+UNPACKING_CODES = ((np.arange(256, dtype=np.uint8)[:, None] >> np.array([6, 4, 2, 0], dtype=np.uint8)) & 3).astype(np.uint8)
+# four ASCII nucleotides of each packed byte
+UNPACKING_NUCLEOTIDES = np.frombuffer(b"ACGT", dtype=np.uint8)[UNPACKING_CODES]
+# largest k-mer length whose integer codes fit in 64 bits
+MAX_KMER_LENGTH = 32
+
+
+class TwoBitFile:
+    """Genome records loaded from a memory mapped 2-bit file.
+
+    Opening a file only reads its header and record table, which are zero-copy views of the mapping, so it takes
+    about as long for a multi-gigabase genome as for a short one. Records are unpacked when they are accessed.
+    """
+
+    def __init__(self, buffer: Union[mmap.mmap, bytes]) -> None:
+        """Initialize the 2-bit file object
+
+        :param buffer: Contents of a 2-bit file
+        :type buffer: Union[mmap.mmap, bytes]
+        :raises ValueError: If the contents are not a 2-bit file of a supported version
+        """
+        if len(buffer) < TWO_BIT_HEADER.size:
+            raise ValueError("File is too short to be a 2-bit file.")
+        magic, version, num_records, num_n_blocks, names_size = TWO_BIT_HEADER.unpack_from(buffer, 0)
+        if magic != TWO_BIT_MAGIC:
+            raise ValueError("File is not a 2-bit file.")
+        if version != TWO_BIT_VERSION:
+            raise ValueError(f"Unsupported 2-bit file version: {version}")
+
+        self.buffer = buffer
+
+        position = TWO_BIT_HEADER.size
+        arrays = []
+        for size in (num_records + 1, num_records, num_records + 1, num_n_blocks, num_n_blocks):
+            arrays.append(np.frombuffer(buffer, dtype="<i8", count=size, offset=position))
+            position += 8 * size
+        self.data_offsets, self.lengths, self.n_block_offsets, self.n_starts, self.n_lengths = arrays
+
+        names = bytes(buffer[position: position + names_size]).decode()
+        self.names = names.split("\n") if num_records else []
+        position += _pad(names_size)
+
+        self.data = np.frombuffer(buffer, dtype=np.uint8, count=int(self.data_offsets[-1]), offset=position)
+
+    @classmethod
+    def from_file(cls, input_file: BinaryIO, head: bytes = b"") -> TwoBitFile:
+        """Load a 2-bit file, memory mapped when possible or else read whole
+
+        :param input_file: The 2-bit file. Must be opened for reading in binary mode.
+        :type input_file: BinaryIO
+        :param head: Bytes already read from the start of a file that cannot be mapped, defaults to b""
+        :type head: bytes
+        :return: 2-bit file object
+        :rtype: TwoBitFile
+        """
+        try:
+            return cls(mmap.mmap(input_file.fileno(), 0, access=mmap.ACCESS_READ))
+        except (AttributeError, OSError, ValueError, io.UnsupportedOperation):
+            pass
+
+        if head and not input_file.seekable():
+            return cls(head + input_file.read())
+
+        input_file.seek(0, os.SEEK_SET)
+
+        return cls(input_file.read())
+
+    def __len__(self) -> int:
+        return len(self.lengths)
+
+    def codes(self, i: int) -> np.ndarray:
+        """Unpack the 2-bit nucleotide codes of a record. Positions in N blocks have the code of A.
+
+        :param i: Index of the record
+        :type i: int
+        :return: Codes of the record
+        :rtype: np.ndarray
+        """
+        return self._unpack(i, UNPACKING_CODES)
+
+    def masked_codes(self, i: int) -> np.ndarray:
+        """Unpack the 2-bit nucleotide codes of a record with positions in N blocks set to 255, the code of characters
+        that are not nucleotides
+
+        :param i: Index of the record
+        :type i: int
+        :return: Codes of the record
+        :rtype: np.ndarray
+        """
+        codes = self.codes(i)
+        for start, length in self.n_blocks(i):
+            codes[start: start + length] = 255
+
+        return codes
+
+    def kmer_numbers(self, i: int, kmer_length: int) -> np.ndarray:
+        """Compute the integer codes of the k-mers of a record from its 2-bit codes, without decoding it to ASCII.
+        Windows that overlap an N block are skipped, as DNA.generate_kmer_numbers skips windows that contain N.
+
+        :param i: Index of the record
+        :type i: int
+        :param kmer_length: k-mer length
+        :type kmer_length: int
+        :raises ValueError: If the k-mer length is not between 1 and MAX_KMER_LENGTH
+        :return: Integer codes of k-mers in order of position
+        :rtype: np.ndarray
+        """
+        if not 1 <= kmer_length <= MAX_KMER_LENGTH:
+            raise ValueError(f"k-mer length must be between 1 and {MAX_KMER_LENGTH}.")
+
+        codes = self.codes(i)
+        num_windows = len(codes) - kmer_length + 1
+        if num_windows <= 0:
+            return np.empty(0, dtype=np.uint64)
+
+        numbers = np.zeros(num_windows, dtype=np.uint64)
+        for j in range(kmer_length):
+            numbers <<= np.uint64(2)
+            numbers |= codes[j: j + num_windows]
+
+        # a window overlaps an N block if the number of N positions before its end and before its start differ
+        num_n = np.zeros(len(codes) + 1, dtype=np.int64)
+        for start, length in self.n_blocks(i):
+            num_n[start + 1: start + length + 1] = 1
+        np.cumsum(num_n, out=num_n)
+
+        return numbers[num_n[kmer_length:] == num_n[:num_windows]]
+
+    def count_kmers(self, kmer_length: int) -> tuple:
+        """Count the k-mers of every record by their integer codes. k-mers never span two records.
+
+        :param kmer_length: k-mer length
+        :type kmer_length: int
+        :return: Distinct integer codes of k-mers in increasing order, and the count of each
+        :rtype: tuple
+        """
+        numbers = np.concatenate(
+            [np.empty(0, dtype=np.uint64), *(self.kmer_numbers(i, kmer_length) for i in range(len(self)))]
+        )
+
+        return np.unique(numbers, return_counts=True)
+
+    def n_blocks(self, i: int) -> list:
+        """Get the runs of N of a record
+
+        :param i: Index of the record
+        :type i: int
+        :return: (start, length) of each run of N in order of position
+        :rtype: list
+        """
+        blocks = slice(self.n_block_offsets[i], self.n_block_offsets[i + 1])
+
+        return list(zip(self.n_starts[blocks].tolist(), self.n_lengths[blocks].tolist()))
+
+    def sequence(self, i: int) -> bytes:
+        """Unpack the sequence of a record
+
+        :param i: Index of the record
+        :type i: int
+        :return: Sequence as upper case ASCII bytes
+        :rtype: bytes
+        """
+        sequence = self._unpack(i, UNPACKING_NUCLEOTIDES)
+        for start, length in self.n_blocks(i):
+            sequence[start: start + length] = ord("N")
+
+        return sequence.tobytes()
+
+    def records(self) -> Iterator[tuple]:
+        """Generate the records of the file
+
+        :yield: (name, sequence) of each record in order of the file
+        :rtype: Iterator[tuple]
+        """
+        for i, name in enumerate(self.names):
+            yield name, self.sequence(i)
+
+    def _unpack(self, i: int, table: np.ndarray) -> np.ndarray:
+        """Unpack a record through a table of the four values of each packed byte
+
+        :param i: Index of the record
+        :type i: int
+        :param table: Array of shape (256, 4) of values
+        :type table: np.ndarray
+        :return: One value per nucleotide of the record
+        :rtype: np.ndarray
+        """
+        packed = self.data[self.data_offsets[i]: self.data_offsets[i + 1]]
+
+        return table[packed].ravel()[: self.lengths[i]]
+
+
+def pack_sequence(sequence: Union[bytes, memoryview]) -> tuple:
+    """Pack a DNA sequence four nucleotides per byte
+
+    :param sequence: DNA sequence as ASCII bytes of A, C, G, T, and N, in either case
+    :type sequence: Union[bytes, memoryview]
+    :raises ValueError: If the sequence contains other characters
+    :return: Packed sequence, and the starts and lengths of its runs of N
+    :rtype: tuple
+    """
+    codes = PACKING_CODES[np.frombuffer(sequence, dtype=np.uint8)]
+    if (codes == 255).any():
+        raise ValueError("Sequence contains characters other than A, C, G, T, and N.")
+
+    is_n = np.zeros(len(codes) + 2, dtype=np.int8)
+    is_n[1:-1] = codes == N_CODE
+    changes = np.flatnonzero(np.diff(is_n))
+    n_starts, n_ends = changes[::2], changes[1::2]
+
+    padded = np.zeros(-(-len(codes) // 4) * 4, dtype=np.uint8)
+    padded[: len(codes)] = np.where(codes == N_CODE, 0, codes)
+    padded = padded.reshape(-1, 4)
+    packed = (padded[:, 0] << 6) | (padded[:, 1] << 4) | (padded[:, 2] << 2) | padded[:, 3]
+
+    return packed.astype(np.uint8).tobytes(), n_starts, n_ends - n_starts
+
+
+def write_two_bit(records: Iterable[tuple], output_file: BinaryIO) -> int:
+    """Write genome records to a 2-bit file
+
+    :param records: (name, sequence) of each record, where sequences are ASCII bytes
+    :type records: Iterable[tuple]
+    :param output_file: The 2-bit file. Must be opened for writing in binary mode.
+    :type output_file: BinaryIO
+    :raises ValueError: If a record name contains a newline or a sequence cannot be packed
+    :return: Number of records written
+    :rtype: int
+    """
+    names, lengths, packed_sequences = [], [], []
+    n_starts, n_lengths, n_block_counts = [], [], []
+    for name, sequence in records:
+        if "\n" in name:
+            raise ValueError(f"Record name contains a newline: {name!r}")
+        packed, starts, run_lengths = pack_sequence(sequence)
+        names.append(name)
+        lengths.append(len(sequence))
+        packed_sequences.append(packed)
+        n_starts.append(starts)
+        n_lengths.append(run_lengths)
+        n_block_counts.append(len(starts))
+
+    n_starts = np.concatenate([np.zeros(0, dtype=np.int64), *n_starts])
+    n_lengths = np.concatenate([np.zeros(0, dtype=np.int64), *n_lengths])
+    data_offsets = np.zeros(len(names) + 1, dtype="<i8")
+    np.cumsum([len(packed) for packed in packed_sequences], out=data_offsets[1:])
+    n_block_offsets = np.zeros(len(names) + 1, dtype="<i8")
+    np.cumsum(n_block_counts, out=n_block_offsets[1:])
+    encoded_names = "\n".join(names).encode()
+
+    output_file.write(
+        TWO_BIT_HEADER.pack(TWO_BIT_MAGIC, TWO_BIT_VERSION, len(names), len(n_starts), len(encoded_names))
+    )
+    for values in (data_offsets, lengths, n_block_offsets, n_starts, n_lengths):
+        output_file.write(np.asarray(values, dtype="<i8").tobytes())
+    output_file.write(encoded_names.ljust(_pad(len(encoded_names)), b"\0"))
+    for packed in packed_sequences:
+        output_file.write(packed)
+
+    return len(names)
+
+
+def is_two_bit(head: bytes) -> bool:
+    """Check whether the start of a file is the start of a 2-bit file
+
+    :param head: First bytes of the file
+    :type head: bytes
+    :return: Whether the file is a 2-bit file
+    :rtype: bool
+    """
+    return head[: len(TWO_BIT_MAGIC)] == TWO_BIT_MAGIC
+
+
+def _pad(size: int) -> int:
+    """Round a size up to a multiple of 8 bytes"""
+    return -(-size // 8) * 8
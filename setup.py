@@ -9,6 +9,7 @@ setup(
     license='MIT',
     install_requires=[
         'Click',
+        'numpy',
     ],
     entry_points={
         'console_scripts': [
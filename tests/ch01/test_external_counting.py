@@ -0,0 +1,42 @@
+from collections import Counter
+from dataclasses import dataclass
+
+import pytest
+
+from bioinformatics_textbook.ch01.external_counting import ExternalKmerCounter
+
+
+@pytest.fixture
+def external_counts():
+    @dataclass
+    class Sample:
+        numbers = [5, 3, 5, 9, 1, 3, 5, 0, 9, 3]
+        max_table_size = 2
+        merged_counts = [(0, 1), (1, 1), (3, 3), (5, 3), (9, 2)]
+
+    yield Sample()
+
+
+def test_merge_counts(external_counts, tmp_path):
+    with ExternalKmerCounter(max_table_size=external_counts.max_table_size, temp_dir=tmp_path) as counter:
+        for number in external_counts.numbers:
+            counter.add(number)
+        actual_merged_counts = list(counter.merge_counts())
+
+        assert len(counter._runs) > 1
+
+    assert actual_merged_counts == external_counts.merged_counts
+
+
+def test_merge_counts_bounded_fan_in(tmp_path):
+    numbers = [number % 7 for number in range(200)]
+
+    with ExternalKmerCounter(max_table_size=1, temp_dir=tmp_path) as counter:
+        counter.max_merge_fan_in = 3
+        for number in numbers:
+            counter.add(number)
+            # no level ever holds a full fan-in of open runs
+            assert max(Counter(level for level, _ in counter._runs).values(), default=0) < counter.max_merge_fan_in
+        actual_merged_counts = list(counter.merge_counts())
+
+    assert actual_merged_counts == sorted(Counter(numbers).items())
@@ -1,8 +1,9 @@
+import io
 import pytest
 
 from dataclasses import dataclass
 
-from bioinformatics_textbook.ch01.frequent_words import FrequentWords
+from bioinformatics_textbook.ch01.frequent_words import FrequentWords, FrequentWordsTracker, TextKmerLength
 
 
 @pytest.fixture
@@ -27,6 +28,13 @@ def test_find_most_freq_words(freq_words):
     assert actual_most_freq_words == expected_most_freq_words
 
 
+def test_find_most_freq_words_not_dna_in_one_process(caplog):
+    actual_most_freq_words = FrequentWords().find_most_freq_words(text="ABCABCAB", kmer_length=3, num_workers=2)
+
+    assert actual_most_freq_words == ["ABC", "BCA", "CAB"]
+    assert "counted in one process" in caplog.text
+
+
 @pytest.fixture
 def freq_words_mismatches():
     @dataclass
@@ -49,3 +57,123 @@ def test_find_most_freq_words_with_mismatches(freq_words_mismatches):
     )
 
     assert expected_most_freq_kmers == actual_most_freq_kmers
+
+
+def test_find_most_freq_words_with_mismatches_soft_masked_and_n(freq_words_mismatches):
+    expected_most_freq_kmers = freq_words_mismatches.most_freq_kmers
+
+    actual_most_freq_kmers = FrequentWords().find_most_freq_words_with_mismatches(
+        text=f"{freq_words_mismatches.text.lower()}N",
+        kmer_length=freq_words_mismatches.kmer_length,
+        num_allowed_mismatches=freq_words_mismatches.num_allowed_mismatches,
+    )
+
+    assert expected_most_freq_kmers == actual_most_freq_kmers
+
+
+@pytest.fixture
+def freq_words_chunks():
+    @dataclass
+    class Sample:
+        chunks = ["ACGTT", "TCA", "C", "GTTTTACGG"]
+        kmer_length = 3
+        most_freq_words = {"ACG", "TTT"}
+
+    yield Sample()
+
+
+def test_frequent_words_tracker(freq_words_chunks):
+    expected_most_freq_words = freq_words_chunks.most_freq_words
+
+    tracker = FrequentWordsTracker(kmer_length=freq_words_chunks.kmer_length)
+    for chunk in freq_words_chunks.chunks:
+        tracker.append(chunk)
+    actual_most_freq_words = set(tracker.find_most_freq_words())
+
+    assert actual_most_freq_words == expected_most_freq_words
+    assert tracker.freq_table == FrequentWords()._construct_kmer_freq_table(
+        text="".join(freq_words_chunks.chunks), kmer_length=freq_words_chunks.kmer_length
+    )
+
+
+@pytest.fixture
+def kmer_spectrum():
+    @dataclass
+    class Sample:
+        text = "ACGTTTCACGTTTTACGG"
+        kmer_length = 3
+        short_text = "ACGTA"
+        short_kmer_length = 1
+        spectrum = {1: 6, 2: 2, 3: 2}
+        short_spectrum = {1: 3, 2: 1}
+
+    yield Sample()
+
+
+def test_compute_kmer_spectrum(kmer_spectrum):
+    actual_spectrum = FrequentWords().compute_kmer_spectrum(
+        text=kmer_spectrum.text,
+        kmer_length=kmer_spectrum.kmer_length,
+    )
+    actual_short_spectrum = FrequentWords().compute_kmer_spectrum(
+        text=kmer_spectrum.short_text,
+        kmer_length=kmer_spectrum.short_kmer_length,
+    )
+
+    assert actual_spectrum == kmer_spectrum.spectrum
+    assert actual_short_spectrum == kmer_spectrum.short_spectrum
+
+
+def test_compute_kmer_spectrum_bytes(kmer_spectrum):
+    actual_spectrum = FrequentWords().compute_kmer_spectrum(
+        text=memoryview(kmer_spectrum.text.encode()),
+        kmer_length=kmer_spectrum.kmer_length,
+    )
+    actual_non_dna_spectrum = FrequentWords().compute_kmer_spectrum(text=memoryview(b"ANAN"), kmer_length=2)
+
+    assert actual_spectrum == kmer_spectrum.spectrum
+    assert actual_non_dna_spectrum == {1: 1, 2: 1}
+
+
+def test_text_kmer_length_lazy_fields(kmer_spectrum):
+    input_file = io.BytesIO(f"{kmer_spectrum.text}\n{kmer_spectrum.kmer_length}\n".encode())
+
+    dataset = TextKmerLength(input_file)
+
+    assert "text" not in vars(dataset) and "kmer_length" not in vars(dataset)
+    assert dataset._index is None
+    assert bytes(dataset.text_bytes) == kmer_spectrum.text.encode()
+    assert "text" not in vars(dataset)
+    assert dataset.text == kmer_spectrum.text
+    assert dataset.kmer_length == kmer_spectrum.kmer_length
+
+
+@pytest.fixture
+def freq_words_mismatches_rc():
+    @dataclass
+    class Sample:
+        text = "ACGTTGCATGTCGCATGATGCATGAGAGCT"
+        kmer_length = 4
+        num_allowed_mismatches = 1
+        max_table_size = 16
+        most_freq_kmers = {"ACAT", "ATGT"}
+
+    yield Sample()
+
+
+def test_find_most_freq_words_with_mismatches_and_rc_max_table_size(freq_words_mismatches_rc):
+    expected_most_freq_kmers = FrequentWords().find_most_freq_words_with_mismatches_and_rc(
+        text=freq_words_mismatches_rc.text,
+        kmer_length=freq_words_mismatches_rc.kmer_length,
+        num_allowed_mismatches=freq_words_mismatches_rc.num_allowed_mismatches,
+    )
+
+    actual_most_freq_kmers = FrequentWords().find_most_freq_words_with_mismatches_and_rc(
+        text=freq_words_mismatches_rc.text,
+        kmer_length=freq_words_mismatches_rc.kmer_length,
+        num_allowed_mismatches=freq_words_mismatches_rc.num_allowed_mismatches,
+        max_table_size=freq_words_mismatches_rc.max_table_size,
+    )
+
+    assert set(expected_most_freq_kmers) == freq_words_mismatches_rc.most_freq_kmers
+    assert actual_most_freq_kmers == sorted(expected_most_freq_kmers)
@@ -0,0 +1,60 @@
+from dataclasses import dataclass
+
+import pytest
+
+from bioinformatics_textbook.ch01.frequent_words import FrequentWords
+from bioinformatics_textbook.ch01.partitioned_counting import PartitionedKmerCounter
+from bioinformatics_textbook.inout import RECORD_SEPARATOR
+
+
+@pytest.fixture
+def partitioned_counts():
+    @dataclass
+    class Sample:
+        text = "ACGTTTCACGTTTTACGG"
+        kmer_length = 3
+        num_workers = 2
+        most_freq_words = ["ACG", "TTT"]
+
+    yield Sample()
+
+
+def test_find_most_freq_words(partitioned_counts):
+    expected_most_freq_words = partitioned_counts.most_freq_words
+
+    actual_most_freq_words = PartitionedKmerCounter(num_workers=partitioned_counts.num_workers).find_most_freq_words(
+        text=partitioned_counts.text,
+        kmer_length=partitioned_counts.kmer_length,
+    )
+
+    assert actual_most_freq_words == expected_most_freq_words
+
+
+@pytest.mark.parametrize("num_workers", [2, 3, 7, 40])
+def test_count_kmers_slices(partitioned_counts, num_workers):
+    text = partitioned_counts.text + RECORD_SEPARATOR + partitioned_counts.text
+    expected_freq_table = FrequentWords()._construct_kmer_freq_table(
+        text=text,
+        kmer_length=partitioned_counts.kmer_length,
+    )
+
+    actual_freq_table = PartitionedKmerCounter(num_workers=num_workers).count_kmers(
+        text=text,
+        kmer_length=partitioned_counts.kmer_length,
+    )
+
+    assert list(actual_freq_table.items()) == list(expected_freq_table.items())
+
+
+def test_count_kmers(partitioned_counts):
+    expected_freq_table = FrequentWords()._construct_kmer_freq_table(
+        text=partitioned_counts.text,
+        kmer_length=partitioned_counts.kmer_length,
+    )
+
+    actual_freq_table = PartitionedKmerCounter(num_workers=partitioned_counts.num_workers).count_kmers(
+        text=partitioned_counts.text,
+        kmer_length=partitioned_counts.kmer_length,
+    )
+
+    assert list(actual_freq_table.items()) == list(expected_freq_table.items())
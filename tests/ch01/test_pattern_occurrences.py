@@ -48,3 +48,36 @@ def test_find_starting_positions(sample_pattern_matching):
 
     assert actual_positions == expected_positions
 
+
+
+@pytest.fixture
+def sample_approx_pattern_matching():
+    @dataclass
+    class Sample:
+        pattern = "ATTCTGGA"
+        genome = "CGCCCGAATCCAGAACGCATTCCCATATTTCGGGACCACTGGCCTCCACGGTACGGACGTCAATCAAAT"
+        num_allowed_mismatches = 3
+        positions_list = [6, 7, 26, 27]
+
+    yield Sample()
+
+
+def test_find_approx_starting_positions(sample_approx_pattern_matching):
+    expected_positions = sample_approx_pattern_matching.positions_list
+
+    actual_positions = PatternOccurrences().find_approx_starting_positions(
+        pattern=sample_approx_pattern_matching.pattern,
+        genome=sample_approx_pattern_matching.genome,
+        num_allowed_mismatches=sample_approx_pattern_matching.num_allowed_mismatches,
+    )
+
+    assert actual_positions == expected_positions
+
+
+@pytest.mark.parametrize("num_allowed_mismatches, positions_list", [(0, [1]), (3, [0, 1, 2, 3]), (4, [0, 1, 2, 3])])
+def test_find_approx_starting_positions_short_pattern(num_allowed_mismatches, positions_list):
+    actual_positions = PatternOccurrences().find_approx_starting_positions(
+        pattern="ACG", genome="TACGTG", num_allowed_mismatches=num_allowed_mismatches
+    )
+
+    assert actual_positions == positions_list
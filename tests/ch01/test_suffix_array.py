@@ -0,0 +1,56 @@
+from dataclasses import dataclass
+
+import pytest
+
+from bioinformatics_textbook.ch01.suffix_array import SuffixArray
+
+
+@pytest.fixture
+def suffix_array():
+    @dataclass
+    class Sample:
+        text = "ACGTTTCACGTTTTACGG"
+        min_kmer_length = 3
+        max_kmer_length = 5
+        most_freq_words = {
+            3: ["ACG", "TTT"],
+            4: ["ACGT", "CGTT", "GTTT"],
+            5: ["ACGTT", "CGTTT"],
+        }
+        histogram_3 = {1: 6, 2: 2, 3: 2}
+        banana = "BANANA"
+        banana_suffix_array = [5, 3, 1, 0, 4, 2]
+        banana_lcp_array = [0, 1, 3, 0, 0, 2]
+
+    yield Sample()
+
+
+def test_construct_suffix_and_lcp_arrays(suffix_array):
+    actual_suffix_array = SuffixArray(suffix_array.banana)
+
+    assert actual_suffix_array.suffix_array == suffix_array.banana_suffix_array
+    assert actual_suffix_array.lcp_array == suffix_array.banana_lcp_array
+
+
+def test_find_most_freq_words(suffix_array):
+    expected_most_freq_words = suffix_array.most_freq_words
+
+    actual_most_freq_words = SuffixArray(suffix_array.text).find_most_freq_words(
+        min_kmer_length=suffix_array.min_kmer_length,
+        max_kmer_length=suffix_array.max_kmer_length,
+    )
+
+    assert actual_most_freq_words == expected_most_freq_words
+
+
+def test_find_most_freq_words_histogram(suffix_array):
+    most_freq_words = SuffixArray(suffix_array.text).find_most_freq_words(
+        min_kmer_length=suffix_array.min_kmer_length,
+        max_kmer_length=suffix_array.min_kmer_length,
+        histogram=True,
+    )
+
+    kmers, histogram = most_freq_words[suffix_array.min_kmer_length]
+
+    assert kmers == suffix_array.most_freq_words[suffix_array.min_kmer_length]
+    assert histogram == suffix_array.histogram_3
@@ -0,0 +1,83 @@
+from dataclasses import dataclass
+import io
+
+import numpy as np
+import pytest
+
+from bioinformatics_textbook.ch02.greedy_motif_search import GreedyMotifSearch, KTDNAs
+
+
+@pytest.fixture
+def profile_most_probable_kmer():
+    @dataclass
+    class Sample:
+        text = 'ACCTGTTTATTGCCTAAGTTCCGAACAAACCCAATATAGCCCGAGGGCCT'
+        k = 5
+        profile = np.array([
+            [0.2, 0.2, 0.3, 0.2, 0.3],
+            [0.4, 0.3, 0.1, 0.5, 0.1],
+            [0.3, 0.3, 0.5, 0.2, 0.4],
+            [0.1, 0.2, 0.1, 0.1, 0.2],
+        ])
+
+        most_probable_kmer = 'CCGAG'
+
+    yield Sample()
+
+
+def test_find_profile_most_probable_kmer(profile_most_probable_kmer):
+    expected_kmer = profile_most_probable_kmer.most_probable_kmer
+
+    actual_kmer = GreedyMotifSearch().find_profile_most_probable_kmer(
+        text=profile_most_probable_kmer.text,
+        kmer_length=profile_most_probable_kmer.k,
+        profile=profile_most_probable_kmer.profile,
+    )
+
+    assert actual_kmer == expected_kmer
+
+
+@pytest.fixture
+def greedy_motifs():
+    @dataclass
+    class Sample:
+        k = 3
+        dnas = ['GGCGTTCAGGCA', 'AAGAATCAGTCA', 'CAAGGAGTTCGC', 'CACGTCAATCAC', 'CAATAATATTCG']
+
+        motifs = ['CAG', 'CAG', 'CAA', 'CAA', 'CAA']
+        motifs_with_pseudocounts = ['TTC', 'ATC', 'TTC', 'ATC', 'TTC']
+
+    yield Sample()
+
+
+def test_find_motifs(greedy_motifs):
+    actual_motifs = GreedyMotifSearch().find_motifs(
+        kmer_length=greedy_motifs.k,
+        dnas=greedy_motifs.dnas,
+    )
+
+    assert actual_motifs == greedy_motifs.motifs
+
+
+def test_find_motifs_with_pseudocounts(greedy_motifs):
+    actual_motifs = GreedyMotifSearch().find_motifs(
+        kmer_length=greedy_motifs.k,
+        dnas=greedy_motifs.dnas,
+        pseudocounts=True,
+    )
+
+    assert actual_motifs == greedy_motifs.motifs_with_pseudocounts
+
+
+@pytest.mark.parametrize(
+    "dnas, error",
+    [
+        ("GGCGTTCAGGCA\nAAGAAT\n", "DNA string 2 is shorter than the k-mer length 8"),
+        ("GGCGTTCAGGCA\nAAGAATCAGTCA\nCAAGGNGTTCGC\n", "DNA string 3 contains characters other than"),
+    ],
+)
+def test_ktdnas_invalid_dnas(dnas, error):
+    dataset = KTDNAs(io.BytesIO(f"8 3\n{dnas}".encode()))
+
+    with pytest.raises(ValueError, match=error):
+        dataset.dnas
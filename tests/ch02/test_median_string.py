@@ -1,8 +1,10 @@
 from dataclasses import dataclass
+import json
 
 import pytest
 
 from bioinformatics_textbook.ch02.median_string import MedianString
+from bioinformatics_textbook.checkpoint import SearchCheckpoint
 from bioinformatics_textbook.dna import DNA
 
 
@@ -54,3 +56,72 @@ def test_compute_pattern_strings_distance(pattern_strings_distance):
     )
 
     assert actual_distance == expected_distance
+
+
+@pytest.mark.parametrize("search", ["exhaustive", "branch_and_bound"])
+def test_find_median_strings_search(median_string, search):
+    expected_median_strings = ['ACG', 'GAC']
+
+    actual_median_strings = MedianString().find_median_strings(
+        kmer_length=median_string.k,
+        dnas=median_string.dnas,
+        search=search,
+    )
+
+    assert actual_median_strings == expected_median_strings
+
+
+@pytest.mark.parametrize("search", ["exhaustive", "branch_and_bound"])
+def test_find_median_strings_num_workers(median_string, search):
+    expected_median_strings = MedianString().find_median_strings(
+        kmer_length=median_string.k,
+        dnas=median_string.dnas,
+        search=search,
+    )
+
+    actual_median_strings = MedianString().find_median_strings(
+        kmer_length=median_string.k,
+        dnas=median_string.dnas,
+        search=search,
+        num_workers=2,
+    )
+
+    assert actual_median_strings == expected_median_strings
+
+
+@pytest.mark.parametrize("num_workers", [1, 2])
+def test_find_median_strings_resume(median_string, tmp_path, monkeypatch, num_workers):
+    expected_median_strings = ['ACG', 'GAC']
+    path = str(tmp_path / "checkpoint.json")
+
+    # interrupt a search after a few ranges of k-mers
+    search_code_range = MedianString._search_code_range
+    num_calls = []
+
+    def interrupted_search_code_range(self, *args, **kwargs):
+        if len(num_calls) == 5:
+            raise KeyboardInterrupt
+        num_calls.append(1)
+        search_code_range(self, *args, **kwargs)
+
+    monkeypatch.setattr(MedianString, "_search_code_range", interrupted_search_code_range)
+    with pytest.raises(KeyboardInterrupt):
+        MedianString().find_median_strings(
+            kmer_length=median_string.k, dnas=median_string.dnas, checkpoint=SearchCheckpoint(path=path, interval=0)
+        )
+    monkeypatch.setattr(MedianString, "_search_code_range", search_code_range)
+
+    with open(path) as f:
+        assert len(json.load(f)["state"]["completed_ranges"]) == 5
+
+    actual_median_strings = MedianString().find_median_strings(
+        kmer_length=median_string.k,
+        dnas=median_string.dnas,
+        num_workers=num_workers,
+        checkpoint=SearchCheckpoint(path=path, resume=True),
+    )
+
+    assert actual_median_strings == expected_median_strings
+
+    with open(path) as f:
+        assert len(json.load(f)["state"]["completed_ranges"]) == 4 ** median_string.k
@@ -3,6 +3,7 @@ from dataclasses import dataclass
 import pytest
 
 from bioinformatics_textbook.ch02.motif import Motif
+from bioinformatics_textbook.checkpoint import SearchCheckpoint
 
 
 @pytest.fixture
@@ -30,3 +31,84 @@ def test_find_k_d_motifs(k_d_motif):
     )
 
     assert actual_motifs == expected_motifs
+
+
+@pytest.mark.parametrize("engine", ["set", "bitset", "verify", "auto"])
+def test_find_k_d_motifs_engine(k_d_motif, engine):
+    expected_motifs = k_d_motif.k_d_motifs
+
+    actual_motifs = Motif().find_k_d_motifs(
+        kmer_length=k_d_motif.k,
+        num_allowed_mismatches=k_d_motif.d,
+        dnas=k_d_motif.dnas,
+        engine=engine,
+    )
+
+    assert actual_motifs == expected_motifs
+
+
+def test_find_k_d_motifs_bitset_without_bitmap(k_d_motif):
+    expected_motifs = k_d_motif.k_d_motifs
+
+    motif = Motif()
+    motif.max_bitmap_kmer_length = k_d_motif.k - 1
+    actual_motifs = motif.find_k_d_motifs(
+        kmer_length=k_d_motif.k,
+        num_allowed_mismatches=k_d_motif.d,
+        dnas=k_d_motif.dnas,
+        engine="bitset",
+    )
+
+    assert actual_motifs == expected_motifs
+
+
+@pytest.mark.parametrize("engine", ["set", "bitset", "verify"])
+def test_find_k_d_motifs_resume(k_d_motif, tmp_path, monkeypatch, engine):
+    expected_motifs = k_d_motif.k_d_motifs
+    path = str(tmp_path / "checkpoint.json")
+
+    # interrupt a search once two DNA sequences are processed and saved
+    save_partial_motifs = Motif._save_partial_motifs
+
+    def interrupted_save_partial_motifs(self, motifs, next_sequence, num_sequences):
+        save_partial_motifs(self, motifs, next_sequence, num_sequences)
+        if next_sequence == 2:
+            raise KeyboardInterrupt
+
+    monkeypatch.setattr(Motif, "_save_partial_motifs", interrupted_save_partial_motifs)
+    with pytest.raises(KeyboardInterrupt):
+        Motif().find_k_d_motifs(
+            kmer_length=k_d_motif.k,
+            num_allowed_mismatches=k_d_motif.d,
+            dnas=k_d_motif.dnas,
+            engine=engine,
+            checkpoint=SearchCheckpoint(path=path, interval=0),
+        )
+    monkeypatch.setattr(Motif, "_save_partial_motifs", save_partial_motifs)
+
+    actual_motifs = Motif().find_k_d_motifs(
+        kmer_length=k_d_motif.k,
+        num_allowed_mismatches=k_d_motif.d,
+        dnas=k_d_motif.dnas,
+        engine=engine,
+        checkpoint=SearchCheckpoint(path=path, resume=True),
+    )
+
+    assert actual_motifs == expected_motifs
+
+
+@pytest.mark.parametrize("engine", ["set", "bitset", "verify"])
+def test_find_k_d_motifs_resume_without_motifs(tmp_path, engine):
+    path = str(tmp_path / "checkpoint.json")
+    dnas = ["AAAAA", "CCCCC", "GGGGG"]
+
+    for resume in (False, True):
+        actual_motifs = Motif().find_k_d_motifs(
+            kmer_length=3,
+            num_allowed_mismatches=0,
+            dnas=dnas,
+            engine=engine,
+            checkpoint=SearchCheckpoint(path=path, interval=0, resume=resume),
+        )
+
+        assert actual_motifs == set()
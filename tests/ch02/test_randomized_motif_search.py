@@ -0,0 +1,71 @@
+from dataclasses import dataclass
+
+import pytest
+
+from bioinformatics_textbook.ch02.randomized_motif_search import RandomizedMotifSearch
+
+
+@pytest.fixture
+def randomized_motifs():
+    @dataclass
+    class Sample:
+        k = 8
+        dnas = [
+            'CGCCCCTCTCGGGGGTGTTCAGTAAACGGCCA',
+            'GGGCGAGGTATGTGTAAGTGCCAAGGTGCCAG',
+            'TAGTACCGAGACCGAAAGAAGTATACAGGCGT',
+            'TAGATCAAGTTTCAGGTGCACGTCGGTGAACC',
+            'AATCCACCAGCTCCACGTGCAATGTTGGCCTA',
+        ]
+        num_iterations = 100
+
+        motifs = ['TCTCGGGG', 'CCAAGGTG', 'TACAGGCG', 'TTCAGGTG', 'TCCACGTG']
+
+    yield Sample()
+
+
+def test_find_motifs_randomized(randomized_motifs):
+    actual_motifs = RandomizedMotifSearch().find_motifs_randomized(
+        kmer_length=randomized_motifs.k,
+        dnas=randomized_motifs.dnas,
+        num_restarts=1000,
+    )
+
+    assert actual_motifs == randomized_motifs.motifs
+
+
+def test_find_motifs_gibbs(randomized_motifs):
+    actual_motifs = RandomizedMotifSearch().find_motifs_gibbs(
+        kmer_length=randomized_motifs.k,
+        dnas=randomized_motifs.dnas,
+        num_iterations=randomized_motifs.num_iterations,
+        num_restarts=20,
+    )
+
+    assert actual_motifs == randomized_motifs.motifs
+
+
+@pytest.mark.parametrize("patience", [None, 10])
+def test_find_motifs_randomized_num_workers(randomized_motifs, patience):
+    search = RandomizedMotifSearch()
+    search.restarts_per_round = 32
+    search.restarts_per_task = 4
+
+    expected_motifs = search.find_motifs_randomized(
+        kmer_length=randomized_motifs.k,
+        dnas=randomized_motifs.dnas,
+        num_restarts=100,
+        seed=7,
+        patience=patience,
+    )
+
+    actual_motifs = search.find_motifs_randomized(
+        kmer_length=randomized_motifs.k,
+        dnas=randomized_motifs.dnas,
+        num_restarts=100,
+        num_workers=3,
+        seed=7,
+        patience=patience,
+    )
+
+    assert actual_motifs == expected_motifs
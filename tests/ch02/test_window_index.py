@@ -0,0 +1,32 @@
+from dataclasses import dataclass
+
+import numpy as np
+import pytest
+
+from bioinformatics_textbook.ch02.window_index import DNAWindowIndex, decode_kmer_numbers, encode_dna
+
+
+@pytest.fixture
+def window_index():
+    @dataclass
+    class Sample:
+        dnas = ['TTACCTTAAC', 'GATATCTGTC', 'ACGGCGTTCG', 'CCCTAAAGAG', 'CGTCAGAGGT', 'AA']
+        patterns = ['AAA', 'ACG', 'TTT']
+        distances = [8, 8, 10]
+
+    yield Sample()
+
+
+def test_compute_distances(window_index):
+    index = DNAWindowIndex(dnas=window_index.dnas, kmer_length=3)
+    patterns = np.array([encode_dna(pattern) for pattern in window_index.patterns])
+
+    actual_distances = index.compute_distances(patterns)
+
+    assert actual_distances.tolist() == window_index.distances
+
+
+def test_decode_kmer_numbers():
+    actual_kmers = decode_kmer_numbers(np.array([0, 6, 63]), kmer_length=3)
+
+    assert actual_kmers.tolist() == [[0, 0, 0], [0, 1, 2], [3, 3, 3]]
@@ -0,0 +1,74 @@
+from dataclasses import dataclass
+import io
+import os
+
+import pytest
+
+import bioinformatics_textbook.batch
+from bioinformatics_textbook.batch import BatchJob, BatchRunner, read_manifest
+
+
+@pytest.fixture
+def sample_manifest():
+    @dataclass
+    class Sample:
+        manifest = (
+            "# sample manifest\n"
+            '{"command": "ba1d", "input": "ba1d.txt", "output": "ba1d.out", "args": ["--sequence-file", "reads.fq"]}\n'
+            "\n"
+            "ba1b\tba1b.txt\tba1b.out\t--num-workers\t2\n"
+        )
+        jobs = [
+            BatchJob(command="ba1d", input="ba1d.txt", output="ba1d.out", args=("--sequence-file", "reads.fq")),
+            BatchJob(command="ba1b", input="ba1b.txt", output="ba1b.out", args=("--num-workers", "2")),
+        ]
+
+    yield Sample()
+
+
+def test_read_manifest(sample_manifest):
+    assert read_manifest(io.StringIO(sample_manifest.manifest)) == sample_manifest.jobs
+
+
+@pytest.mark.parametrize("line", ['{"command": "ba1d", "input": "ba1d.txt"}', "ba1d\tba1d.txt", "{not json"])
+def test_read_invalid_manifest(line):
+    with pytest.raises(ValueError, match="line 2"):
+        read_manifest(io.StringIO(f"ba1a\tba1a.txt\tba1a.out\n{line}\n"))
+
+
+def test_batch_runner(tmp_path):
+    jobs = [
+        BatchJob(command="ba1a", input="tests/datasets/ch01/ba1a_sample_dataset.txt", output=str(tmp_path / "ba1a.out")),
+        BatchJob(command="ba1a", input=str(tmp_path / "missing.txt"), output=str(tmp_path / "missing.out")),
+        BatchJob(command="ba1g", input="tests/datasets/ch01/ba1g_sample_dataset.txt", output=str(tmp_path / "ba1g.out")),
+    ]
+
+    results = list(BatchRunner().run(jobs))
+
+    assert [result.job for result in results] == jobs
+    assert [result.status for result in results] == ["ok", "failed", "ok"]
+    assert "No such file or directory" in results[1].message
+    assert (tmp_path / "ba1a.out").read_text() == "2\n"
+    assert (tmp_path / "ba1g.out").read_text() == "3\n"
+
+
+class CrashingCLI:
+    """CLI that kills its process for inputs named crash"""
+
+    def main(self, args, **kwargs):
+        if args[-1] == "crash":
+            os._exit(1)
+
+        return 0
+
+
+def test_batch_runner_worker_dies(monkeypatch):
+    # forked worker processes inherit the patched CLI
+    monkeypatch.setattr(bioinformatics_textbook.batch, "cli", CrashingCLI())
+    jobs = [BatchJob(command="ba1a", input=name, output="out") for name in ["a", "crash", "b", "c", "crash", "d"]]
+
+    results = list(BatchRunner(num_workers=2).run(jobs))
+
+    assert [result.job for result in results] == jobs
+    assert [result.status for result in results] == ["ok", "failed", "ok", "ok", "failed", "ok"]
+    assert "worker process died" in results[1].message
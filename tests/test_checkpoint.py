@@ -0,0 +1,60 @@
+from dataclasses import dataclass
+import json
+
+import pytest
+
+from bioinformatics_textbook.checkpoint import SearchCheckpoint, decode_bitmap, encode_bitmap
+
+
+@pytest.fixture
+def search_checkpoint():
+    @dataclass
+    class Sample:
+        search = {"problem": "median_string", "kmer_length": 3}
+        other_search = {"problem": "median_string", "kmer_length": 4}
+        state = {"completed_ranges": [0, 2], "minimum_distance": 2, "median_strings": ["GAC"]}
+        bitmap = (1 << 70) | (1 << 3) | 1
+
+    yield Sample()
+
+
+def test_save_and_load(search_checkpoint, tmp_path):
+    path = str(tmp_path / "checkpoint.json")
+    SearchCheckpoint(path=path).save(search=search_checkpoint.search, state=search_checkpoint.state, force=True)
+
+    actual_state = SearchCheckpoint(path=path, resume=True).load(search=search_checkpoint.search)
+
+    assert actual_state == search_checkpoint.state
+    assert not (tmp_path / "checkpoint.json.tmp").exists()
+
+
+def test_load_without_resume(search_checkpoint, tmp_path):
+    path = str(tmp_path / "checkpoint.json")
+    SearchCheckpoint(path=path).save(search=search_checkpoint.search, state=search_checkpoint.state, force=True)
+
+    assert SearchCheckpoint(path=path).load(search=search_checkpoint.search) is None
+    assert SearchCheckpoint(path=str(tmp_path / "missing.json"), resume=True).load(search_checkpoint.search) is None
+
+
+def test_load_other_search(search_checkpoint, tmp_path):
+    path = str(tmp_path / "checkpoint.json")
+    SearchCheckpoint(path=path).save(search=search_checkpoint.search, state=search_checkpoint.state, force=True)
+
+    with pytest.raises(ValueError):
+        SearchCheckpoint(path=path, resume=True).load(search=search_checkpoint.other_search)
+
+
+def test_save_interval(search_checkpoint, tmp_path):
+    path = tmp_path / "checkpoint.json"
+    checkpoint = SearchCheckpoint(path=str(path), interval=3600)
+
+    checkpoint.save(search=search_checkpoint.search, state=search_checkpoint.state)
+    assert not path.exists()
+
+    checkpoint.save(search=search_checkpoint.search, state=search_checkpoint.state, force=True)
+    assert json.loads(path.read_text())["state"] == search_checkpoint.state
+
+
+def test_encode_bitmap(search_checkpoint):
+    assert decode_bitmap(encode_bitmap(search_checkpoint.bitmap)) == search_checkpoint.bitmap
+    assert decode_bitmap(encode_bitmap(0)) == 0
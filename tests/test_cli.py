@@ -1,3 +1,12 @@
+import gzip
+import lzma
+import signal
+import subprocess
+import sys
+import time
+
+import pytest
+
 from click.testing import CliRunner
 from bioinformatics_textbook.cli import cli
 
@@ -16,6 +25,62 @@ def test_ba1b():
     assert result.output.rstrip() == "GCAT CATG"
 
 
+@pytest.mark.parametrize(
+    "args, dataset, output",
+    [
+        ([], "BANANA\n2\n", "AN NA"),
+        (["--num-workers", "2"], "ACNACN\n2\n", "AC CN"),
+        (["--max-kmer-length", "3"], "BANANA\n2\n", "2: AN NA\n3: ANA"),
+    ],
+)
+def test_ba1b_text_with_n(args, dataset, output):
+    runner = CliRunner()
+    result = runner.invoke(cli, ["ba1b", *args, "-"], input=dataset)
+
+    assert result.exit_code == 0
+    assert result.output.rstrip() == output
+
+
+def test_ba1b_num_workers():
+    runner = CliRunner()
+    result = runner.invoke(cli, ["ba1b", "--num-workers", "2", "tests/datasets/ch01/ba1b_sample_dataset.txt"])
+    assert result.exit_code == 0
+    assert result.output.rstrip() == "GCAT CATG"
+
+
+def test_ba1b_max_kmer_length():
+    runner = CliRunner()
+    result = runner.invoke(cli, ["ba1b", "--max-kmer-length", "5", "tests/datasets/ch01/ba1b_sample_dataset.txt"])
+    assert result.exit_code == 0
+
+    lines = result.output.rstrip().split("\n")
+
+    assert lines[0] == "4: CATG GCAT"
+    assert len(lines) == 2
+
+
+@pytest.mark.parametrize(
+    "args, error",
+    [
+        (["--max-kmer-length", "3"], "3 is smaller than the dataset's k-mer length 4"),
+        (["--max-kmer-length", "5", "--num-workers", "2"], "cannot be combined"),
+    ],
+)
+def test_ba1b_max_kmer_length_invalid(args, error):
+    runner = CliRunner()
+    result = runner.invoke(cli, ["ba1b", *args, "tests/datasets/ch01/ba1b_sample_dataset.txt"])
+
+    assert result.exit_code == 2
+    assert error in result.output
+
+
+def test_kmer_spectrum():
+    runner = CliRunner()
+    result = runner.invoke(cli, ["kmer-spectrum", "tests/datasets/ch01/ba1b_sample_dataset.txt"])
+    assert result.exit_code == 0
+    assert result.output.rstrip().split("\n") == ["1\t17", "2\t2", "3\t2"]
+
+
 def test_ba1c():
     runner = CliRunner()
     result = runner.invoke(cli, ["ba1c", "tests/datasets/ch01/ba1c_sample_dataset.txt"])
@@ -87,6 +152,14 @@ def test_ba1j():
     assert actual_freq_words == expected_freq_words
 
 
+def test_ba1j_max_table_size():
+    runner = CliRunner()
+    result = runner.invoke(cli, ["ba1j", "--max-table-size", "8", "tests/datasets/ch01/ba1j_sample_dataset.txt"])
+
+    assert result.exit_code == 0
+    assert result.output.rstrip() == "ACAT ATGT"
+
+
 def test_ba1n():
     runner = CliRunner()
     result = runner.invoke(cli, ["ba1n", "tests/datasets/ch01/ba1n_sample_dataset.txt"])
@@ -125,6 +198,82 @@ def test_ba2b():
     assert actual_median_string == expected_median_string
 
 
+def test_ba2b_num_workers():
+    runner = CliRunner()
+    result = runner.invoke(cli, ["ba2b", "--num-workers", "2", "tests/datasets/ch02/ba2b_sample_dataset.txt"])
+
+    assert result.exit_code == 0
+    assert result.output.rstrip() == 'ACG'
+
+
+def test_ba2c():
+    runner = CliRunner()
+    result = runner.invoke(cli, ["ba2c", "tests/datasets/ch02/ba2c_sample_dataset.txt"])
+
+    assert result.exit_code == 0
+    assert result.output.rstrip() == 'CCGAG'
+
+
+def test_ba2d():
+    runner = CliRunner()
+    result = runner.invoke(cli, ["ba2d", "tests/datasets/ch02/ba2d_sample_dataset.txt"])
+
+    assert result.exit_code == 0
+    assert result.output.rstrip().split('\n') == ['CAG', 'CAG', 'CAA', 'CAA', 'CAA']
+
+
+@pytest.mark.parametrize("command", ["ba2d", "ba2e", "ba2f", "ba2g"])
+def test_ktdnas_short_dna(tmp_path, command):
+    input_file = tmp_path / "dataset.txt"
+    input_file.write_text("3 2 10\nGGCGTT\nAA\n")
+    runner = CliRunner()
+    result = runner.invoke(cli, [command, str(input_file)])
+
+    assert result.exit_code == 2
+    assert "DNA string 2 is shorter than the k-mer length 3" in result.output
+
+
+def test_ba2e():
+    runner = CliRunner()
+    result = runner.invoke(cli, ["ba2e", "tests/datasets/ch02/ba2e_sample_dataset.txt"])
+
+    assert result.exit_code == 0
+    assert result.output.rstrip().split('\n') == ['TTC', 'ATC', 'TTC', 'ATC', 'TTC']
+
+
+def test_ba2f():
+    runner = CliRunner()
+    result = runner.invoke(cli, ["ba2f", "tests/datasets/ch02/ba2f_sample_dataset.txt"])
+
+    assert result.exit_code == 0
+    assert result.output.rstrip().split('\n') == ['TCTCGGGG', 'CCAAGGTG', 'TACAGGCG', 'TTCAGGTG', 'TCCACGTG']
+
+
+def test_ba2g():
+    runner = CliRunner()
+    result = runner.invoke(cli, ["ba2g", "--num-workers", "2", "tests/datasets/ch02/ba2g_sample_dataset.txt"])
+
+    assert result.exit_code == 0
+    assert result.output.rstrip().split('\n') == ['TCTCGGGG', 'CCAAGGTG', 'TACAGGCG', 'TTCAGGTG', 'TCCACGTG']
+
+
+def test_ba2g_num_iterations(tmp_path):
+    with open("tests/datasets/ch02/ba2g_sample_dataset.txt") as f:
+        first_line, *dnas = f.read().splitlines()
+    k, t, num_iterations = first_line.split(" ")
+    input_file = tmp_path / "ba2g_without_n.txt"
+    input_file.write_text("\n".join([f"{k} {t}", *dnas]) + "\n")
+    runner = CliRunner()
+
+    missing_result = runner.invoke(cli, ["ba2g", str(input_file)])
+    result = runner.invoke(cli, ["ba2g", "--num-iterations", num_iterations, str(input_file)])
+
+    assert missing_result.exit_code == 2
+    assert "--num-iterations" in missing_result.output
+    assert result.exit_code == 0
+    assert result.output.rstrip().split('\n') == ['TCTCGGGG', 'CCAAGGTG', 'TACAGGCG', 'TTCAGGTG', 'TCCACGTG']
+
+
 def test_ba2h():
     runner = CliRunner()
     result = runner.invoke(cli, ["ba2h", "tests/datasets/ch02/ba2h_sample_dataset.txt"])
@@ -135,3 +284,259 @@ def test_ba2h():
     actual_distance = result.output.rstrip()
 
     assert actual_distance == expected_distance
+
+
+def test_ba2b_checkpoint(tmp_path):
+    checkpoint = str(tmp_path / "checkpoint.json")
+    runner = CliRunner()
+    result = runner.invoke(cli, ["ba2b", "--checkpoint", checkpoint, "tests/datasets/ch02/ba2b_sample_dataset.txt"])
+
+    assert result.exit_code == 0
+    assert result.output.rstrip() == 'ACG'
+
+    result = runner.invoke(
+        cli, ["ba2b", "--checkpoint", checkpoint, "--resume", "tests/datasets/ch02/ba2b_sample_dataset.txt"]
+    )
+
+    assert result.exit_code == 0
+    assert result.output.rstrip() == 'ACG'
+
+
+def test_ba2a_resume_without_checkpoint():
+    runner = CliRunner()
+    result = runner.invoke(cli, ["ba2a", "--resume", "tests/datasets/ch02/ba2a_sample_dataset.txt"])
+
+    assert result.exit_code != 0
+
+
+def test_ba1d_sequence_file():
+    runner = CliRunner()
+    result = runner.invoke(
+        cli,
+        [
+            "ba1d",
+            "--sequence-file",
+            "tests/datasets/ch01/ba1d_sample_reads.fastq",
+            "tests/datasets/ch01/ba1d_sample_pattern.txt",
+        ],
+    )
+
+    assert result.exit_code == 0
+    assert result.output.rstrip() == "1 3 10"
+
+
+@pytest.mark.parametrize(
+    "args, output",
+    [
+        (["kmer-spectrum"], "2\t2"),
+        (["ba1b"], "ACG CGT"),
+        (["ba1b", "--num-workers", "2"], "ACG CGT"),
+        (["ba1b", "--max-kmer-length", "4"], "3: ACG CGT\n4: ACGT"),
+    ],
+)
+@pytest.mark.parametrize("two_bit", [False, True])
+def test_sequence_file_records_are_counted_separately(tmp_path, args, output, two_bit):
+    sequence_file = tmp_path / "records.fa"
+    sequence_file.write_text(">a\nACGT\n>b\nacgt\n")
+    input_file = tmp_path / "k.txt"
+    input_file.write_text("3\n")
+    runner = CliRunner()
+    if two_bit:
+        runner.invoke(cli, ["two-bit", str(sequence_file), str(tmp_path / "records.2bit")])
+        sequence_file = tmp_path / "records.2bit"
+    result = runner.invoke(cli, [*args, "--sequence-file", str(sequence_file), str(input_file)])
+
+    assert result.exit_code == 0
+    assert result.output.rstrip() == output
+
+
+def test_ba2b_sequence_file():
+    runner = CliRunner()
+    result = runner.invoke(
+        cli,
+        [
+            "ba2b",
+            "--sequence-file",
+            "tests/datasets/ch02/ba2b_sample_sequences.fasta",
+            "tests/datasets/ch02/ba2b_sample_k.txt",
+        ],
+    )
+
+    assert result.exit_code == 0
+    assert result.output.rstrip() == 'ACG'
+
+
+def test_two_bit(tmp_path):
+    two_bit_file = str(tmp_path / "reads.2bit")
+    runner = CliRunner()
+    result = runner.invoke(cli, ["two-bit", "tests/datasets/ch02/ba2b_sample_sequences.fasta", two_bit_file])
+
+    assert result.exit_code == 0
+
+    result = runner.invoke(
+        cli, ["ba2b", "--sequence-file", two_bit_file, "tests/datasets/ch02/ba2b_sample_k.txt"]
+    )
+
+    assert result.exit_code == 0
+    assert result.output.rstrip() == 'ACG'
+
+
+def test_two_bit_ba1d(tmp_path):
+    two_bit_file = str(tmp_path / "reads.2bit")
+    runner = CliRunner()
+    runner.invoke(cli, ["two-bit", "tests/datasets/ch01/ba1d_sample_reads.fastq", two_bit_file])
+    result = runner.invoke(
+        cli, ["ba1d", "--sequence-file", two_bit_file, "tests/datasets/ch01/ba1d_sample_pattern.txt"]
+    )
+
+    assert result.exit_code == 0
+    assert result.output.rstrip() == "1 3 10"
+
+
+def test_two_bit_invalid_sequence(tmp_path):
+    sequence_file = tmp_path / "reads.fasta"
+    sequence_file.write_text(">read1\nACGTRY\n")
+    runner = CliRunner()
+    result = runner.invoke(cli, ["two-bit", str(sequence_file), str(tmp_path / "reads.2bit")])
+
+    assert result.exit_code != 0
+    assert "other than A, C, G, T, and N" in result.output
+
+
+def test_ba1d_compressed_inputs(tmp_path):
+    input_file = tmp_path / "ba1d_sample_pattern.txt.gz"
+    sequence_file = tmp_path / "ba1d_sample_reads.fastq.xz"
+    with open("tests/datasets/ch01/ba1d_sample_pattern.txt", "rb") as f:
+        input_file.write_bytes(gzip.compress(f.read()))
+    with open("tests/datasets/ch01/ba1d_sample_reads.fastq", "rb") as f:
+        sequence_file.write_bytes(lzma.compress(f.read()))
+
+    runner = CliRunner()
+    result = runner.invoke(cli, ["ba1d", "--sequence-file", str(sequence_file), str(input_file)])
+
+    assert result.exit_code == 0
+    assert result.output.rstrip() == "1 3 10"
+
+
+def test_ba1d_truncated_input(tmp_path):
+    input_file = tmp_path / "ba1d_sample_dataset.txt.gz"
+    with open("tests/datasets/ch01/ba1d_sample_dataset.txt", "rb") as f:
+        input_file.write_bytes(gzip.compress(f.read())[:20])
+
+    runner = CliRunner()
+    result = runner.invoke(cli, ["ba1d", str(input_file)])
+
+    assert result.exit_code != 0
+    assert "ba1d_sample_dataset.txt.gz" in result.output
+    assert "truncated or corrupt" in result.output
+
+
+def test_output(tmp_path):
+    output_file = tmp_path / "ba1d_output.txt"
+    runner = CliRunner()
+    result = runner.invoke(cli, ["--output", str(output_file), "ba1d", "tests/datasets/ch01/ba1d_sample_dataset.txt"])
+
+    assert result.exit_code == 0
+    assert result.output == ""
+    assert output_file.read_text() == "1 3 9\n"
+
+
+def test_pipe_input():
+    with open("tests/datasets/ch01/ba1d_sample_dataset.txt", "rb") as f:
+        dataset = gzip.compress(f.read())
+
+    result = subprocess.run(
+        [sys.executable, "-c", "from bioinformatics_textbook.cli import cli; cli()", "ba1d", "-"],
+        input=dataset,
+        capture_output=True,
+        check=True,
+    )
+
+    assert result.stdout.decode().rstrip() == "1 3 9"
+
+
+@pytest.mark.parametrize("num_workers", ["1", "2"])
+def test_batch(tmp_path, num_workers):
+    manifest = tmp_path / "manifest.txt"
+    manifest.write_text(
+        f'{{"command": "ba1d", "input": "tests/datasets/ch01/ba1d_sample_dataset.txt", "output": "{tmp_path}/ba1d.out"}}\n'
+        f"ba1d\t{tmp_path}/missing.txt\t{tmp_path}/missing.out\n"
+        f"ba2b\ttests/datasets/ch02/ba2b_sample_dataset.txt\t{tmp_path}/ba2b.out\t--num-workers\t1\n"
+    )
+    runner = CliRunner()
+    result = runner.invoke(cli, ["batch", "--num-workers", num_workers, str(manifest)])
+
+    assert result.exit_code == 1
+    assert [line.split("\t")[:2] for line in result.output.splitlines()] == [["1", "ok"], ["2", "failed"], ["3", "ok"]]
+    assert (tmp_path / "ba1d.out").read_text() == "1 3 9\n"
+    assert (tmp_path / "ba2b.out").read_text() == "ACG\n"
+
+
+# prints the modules imported by the CLI while it runs the command given as arguments
+IMPORT_BUDGET_SCRIPT = """
+import sys
+before = set(sys.modules)
+from bioinformatics_textbook.cli import cli
+try:
+    cli()
+except SystemExit:
+    pass
+print(*sorted(set(sys.modules) - before), sep="\\n", file=sys.stderr)
+"""
+
+
+@pytest.mark.parametrize(
+    "args, max_imported_modules",
+    [
+        (["--help"], 100),
+        (["ba1c", "tests/datasets/ch01/ba1c_sample_dataset.txt"], 110),
+    ],
+)
+def test_import_budget(args, max_imported_modules):
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORT_BUDGET_SCRIPT, *args], capture_output=True, check=True
+    )
+    imported_modules = result.stderr.decode().split()
+
+    assert "numpy" not in imported_modules
+    assert "bioinformatics_textbook.ch02" not in imported_modules
+    assert "bioinformatics_textbook.two_bit" not in imported_modules
+    assert "bioinformatics_textbook.ch01.frequent_words" not in imported_modules
+    assert "bioinformatics_textbook.ch01.partitioned_counting" not in imported_modules
+    assert "bioinformatics_textbook.ch01.external_counting" not in imported_modules
+    assert "multiprocessing" not in imported_modules
+    assert "concurrent.futures" not in imported_modules
+    assert len(imported_modules) <= max_imported_modules
+
+
+def test_query_without_address():
+    runner = CliRunner()
+    result = runner.invoke(cli, ["query", "ba1d", "ATAT"])
+
+    assert result.exit_code == 2
+    assert "Exactly one of --socket and --port is required." in result.output
+
+
+def test_serve_and_query(tmp_path):
+    genome_file = tmp_path / "genome.fa"
+    genome_file.write_text(">chr1\nGATATATGCATATACTT\n")
+    socket_path = tmp_path / "server.sock"
+    command = [sys.executable, "-c", "from bioinformatics_textbook.cli import cli; cli()"]
+
+    server = subprocess.Popen([*command, "serve", str(genome_file), "--socket", str(socket_path), "-j", "2"])
+    try:
+        for _ in range(100):
+            if socket_path.exists():
+                break
+            time.sleep(0.1)
+
+        result = subprocess.run(
+            [*command, "query", "ba1d", "ATAT", "--socket", str(socket_path)], capture_output=True, check=True
+        )
+    finally:
+        server.send_signal(signal.SIGINT)
+        server.wait(timeout=10)
+
+    assert result.stdout.decode().rstrip() == "1 3 9"
+    assert server.returncode == 0
+    assert not socket_path.exists()
@@ -0,0 +1,110 @@
+from dataclasses import dataclass
+import bz2
+import gzip
+import io
+import lzma
+import struct
+import zlib
+
+import click
+import pytest
+
+from bioinformatics_textbook.compression import BGZFReader, detect_compression, open_input
+from bioinformatics_textbook.inout import LineIndex, read_first_line, read_last_line, read_sequence_records
+
+
+def compress_bgzf(data: bytes, block_size: int) -> bytes:
+    """Compress data into BGZF blocks of block_size uncompressed bytes, followed by the empty end-of-file block"""
+    blocks = []
+    for start in range(0, len(data), block_size):
+        blocks.append(data[start: start + block_size])
+    blocks.append(b"")
+
+    compressed = []
+    for block in blocks:
+        compressor = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+        deflated = compressor.compress(block) + compressor.flush()
+        header = struct.pack("<2sBBIBBH2sHH", b"\x1f\x8b", 8, 4, 0, 0, 255, 6, b"BC", 2, 25 + len(deflated))
+        compressed.append(header + deflated + struct.pack("<II", zlib.crc32(block), len(block)))
+
+    return b"".join(compressed)
+
+
+@pytest.fixture
+def sample_compression():
+    @dataclass
+    class Sample:
+        data = b"".join(b"@read%d\nGATATATGCATATACTT\n+\nIIIIIIIIIIIIIIIII\n" % i for i in range(200))
+        compressed = {
+            "gzip": gzip.compress(data),
+            "bz2": bz2.compress(data),
+            "xz": lzma.compress(data),
+            "bgzf": compress_bgzf(data, block_size=1000),
+        }
+
+    yield Sample()
+
+
+def test_detect_compression(sample_compression):
+    for compression, compressed in sample_compression.compressed.items():
+        assert detect_compression(compressed[:14]) == compression
+
+    assert detect_compression(sample_compression.data[:14]) is None
+
+
+@pytest.mark.parametrize("compression", ["gzip", "bz2", "xz", "bgzf"])
+def test_open_input(sample_compression, compression):
+    with open_input(io.BytesIO(sample_compression.compressed[compression])) as reader:
+        assert reader.read(5) == sample_compression.data[:5]
+        assert reader.read() == sample_compression.data[5:]
+
+
+def test_open_uncompressed_input(sample_compression):
+    input_file = io.BytesIO(sample_compression.data)
+
+    assert open_input(input_file) is input_file
+    assert input_file.tell() == 0
+
+
+@pytest.mark.parametrize("num_threads", [1, 4])
+def test_bgzf_reader(sample_compression, num_threads):
+    with BGZFReader(io.BytesIO(sample_compression.compressed["bgzf"]), num_threads=num_threads) as reader:
+        chunks = []
+        buffer = bytearray(333)
+        size = reader.readinto(buffer)
+        while size:
+            chunks.append(bytes(buffer[:size]))
+            size = reader.readinto(buffer)
+
+    assert b"".join(chunks) == sample_compression.data
+
+
+def test_bgzf_reader_corrupt_block(sample_compression):
+    compressed = bytearray(sample_compression.compressed["bgzf"])
+    compressed[30] ^= 0xFF
+
+    with pytest.raises((ValueError, zlib.error)):
+        with BGZFReader(io.BytesIO(bytes(compressed))) as reader:
+            reader.readall()
+
+
+@pytest.mark.parametrize("compression", ["gzip", "bz2", "xz", "bgzf"])
+def test_open_truncated_input(sample_compression, compression):
+    input_file = io.BytesIO(sample_compression.compressed[compression][:40])
+    input_file.name = "reads.fastq.gz"
+
+    with pytest.raises(click.FileError, match="truncated or corrupt") as error:
+        with open_input(input_file) as reader:
+            reader.read()
+
+    assert error.value.filename == "reads.fastq.gz"
+
+
+@pytest.mark.parametrize("compression", ["gzip", "bgzf"])
+def test_read_compressed_inputs(sample_compression, compression):
+    compressed = sample_compression.compressed[compression]
+
+    assert len(LineIndex(io.BytesIO(compressed))) == 800
+    assert read_first_line(io.BytesIO(compressed)) == "@read0"
+    assert read_last_line(io.BytesIO(compressed)) == "I" * 17
+    assert len(list(read_sequence_records(io.BytesIO(compressed)))) == 200
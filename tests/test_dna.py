@@ -45,3 +45,56 @@ def test_generate_all_possible_kmers(sample_all_possible_kmers):
     actual_kmers = list(DNA.generate_all_possible_kmers(kmer_length=sample_all_possible_kmers.k))
 
     assert actual_kmers == expected_kmers
+
+
+@pytest.fixture
+def sample_kmer_numbers():
+    @dataclass
+    class SampleKmerNumbers:
+        pattern = 'AGT'
+        number = 11
+        seq = 'AGTCA'
+        numbers = [11, 45, 52]
+
+    return SampleKmerNumbers
+
+
+def test_pattern_to_number(sample_kmer_numbers):
+    actual_number = DNA.pattern_to_number(sample_kmer_numbers.pattern)
+
+    assert actual_number == sample_kmer_numbers.number
+
+
+def test_number_to_pattern(sample_kmer_numbers):
+    actual_pattern = DNA.number_to_pattern(sample_kmer_numbers.number, kmer_length=len(sample_kmer_numbers.pattern))
+
+    assert actual_pattern == sample_kmer_numbers.pattern
+
+
+def test_generate_kmer_numbers(sample_kmer_numbers):
+    actual_numbers = list(DNA.generate_kmer_numbers(sample_kmer_numbers.seq.encode(), kmer_length=3))
+
+    assert actual_numbers == sample_kmer_numbers.numbers
+
+
+@pytest.mark.parametrize("seq", ["AGTCA", b"agtca", "AGNTCA", "AGTNCA"])
+def test_generate_kmer_numbers_skips_invalid_windows(seq):
+    expected_numbers = {"AGTCA": [11, 45, 52], b"agtca": [11, 45, 52], "AGNTCA": [52], "AGTNCA": [11]}[seq]
+
+    actual_numbers = list(DNA.generate_kmer_numbers(seq, kmer_length=3))
+
+    assert actual_numbers == expected_numbers
+
+
+def test_generate_d_neighborhood_numbers(sample_kmer_numbers):
+    expected_neighborhood = set(DNA(sample_kmer_numbers.pattern).generate_d_neighborhood(num_allowed_mismatches=2))
+
+    actual_neighborhood = [
+        DNA.number_to_pattern(number, kmer_length=len(sample_kmer_numbers.pattern))
+        for number in DNA.generate_d_neighborhood_numbers(
+            sample_kmer_numbers.number, kmer_length=len(sample_kmer_numbers.pattern), num_allowed_mismatches=2
+        )
+    ]
+
+    assert len(actual_neighborhood) == len(expected_neighborhood)
+    assert set(actual_neighborhood) == expected_neighborhood
@@ -0,0 +1,72 @@
+from dataclasses import dataclass
+import io
+import pickle
+
+import pytest
+
+from bioinformatics_textbook.dna_collection import DNACollection
+from bioinformatics_textbook.two_bit import TwoBitFile, write_two_bit
+
+
+@pytest.fixture
+def sample_dna_collection():
+    @dataclass
+    class SampleDNACollection:
+        dnas = ['ACG', '', 'TTAC']
+        lengths = [3, 0, 4]
+        kmer_length = 2
+        windows = [[0, 1], [1, 2], [3, 3], [3, 0], [0, 1]]
+        sequence_indices = [0, 0, 2, 2, 2]
+
+    yield SampleDNACollection()
+
+
+def test_dna_collection_sequences(sample_dna_collection):
+    collection = DNACollection.from_sequences(sample_dna_collection.dnas)
+
+    assert len(collection) == len(sample_dna_collection.dnas)
+    assert list(collection) == sample_dna_collection.dnas
+    assert collection[-1] == sample_dna_collection.dnas[-1]
+    assert [bytes(view).decode() for view in collection.views()] == sample_dna_collection.dnas
+    assert collection.lengths.tolist() == sample_dna_collection.lengths
+
+
+def test_dna_collection_index_error(sample_dna_collection):
+    collection = DNACollection.from_sequences(sample_dna_collection.dnas)
+
+    with pytest.raises(IndexError):
+        collection.view(len(sample_dna_collection.dnas))
+
+
+def test_dna_collection_windows(sample_dna_collection):
+    collection = DNACollection.from_sequences(sample_dna_collection.dnas)
+
+    windows, sequence_indices = collection.windows(sample_dna_collection.kmer_length)
+
+    assert windows.tolist() == sample_dna_collection.windows
+    assert sequence_indices.tolist() == sample_dna_collection.sequence_indices
+
+
+def test_dna_collection_pickle(sample_dna_collection):
+    collection = DNACollection.from_sequences(sample_dna_collection.dnas)
+    collection.encode()
+
+    actual_collection = pickle.loads(pickle.dumps(collection))
+
+    assert list(actual_collection) == sample_dna_collection.dnas
+    assert actual_collection._codes is None
+
+
+def test_dna_collection_from_two_bit():
+    dnas = ['ACG', '', 'TNNAC']
+    output_file = io.BytesIO()
+    write_two_bit([(str(i), dna.encode()) for i, dna in enumerate(dnas)], output_file)
+
+    collection = DNACollection.from_two_bit(TwoBitFile(output_file.getvalue()))
+    expected_collection = DNACollection.from_sequences(dnas)
+
+    assert collection._buffer is None
+    assert collection.offsets.tolist() == expected_collection.offsets.tolist()
+    assert collection.encode().tolist() == expected_collection.encode().tolist()
+    assert list(pickle.loads(pickle.dumps(collection))) == dnas
+    assert collection.fingerprint() == expected_collection.fingerprint()
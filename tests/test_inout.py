@@ -0,0 +1,150 @@
+from dataclasses import dataclass
+import io
+
+import pytest
+
+import bioinformatics_textbook.inout
+from bioinformatics_textbook.inout import (
+    LineIndex, RosalindAnswer, SequenceRecord, iterate_lines, read_sequence_records, write_answer
+)
+
+
+@pytest.fixture
+def sample_fasta():
+    @dataclass
+    class Sample:
+        data = b">seq1 first record\r\nACGT\r\nAC\r\n\r\n>seq2\nGGTT\n>empty\n"
+        records = [
+            SequenceRecord(name="seq1 first record", sequence=b"ACGTAC"),
+            SequenceRecord(name="seq2", sequence=b"GGTT"),
+            SequenceRecord(name="empty", sequence=b""),
+        ]
+
+    yield Sample()
+
+
+@pytest.fixture
+def sample_fastq():
+    @dataclass
+    class Sample:
+        data = b"@read1\nACGT\n+\nIIII\n@read2\nGG\n+read2\n#I"
+        records = [
+            SequenceRecord(name="read1", sequence=b"ACGT", quality=b"IIII"),
+            SequenceRecord(name="read2", sequence=b"GG", quality=b"#I"),
+        ]
+
+    yield Sample()
+
+
+@pytest.mark.parametrize("buffer_size", [1, 3, 1 << 20])
+def test_iterate_lines(buffer_size):
+    lines = [bytes(line) for line in iterate_lines(io.BytesIO(b"AC\r\nGT\n\nT"), buffer_size=buffer_size)]
+
+    assert lines == [b"AC", b"GT", b"", b"T"]
+
+
+@pytest.mark.parametrize("buffer_size", [1, 5, 1 << 20])
+def test_read_fasta_records(sample_fasta, buffer_size):
+    actual_records = list(read_sequence_records(io.BytesIO(sample_fasta.data), buffer_size=buffer_size))
+
+    assert actual_records == sample_fasta.records
+
+
+@pytest.mark.parametrize("buffer_size", [1, 5, 1 << 20])
+def test_read_fastq_records(sample_fastq, buffer_size):
+    actual_records = list(read_sequence_records(io.BytesIO(sample_fastq.data), buffer_size=buffer_size))
+
+    assert actual_records == sample_fastq.records
+
+
+def test_read_malformed_sequence_records():
+    with pytest.raises(ValueError):
+        list(read_sequence_records(io.BytesIO(b"ACGT\n")))
+
+    with pytest.raises(ValueError):
+        list(read_sequence_records(io.BytesIO(b"@read1\nACGT\n+\nII\n")))
+
+
+@pytest.fixture
+def sample_line_index():
+    @dataclass
+    class Sample:
+        data = b"ACGT\r\nGG\n\nTTA\n"
+        lines = [b"ACGT", b"GG", b"", b"TTA"]
+        not_last_lines = b"ACGT\r\nGG\n"
+
+    yield Sample()
+
+
+class NonSeekableStream(io.RawIOBase):
+    """Forward-only stream like a pipe"""
+
+    def __init__(self, data: bytes) -> None:
+        self.data = io.BytesIO(data)
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        return self.data.readinto(buffer)
+
+
+@pytest.mark.parametrize("spool_memory_size", [1, 1 << 26])
+def test_line_index_non_seekable(monkeypatch, sample_line_index, spool_memory_size):
+    monkeypatch.setattr(bioinformatics_textbook.inout, "SEQUENCE_BUFFER_SIZE", 3)
+    monkeypatch.setattr(bioinformatics_textbook.inout, "SPOOL_MEMORY_SIZE", spool_memory_size)
+
+    line_index = LineIndex(io.BufferedReader(NonSeekableStream(sample_line_index.data)))
+
+    assert [line_index.line(i).tobytes() for i in range(len(line_index))] == sample_line_index.lines
+
+
+@pytest.mark.parametrize("mapped", [True, False])
+def test_line_index(sample_line_index, tmp_path, mapped):
+    if mapped:
+        path = tmp_path / "dataset.txt"
+        path.write_bytes(sample_line_index.data)
+        input_file = open(path, "rb")
+    else:
+        input_file = io.BytesIO(sample_line_index.data)
+
+    with input_file:
+        line_index = LineIndex(input_file)
+
+        assert len(line_index) == len(sample_line_index.lines)
+        assert [line_index.line(i).tobytes() for i in range(len(line_index))] == sample_line_index.lines
+        assert line_index.line(-1).tobytes() == sample_line_index.lines[-1]
+        assert line_index.span(0, -1).tobytes() == sample_line_index.not_last_lines
+
+
+def test_line_index_empty_file():
+    line_index = LineIndex(io.BytesIO(b""))
+
+    assert len(line_index) == 0
+    assert line_index.span(0, -1).tobytes() == b""
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 1 << 16])
+def test_rosalind_answer(monkeypatch, chunk_size):
+    monkeypatch.setattr(bioinformatics_textbook.inout, "ANSWER_CHUNK_SIZE", chunk_size)
+    output_file = io.StringIO()
+
+    answer = RosalindAnswer(iter(range(5)), sep=" ")
+    write_answer(answer, output_file)
+
+    assert output_file.getvalue() == "0 1 2 3 4\n"
+    assert len(list(RosalindAnswer(range(5)))) == -(-5 // chunk_size)
+
+
+def test_rosalind_answer_equality():
+    assert RosalindAnswer(["ACG", "TTT"], sep="\n") == "ACG\nTTT"
+    assert RosalindAnswer([]) == ""
+    assert RosalindAnswer([1, 2]) != "1 3"
+
+
+def test_write_answer():
+    output_file = io.StringIO()
+
+    write_answer(42, output_file)
+
+    assert output_file.getvalue() == "42\n"
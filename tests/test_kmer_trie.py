@@ -0,0 +1,50 @@
+from dataclasses import dataclass
+
+import pytest
+
+from bioinformatics_textbook.dna import DNA
+from bioinformatics_textbook.kmer_trie import KmerTrie
+
+
+@pytest.fixture
+def sample_neighborhood_counts():
+    @dataclass
+    class SampleNeighborhoodCounts:
+        dnas = ['ACGA', 'CG']
+        kmer_length = 2
+        num_allowed_mismatches = 1
+        # windows AC, CG (twice) and GA
+        num_nodes = 1 + 3 + 3
+
+    yield SampleNeighborhoodCounts()
+
+
+def test_kmer_trie_nodes(sample_neighborhood_counts):
+    trie = KmerTrie.from_sequences(sample_neighborhood_counts.dnas, kmer_length=sample_neighborhood_counts.kmer_length)
+
+    assert len(trie) == sample_neighborhood_counts.num_nodes
+
+
+def test_generate_neighborhood_counts(sample_neighborhood_counts):
+    kmer_length = sample_neighborhood_counts.kmer_length
+    num_allowed_mismatches = sample_neighborhood_counts.num_allowed_mismatches
+
+    expected_counts = {}
+    for dna in sample_neighborhood_counts.dnas:
+        for kmer in DNA(dna).generate_kmers(kmer_length):
+            for neighbor in kmer.generate_d_neighborhood(num_allowed_mismatches=num_allowed_mismatches):
+                expected_counts[neighbor] = expected_counts.get(neighbor, 0) + 1
+
+    trie = KmerTrie.from_sequences(sample_neighborhood_counts.dnas, kmer_length=kmer_length)
+    actual_counts = [
+        (DNA.number_to_pattern(number, kmer_length), count)
+        for number, count in trie.generate_neighborhood_counts(num_allowed_mismatches=num_allowed_mismatches)
+    ]
+
+    assert actual_counts == sorted(expected_counts.items())
+
+
+def test_generate_neighborhood_counts_short_dna():
+    trie = KmerTrie.from_sequences(['AC'], kmer_length=3)
+
+    assert list(trie.generate_neighborhood_counts(num_allowed_mismatches=1)) == []
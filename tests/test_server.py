@@ -0,0 +1,90 @@
+from dataclasses import dataclass
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from bioinformatics_textbook.server import QueryClient, QueryServer, answer_request, load_genomes
+
+
+@pytest.fixture
+def sample_genomes(tmp_path):
+    @dataclass
+    class Sample:
+        path = tmp_path / "genomes.fa"
+        genomes = {
+            "chr1": "GATATATGCATATACTT",
+            "chr2": "CGCCCGAATCCAGAACGCATTCCCATATTTCGGGACCACTGGCCTCCACGGTACGGACGTCAATCAAAT",
+        }
+
+    sample = Sample()
+    sample.path.write_text("".join(f">{name}\n{sequence}\n" for name, sequence in sample.genomes.items()))
+
+    yield sample
+
+
+def test_load_genomes(sample_genomes):
+    assert load_genomes([str(sample_genomes.path)]) == sample_genomes.genomes
+
+
+def test_load_duplicate_genomes(sample_genomes):
+    with pytest.raises(ValueError, match="chr1"):
+        load_genomes([str(sample_genomes.path), str(sample_genomes.path)])
+
+
+@pytest.mark.parametrize(
+    "request_, answer",
+    [
+        ({"command": "ba1a", "pattern": "ATAT", "genome": "chr1"}, "3"),
+        ({"command": "ba1a", "pattern": "GCG", "text": "GCGCG"}, "2"),
+        ({"command": "ba1d", "pattern": "ATAT", "genome": "chr1"}, "1 3 9"),
+        ({"command": "ba1h", "pattern": "ATTCTGGA", "genome": "chr2", "hamming_dist": 3}, "6 7 26 27"),
+        ({"command": "ba1g", "pattern": "GGGCCGTTGGT", "text": "GGACCGTTGAC"}, "3"),
+        ({"command": "genomes"}, "chr1\nchr2"),
+    ],
+)
+def test_answer_request(sample_genomes, request_, answer):
+    assert answer_request(request_, sample_genomes.genomes) == answer
+
+
+@pytest.mark.parametrize(
+    "request_, error",
+    [
+        ([], "not a JSON object"),
+        ({"command": "ba1b"}, "Unknown command"),
+        ({"command": "ba1d", "genome": "chr1"}, "pattern"),
+        ({"command": "ba1d", "pattern": "ATAT", "genome": "chr3"}, "Unknown genome"),
+        ({"command": "ba1d", "pattern": "ATAT"}, "neither a text nor a genome"),
+        ({"command": "ba1h", "pattern": "ATAT", "genome": "chr1", "hamming_dist": "1"}, "hamming_dist"),
+    ],
+)
+def test_answer_invalid_request(sample_genomes, request_, error):
+    with pytest.raises(ValueError, match=error):
+        answer_request(request_, sample_genomes.genomes)
+
+
+def test_query_server(sample_genomes, tmp_path):
+    socket_path = str(tmp_path / "server.sock")
+    requests = [
+        {"command": "ba1d", "pattern": "ATAT", "genome": "chr1"},
+        {"command": "ba1d", "pattern": "ATAT"},
+        {"command": "ba1h", "pattern": "ATTCTGGA", "genome": "chr2", "hamming_dist": 3},
+    ]
+
+    def query(requests):
+        with QueryClient(socket_path=socket_path) as client:
+            return [client.query(request) for request in requests]
+
+    async def serve_and_query():
+        server = QueryServer(sequence_paths=[str(sample_genomes.path)])
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            async with await server.start(executor, socket_path=socket_path):
+                return await asyncio.get_running_loop().run_in_executor(None, query, requests)
+
+    responses = asyncio.run(serve_and_query())
+
+    assert responses == [
+        {"ok": True, "answer": "1 3 9"},
+        {"ok": False, "error": "Request has neither a text nor a genome, and 2 genomes are loaded."},
+        {"ok": True, "answer": "6 7 26 27"},
+    ]
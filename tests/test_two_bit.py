@@ -0,0 +1,145 @@
+from collections import Counter
+from dataclasses import dataclass
+import gzip
+import io
+
+import numpy as np
+import pytest
+
+from bioinformatics_textbook.dna import DNA
+from bioinformatics_textbook.inout import SequenceRecord, read_sequence_records, read_two_bit_file
+from bioinformatics_textbook.two_bit import TwoBitFile, pack_sequence, write_two_bit
+
+
+@pytest.fixture
+def sample_two_bit():
+    @dataclass
+    class Sample:
+        records = [
+            ("chr1 first record", b"ACGTNNacgtA"),
+            ("empty", b""),
+            ("gap", b"NNNN"),
+            ("chr2", b"GATTACAT"),
+        ]
+        sequences = [b"ACGTNNACGTA", b"", b"NNNN", b"GATTACAT"]
+        n_blocks = [[(4, 2)], [], [(0, 4)], []]
+        codes = [0, 1, 2, 3, 0, 0, 0, 1, 2, 3, 0]
+
+    yield Sample()
+
+
+def test_pack_sequence():
+    packed, n_starts, n_lengths = pack_sequence(b"ACGTNA")
+
+    assert packed == bytes([0b00011011, 0b00000000])
+    assert n_starts.tolist() == [4]
+    assert n_lengths.tolist() == [1]
+
+
+def test_pack_invalid_sequence():
+    with pytest.raises(ValueError):
+        pack_sequence(b"ACGTR")
+
+
+@pytest.mark.parametrize("mapped", [True, False])
+def test_two_bit_file(sample_two_bit, tmp_path, mapped):
+    path = tmp_path / "genome.2bit"
+    with open(path, "wb") as output_file:
+        assert write_two_bit(sample_two_bit.records, output_file) == len(sample_two_bit.records)
+
+    with open(path, "rb") if mapped else io.BytesIO(path.read_bytes()) as input_file:
+        two_bit = TwoBitFile.from_file(input_file)
+
+        assert len(two_bit) == len(sample_two_bit.records)
+        assert two_bit.names == [name for name, _ in sample_two_bit.records]
+        assert two_bit.lengths.tolist() == [len(sequence) for sequence in sample_two_bit.sequences]
+        assert [two_bit.sequence(i) for i in range(len(two_bit))] == sample_two_bit.sequences
+        assert [two_bit.n_blocks(i) for i in range(len(two_bit))] == sample_two_bit.n_blocks
+        assert np.array_equal(two_bit.codes(0), sample_two_bit.codes)
+
+
+def test_two_bit_file_random_records():
+    rng = np.random.default_rng(0)
+    records = [
+        (str(i), np.frombuffer(b"ACGTN", dtype=np.uint8)[rng.integers(5, size=rng.integers(50))].tobytes())
+        for i in range(100)
+    ]
+    output_file = io.BytesIO()
+    write_two_bit(records, output_file)
+
+    assert list(TwoBitFile(output_file.getvalue()).records()) == records
+
+
+def test_two_bit_masked_codes(sample_two_bit):
+    output_file = io.BytesIO()
+    write_two_bit(sample_two_bit.records, output_file)
+    two_bit = TwoBitFile(output_file.getvalue())
+
+    assert two_bit.masked_codes(0).tolist() == [0, 1, 2, 3, 255, 255, 0, 1, 2, 3, 0]
+    assert two_bit.masked_codes(2).tolist() == [255] * 4
+
+
+@pytest.mark.parametrize("kmer_length", [1, 3, 32])
+def test_two_bit_kmer_numbers(kmer_length):
+    rng = np.random.default_rng(0)
+    nucleotides = np.frombuffer(b"ACGTN", dtype=np.uint8)
+    records = [
+        (str(i), nucleotides[rng.choice(5, size=rng.integers(80), p=[0.24] * 4 + [0.04])].tobytes())
+        for i in range(100)
+    ]
+    output_file = io.BytesIO()
+    write_two_bit(records, output_file)
+    two_bit = TwoBitFile(output_file.getvalue())
+
+    for i, (_, sequence) in enumerate(records):
+        assert two_bit.kmer_numbers(i, kmer_length).tolist() == list(DNA.generate_kmer_numbers(sequence, kmer_length))
+
+    numbers, counts = two_bit.count_kmers(kmer_length)
+    expected_numbers = [
+        number for _, sequence in records for number in DNA.generate_kmer_numbers(sequence, kmer_length)
+    ]
+
+    assert dict(zip(numbers.tolist(), counts.tolist())) == dict(sorted(Counter(expected_numbers).items()))
+
+
+def test_two_bit_kmer_numbers_invalid_kmer_length(sample_two_bit):
+    output_file = io.BytesIO()
+    write_two_bit(sample_two_bit.records, output_file)
+
+    with pytest.raises(ValueError):
+        TwoBitFile(output_file.getvalue()).kmer_numbers(0, 33)
+
+
+def test_invalid_two_bit_file():
+    with pytest.raises(ValueError):
+        TwoBitFile(b"2BIT" + bytes(28))
+
+
+def test_read_two_bit_sequence_records(sample_two_bit):
+    output_file = io.BytesIO()
+    write_two_bit(sample_two_bit.records, output_file)
+
+    records = list(read_sequence_records(io.BytesIO(output_file.getvalue())))
+
+    assert records == [
+        SequenceRecord(name=name, sequence=sequence)
+        for (name, _), sequence in zip(sample_two_bit.records, sample_two_bit.sequences)
+    ]
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_read_two_bit_file(sample_two_bit, compress):
+    output_file = io.BytesIO()
+    write_two_bit(sample_two_bit.records, output_file)
+    data = gzip.compress(output_file.getvalue()) if compress else output_file.getvalue()
+
+    two_bit = read_two_bit_file(io.BytesIO(data))
+
+    assert [two_bit.sequence(i) for i in range(len(two_bit))] == sample_two_bit.sequences
+
+
+def test_read_two_bit_file_of_fasta_file():
+    input_file = io.BytesIO(b">seq1\nACGT\n")
+
+    assert read_two_bit_file(input_file) is None
+    assert list(read_sequence_records(input_file)) == [SequenceRecord(name="seq1", sequence=b"ACGT")]